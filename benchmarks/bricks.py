@@ -0,0 +1,23 @@
+from brickastley import BlockBrick, Brick, register
+
+
+@register
+class BenchLink(Brick):
+    href: str
+    label: str
+
+
+@register
+class BenchBadge(Brick):
+    status: str
+
+
+@register
+class BenchButton(Brick):
+    label: str
+    variant: str = "primary"
+
+
+@register
+class BenchCard(BlockBrick):
+    title: str
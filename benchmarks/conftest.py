@@ -0,0 +1,33 @@
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def bench_bricks():
+    """Register the benchmark bricks as template tags once per session."""
+    from brickastley.templatetags.brickastley import register_brick_tags
+
+    from . import bricks  # noqa: F401 - registers the bricks
+
+    register_brick_tags()
+
+
+@pytest.fixture
+def django_engine():
+    """The configured Django template engine."""
+    from django.template import engines
+
+    return engines["django"]
+
+
+@pytest.fixture
+def rows():
+    """Rows for a listing page with 5,000 entries."""
+    return [
+        {
+            "id": i,
+            "name": f"Item {i}",
+            "url": f"/items/{i}/",
+            "status": "active" if i % 3 else "archived",
+        }
+        for i in range(5000)
+    ]
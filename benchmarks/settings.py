@@ -0,0 +1,12 @@
+"""
+Django settings for the brickastley benchmark suite.
+"""
+
+from pathlib import Path
+
+from tests.settings import *  # noqa: F401,F403
+from tests.settings import TEMPLATES
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+
+TEMPLATES[0]["DIRS"] = [BENCHMARKS_DIR / "templates"]
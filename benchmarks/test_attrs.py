@@ -0,0 +1,70 @@
+"""
+Benchmarks for the attrs filter.
+
+The ``flatatt`` variants reproduce the previous implementation, which built a
+converted dict and rendered it with ``django.forms.utils.flatatt``.
+"""
+
+import pytest
+from django.forms.utils import flatatt
+from django.utils.safestring import mark_safe
+
+from brickastley.templatetags.brickastley import attrs
+
+EXTRA = {
+    "id": "submit",
+    "data_id": 42,
+    "aria_label": "Submit the form",
+    "disabled": True,
+    "hidden": False,
+    "title": None,
+}
+
+EXTRA_SAFE = {
+    "data_url": mark_safe("/items/?page=2&sort=name"),
+    "data_target": mark_safe("#modal"),
+    "aria_controls": mark_safe("modal"),
+}
+
+
+def attrs_flatatt(value):
+    if not value:
+        return ""
+    converted = {}
+    for key, val in value.items():
+        if val is False or val is None:
+            continue
+        html_key = key.replace("_", "-")
+        if val is True:
+            converted[html_key] = html_key
+        else:
+            converted[html_key] = val
+    return mark_safe(flatatt(converted))
+
+
+@pytest.mark.benchmark(group="attrs")
+def test_attrs_filter(benchmark):
+    result = benchmark(attrs, EXTRA)
+    assert result == attrs_flatatt(EXTRA)
+
+
+@pytest.mark.benchmark(group="attrs")
+def test_attrs_flatatt(benchmark):
+    result = benchmark(attrs_flatatt, EXTRA)
+    assert 'data-id="42"' in result
+
+
+@pytest.mark.benchmark(group="attrs-safe")
+def test_attrs_filter_safe(benchmark):
+    result = benchmark(attrs, EXTRA_SAFE)
+    assert result == attrs_flatatt(EXTRA_SAFE)
+
+
+@pytest.mark.benchmark(group="attrs-safe")
+def test_attrs_flatatt_safe(benchmark):
+    benchmark(attrs_flatatt, EXTRA_SAFE)
+
+
+@pytest.mark.benchmark(group="attrs-empty")
+def test_attrs_filter_empty(benchmark):
+    benchmark(attrs, {})
@@ -0,0 +1,94 @@
+"""
+Benchmarks for kwarg parsing and validation.
+"""
+
+import pytest
+from django.template import engines
+from django.template.base import Parser
+
+from brickastley import Brick
+from brickastley.brick import _validate_type
+from brickastley.templatetags.brickastley import parse_tag_kwargs
+
+
+class ValidatedBrick(Brick):
+    label: str
+    count: int = 0
+    subtitle: str | None = None
+    value: str | int = ""
+
+
+KWARGS = {"label": "Save", "count": 3, "subtitle": None, "value": 7}
+
+TAG_BITS = [
+    'label="Save"',
+    "count=3",
+    "price=9.99",
+    "active=True",
+    "subtitle=None",
+    "title=object.title|upper",
+]
+
+
+@pytest.fixture
+def parser():
+    engine = engines["django"]
+    return Parser([], engine.engine.template_libraries, engine.engine.template_builtins)
+
+
+@pytest.mark.benchmark(group="validation")
+def test_validate_type(benchmark):
+    hints = ValidatedBrick.__brick_kwargs__
+
+    def validate_all():
+        for name, value in KWARGS.items():
+            _validate_type(value, hints[name], name, "ValidatedBrick")
+
+    benchmark(validate_all)
+
+
+@pytest.mark.benchmark(group="validation")
+def test_compiled_validators(benchmark):
+    validators = ValidatedBrick.__brick_validators__
+
+    def validate_all():
+        for name, value in KWARGS.items():
+            validators[name](value)
+
+    benchmark(validate_all)
+
+
+@pytest.mark.benchmark(group="validation")
+def test_brick_instantiation(benchmark):
+    benchmark(lambda: ValidatedBrick(**KWARGS))
+
+
+@pytest.mark.benchmark(group="validation")
+def test_brick_instantiation_validation_off(benchmark, settings):
+    settings.BRICKASTLEY_VALIDATION = "off"
+    benchmark(lambda: ValidatedBrick(**KWARGS))
+
+
+class ListBrick(Brick):
+    items: list[int]
+
+
+ITEMS = list(range(10_000))
+
+
+@pytest.mark.benchmark(group="validation-list-10000")
+@pytest.mark.parametrize("strategy", ["first", "sample", "full", "cached"])
+def test_list_validation(benchmark, settings, strategy):
+    settings.BRICKASTLEY_VALIDATION = "strict"
+    settings.BRICKASTLEY_CONTAINER_VALIDATION = strategy
+    benchmark(lambda: ListBrick(items=ITEMS))
+
+
+@pytest.mark.benchmark(group="parse")
+def test_parse_tag_kwargs(benchmark, parser):
+    benchmark(parse_tag_kwargs, parser, TAG_BITS)
+
+
+@pytest.mark.benchmark(group="parse")
+def test_parse_tag_kwargs_typed(benchmark, parser):
+    benchmark(parse_tag_kwargs, parser, TAG_BITS + ['count="3"'], ValidatedBrick)
@@ -0,0 +1,150 @@
+"""
+Render-time benchmarks for bricks under realistic page shapes.
+
+Each group pairs a brick variant with a baseline built from plain Django
+templates, so the overhead of the brick layer can be read off directly.
+"""
+
+import pytest
+from django.template import Context
+
+from brickastley.templatetags.brickastley import BlockBrickNode, BrickNode
+
+TABLE_BRICKS = (
+    "{% load brickastley %}<table>{% for row in rows %}<tr>"
+    "<td>{% bench_link href=row.url label=row.name %}</td>"
+    "<td>{% bench_badge status=row.status %}</td>"
+    '<td>{% bench_button label="Edit" data_id=row.id %}</td>'
+    "</tr>{% endfor %}</table>"
+)
+
+TABLE_INCLUDES = (
+    "<table>{% for row in rows %}<tr>"
+    '<td>{% include "includes/link.html" with href=row.url label=row.name %}</td>'
+    '<td>{% include "includes/badge.html" with status=row.status %}</td>'
+    '<td>{% include "includes/button.html" with label="Edit" data_id=row.id %}</td>'
+    "</tr>{% endfor %}</table>"
+)
+
+LIST_LOOP = (
+    "{% load brickastley %}{% for row in rows %}"
+    "{% bench_link href=row.url label=row.name %}{% endfor %}"
+)
+
+LIST_BATCH = (
+    "{% load brickastley %}"
+    "{% bricks_for row in rows bench_link href=row.url label=row.name %}"
+)
+
+NESTING_DEPTH = 10
+
+NESTED_BRICKS = (
+    "{% load brickastley %}"
+    + '{% bench_card title="Level" %}' * NESTING_DEPTH
+    + "<p>Innermost</p>"
+    + "{% endbench_card %}" * NESTING_DEPTH
+)
+
+NESTED_PLAIN = (
+    '<div class="card"><h2>{{ title }}</h2><div class="card-body">' * NESTING_DEPTH
+    + "<p>Innermost</p>"
+    + "</div></div>" * NESTING_DEPTH
+)
+
+
+def _first_node(template, node_class):
+    """Find the first node of the given class in a backend template."""
+    return template.template.nodelist.get_nodes_by_type(node_class)[0]
+
+
+@pytest.mark.benchmark(group="table-5000x3")
+def test_table_bricks(benchmark, django_engine, rows):
+    template = django_engine.from_string(TABLE_BRICKS)
+    result = benchmark(template.render, {"rows": rows})
+    assert result.count("<tr>") == len(rows)
+
+
+@pytest.mark.benchmark(group="table-5000x3")
+def test_table_bricks_inlined(benchmark, django_engine, rows, settings):
+    settings.BRICKASTLEY_INLINE = True
+    template = django_engine.from_string(TABLE_BRICKS)
+    result = benchmark(template.render, {"rows": rows})
+    assert result.count("<tr>") == len(rows)
+
+
+@pytest.mark.benchmark(group="table-5000x3")
+def test_table_includes(benchmark, django_engine, rows):
+    template = django_engine.from_string(TABLE_INCLUDES)
+    result = benchmark(template.render, {"rows": rows})
+    assert result.count("<tr>") == len(rows)
+
+
+@pytest.mark.benchmark(group="list-5000")
+def test_list_for_loop(benchmark, django_engine, rows):
+    template = django_engine.from_string(LIST_LOOP)
+    result = benchmark(template.render, {"rows": rows})
+    assert result.count("<a ") == len(rows)
+
+
+@pytest.mark.benchmark(group="list-5000")
+def test_list_bricks_for(benchmark, django_engine, rows):
+    template = django_engine.from_string(LIST_BATCH)
+    result = benchmark(template.render, {"rows": rows})
+    assert result.count("<a ") == len(rows)
+
+
+@pytest.mark.benchmark(group="nested-card-10")
+def test_nested_bricks(benchmark, django_engine):
+    template = django_engine.from_string(NESTED_BRICKS)
+    result = benchmark(template.render, {})
+    assert result.count('class="card"') == NESTING_DEPTH
+
+
+@pytest.mark.benchmark(group="nested-card-10")
+def test_nested_plain(benchmark, django_engine):
+    template = django_engine.from_string(NESTED_PLAIN)
+    result = benchmark(template.render, {"title": "Level"})
+    assert result.count('class="card"') == NESTING_DEPTH
+
+
+@pytest.mark.benchmark(group="node-render")
+def test_brick_node_render(benchmark, django_engine):
+    template = django_engine.from_string(
+        "{% load brickastley %}{% bench_button label=label data_id=42 %}"
+    )
+    node = _first_node(template, BrickNode)
+    context = Context({"label": "Save"})
+    benchmark(node.render, context)
+
+
+@pytest.mark.benchmark(group="node-render")
+def test_block_brick_node_render(benchmark, django_engine):
+    template = django_engine.from_string(
+        "{% load brickastley %}{% bench_card title=title %}<p>Body</p>{% endbench_card %}"
+    )
+    node = _first_node(template, BlockBrickNode)
+    context = Context({"title": "Card"})
+    benchmark(node.render, context)
+
+
+@pytest.mark.benchmark(group="node-render")
+def test_include_node_render(benchmark, django_engine):
+    from django.template.loader_tags import IncludeNode
+
+    template = django_engine.from_string(
+        '{% include "includes/button.html" with label=label data_id=42 %}'
+    )
+    node = _first_node(template, IncludeNode)
+    context = Context({"label": "Save"})
+    context.template = template.template
+    benchmark(node.render, context)
+
+
+@pytest.mark.benchmark(group="large-parent-context")
+def test_brick_with_large_parent_context(benchmark, django_engine):
+    template = django_engine.from_string(
+        "{% load brickastley %}{% for i in items %}{% bench_badge status=i %}{% endfor %}"
+    )
+    context = {f"var_{i}": i for i in range(500)}
+    context["items"] = ["active"] * 100
+    benchmark(template.render, context)
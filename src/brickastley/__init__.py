@@ -7,11 +7,13 @@ __version__ = "0.1.0"
 default_app_config = "brickastley.apps.BrickAstleyConfig"
 
 from .brick import BlockBrick, Brick, BrickValidationError
+from .cache import BrickCache
 from .registry import register
 
 __all__ = [
     "Brick",
     "BlockBrick",
+    "BrickCache",
     "BrickValidationError",
     "register",
 ]
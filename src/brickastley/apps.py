@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class BrickAstleyConfig(AppConfig):
@@ -7,8 +8,17 @@ class BrickAstleyConfig(AppConfig):
     verbose_name = "Brick Astley"
 
     def ready(self) -> None:
-        from .autodiscover import autodiscover
+        from . import autoreload  # noqa: F401 - connects signal receivers
+        from .autodiscover import autodiscover, autodiscover_lazy
+        from .manifest import load_manifest, register_manifest
         from .templatetags.brickastley import register_brick_tags
 
-        autodiscover()
+        manifest_path = getattr(settings, "BRICKASTLEY_MANIFEST", None)
+        manifest = load_manifest(manifest_path) if manifest_path else None
+        if manifest is not None:
+            register_manifest(manifest)
+        elif getattr(settings, "BRICKASTLEY_LAZY", False):
+            autodiscover_lazy()
+        else:
+            autodiscover()
         register_brick_tags()
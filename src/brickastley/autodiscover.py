@@ -1,6 +1,14 @@
 from __future__ import annotations
 
-from django.utils.module_loading import autodiscover_modules
+import ast
+import importlib
+import importlib.util
+
+from django.apps import apps
+from django.utils.module_loading import autodiscover_modules, module_has_submodule
+
+from .brick import _camel_to_snake
+from .registry import register_lazy
 
 
 def autodiscover() -> None:
@@ -11,3 +19,114 @@ def autodiscover() -> None:
     triggering the @register decorators which populate the brick registry.
     """
     autodiscover_modules("bricks")
+
+
+def _is_register(node: ast.expr) -> bool:
+    """Check if an expression refers to the register decorator."""
+    if isinstance(node, ast.Name):
+        return node.id == "register"
+    return isinstance(node, ast.Attribute) and node.attr == "register"
+
+
+def _literal_str(node: ast.expr) -> str | None:
+    """Get the value of a string literal expression."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+def _class_brick_name(class_def: ast.ClassDef) -> str | None:
+    """
+    Get a brick's name from its brick_name attribute or class name.
+
+    Returns None if brick_name is set to something other than a literal.
+    """
+    for stmt in class_def.body:
+        if isinstance(stmt, ast.Assign):
+            targets, value = stmt.targets, stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            targets, value = [stmt.target], stmt.value
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "brick_name" for t in targets):
+            name = _literal_str(value)
+            if name is None:
+                return None
+            if name:
+                return name
+    return _camel_to_snake(class_def.name)
+
+
+def _decorator_brick_name(decorator: ast.Call, class_def: ast.ClassDef) -> str | None:
+    """Get the name a ``@register(...)`` decorator registers a brick under."""
+    if decorator.args:
+        return None
+    name = ""
+    for keyword in decorator.keywords:
+        if keyword.arg != "name":
+            return None
+        name = _literal_str(keyword.value)
+        if name is None:
+            return None
+    return name or _class_brick_name(class_def)
+
+
+def scan_brick_names(source: str) -> list[str] | None:
+    """
+    Find the names of the bricks a module registers, without importing it.
+
+    Recognizes classes decorated with ``@register`` or ``@register(name=...)``
+    where the name is a string literal. Returns None if the module registers
+    bricks in other ways, such as with a computed name or by calling
+    ``register()`` directly, since the module has to be imported to find
+    them.
+    """
+    tree = ast.parse(source)
+    names = []
+    decorators = set()
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.ClassDef):
+            continue
+        for decorator in node.decorator_list:
+            if _is_register(decorator):
+                name = _class_brick_name(node)
+            elif isinstance(decorator, ast.Call) and _is_register(decorator.func):
+                decorators.add(decorator)
+                name = _decorator_brick_name(decorator, node)
+            else:
+                continue
+            if name is None:
+                return None
+            names.append(name)
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and _is_register(node.func)
+            and node not in decorators
+        ):
+            return None
+    return names
+
+
+def autodiscover_lazy() -> None:
+    """
+    Register the bricks of all installed apps' bricks.py modules lazily.
+
+    The modules are scanned for @register decorators instead of imported, and
+    imported when one of their bricks is first used. Modules that can't be
+    scanned fully, or in which no bricks are found, are imported right away.
+    """
+    for app_config in apps.get_app_configs():
+        if not module_has_submodule(app_config.module, "bricks"):
+            continue
+        module_path = f"{app_config.name}.bricks"
+        spec = importlib.util.find_spec(module_path)
+        source = None
+        if spec is not None and spec.loader is not None:
+            source = spec.loader.get_source(module_path)
+        names = scan_brick_names(source) if source else None
+        if not names:
+            importlib.import_module(module_path)
+            continue
+        for name in names:
+            register_lazy(name, module_path)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from django.dispatch import receiver
+from django.test.signals import setting_changed
+from django.utils.autoreload import file_changed
+
+from .brick import (
+    clear_template_cache,
+    get_validation_mode,
+    get_validation_sample_rate,
+)
+from .validation import get_container_validation
+
+
+@receiver(file_changed, dispatch_uid="brickastley_template_changed")
+def template_changed(sender: Any, file_path: Path, **kwargs: Any) -> None:
+    """
+    Drop cached brick templates when a template file changes.
+
+    Python files are ignored since changing them restarts the dev server
+    anyway. Nothing is returned so Django's own handling of the change is
+    left untouched.
+    """
+    if file_path.suffix == ".py":
+        return
+    clear_template_cache()
+
+
+@receiver(setting_changed, dispatch_uid="brickastley_setting_changed")
+def brickastley_setting_changed(setting: str, **kwargs: Any) -> None:
+    """Drop values derived from settings when they are overridden in tests."""
+    if setting == "TEMPLATES":
+        clear_template_cache()
+    elif setting in ("DEBUG", "BRICKASTLEY_VALIDATION"):
+        get_validation_mode.cache_clear()
+    elif setting == "BRICKASTLEY_VALIDATION_SAMPLE_RATE":
+        get_validation_sample_rate.cache_clear()
+    elif setting in (
+        "BRICKASTLEY_CONTAINER_VALIDATION",
+        "BRICKASTLEY_CONTAINER_SAMPLE_SIZE",
+    ):
+        get_container_validation.cache_clear()
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
+import functools
+import inspect
+import itertools
 import logging
 import re
-from typing import Any, ClassVar
+import types
+import typing
+from typing import Any, Callable, ClassVar, Iterable, Iterator, Sequence
 
+from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
-from django.forms.widgets import MediaDefiningClass
+from django.core.exceptions import ImproperlyConfigured
+from django.forms.widgets import Media, MediaDefiningClass
 from django.template import loader
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import NodeList, render_value_in_context
+from django.template.base import Template as BaseTemplate
+from django.template.context import Context
 from django.utils.functional import Promise
+from django.utils.safestring import SafeString, mark_safe
+
+from .cache import BrickCache, make_cache_key
+from .profiling import start_timer
+from .streaming import render_nodelist, split_template
+from .validation import compile_container_check, compile_literal_converter
 
 logger = logging.getLogger(__name__)
 
+# typing.Union and, on Python 3.10+, the X | Y union type
+_UNION_ORIGINS = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+# Values accepted by the BRICKASTLEY_VALIDATION setting
+VALIDATION_MODES = ("strict", "warn", "sample", "off")
+
+# Common HTML attributes collected in Brick.attrs unless defined as kwargs
+HTML_ATTRS = ("class", "id", "title")
+
+# Marker for kwargs without a default value
+_MISSING = object()
+
+# Resolved templates keyed by (brick class, template engine alias)
+_template_cache: dict[tuple[type, str | None], Any] = {}
+
 
 class BrickValidationError(Exception):
     """Raised when brick kwargs fail type validation."""
@@ -18,10 +50,20 @@ class BrickValidationError(Exception):
     pass
 
 
+def clear_template_cache() -> None:
+    """Forget all resolved brick templates. Called when templates change."""
+    _template_cache.clear()
+
+
+_CAPITALIZED_WORD_RE = re.compile(r"(.)([A-Z][a-z]+)")
+_LOWER_UPPER_RE = re.compile(r"([a-z0-9])([A-Z])")
+
+
+@functools.lru_cache(maxsize=None)
 def _camel_to_snake(name: str) -> str:
     """Convert CamelCase to snake_case."""
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    return re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1).lower()
+    s1 = _CAPITALIZED_WORD_RE.sub(r"\1_\2", name)
+    return _LOWER_UPPER_RE.sub(r"\1_\2", s1).lower()
 
 
 def _validate_type(
@@ -89,16 +131,222 @@ def _validate_type(
             )
 
 
+def _is_class_var(hint: Any) -> bool:
+    """Check if a type hint declares a ClassVar, including string annotations."""
+    if isinstance(hint, str):
+        return hint.startswith(("ClassVar", "typing.ClassVar"))
+    return typing.get_origin(hint) is ClassVar
+
+
+def _class_default(cls: type, name: str) -> Any:
+    """
+    Look up the class-level default of a kwarg, or _MISSING if there is none.
+
+    Defaults of slotted bricks live in ``__brick_slot_defaults__`` because the
+    class attribute itself is replaced by the slot descriptor.
+    """
+    for klass in cls.__mro__:
+        slot_defaults = klass.__dict__.get("__brick_slot_defaults__", {})
+        if name in slot_defaults:
+            return slot_defaults[name]
+        if name in klass.__dict__:
+            value = klass.__dict__[name]
+            if isinstance(value, types.MemberDescriptorType):
+                continue
+            return value
+    return _MISSING
+
+
+def _use_slots() -> bool:
+    """Whether bricks get __slots__ unless they opt in or out explicitly."""
+    return settings.configured and getattr(settings, "BRICKASTLEY_SLOTS", False)
+
+
+@functools.lru_cache(maxsize=None)
+def get_validation_mode() -> str:
+    """
+    Get the configured kwarg validation mode.
+
+    ``BRICKASTLEY_VALIDATION`` defaults to ``"strict"`` when DEBUG is on and
+    to ``"warn"`` otherwise. The result is cached since it is needed for every
+    brick instance; the cache is cleared when settings are overridden.
+    """
+    mode = getattr(settings, "BRICKASTLEY_VALIDATION", None)
+    if mode is None:
+        return "strict" if getattr(settings, "DEBUG", False) else "warn"
+    if mode not in VALIDATION_MODES:
+        raise ImproperlyConfigured(
+            f"BRICKASTLEY_VALIDATION must be one of {', '.join(VALIDATION_MODES)}, "
+            f"got {mode!r}"
+        )
+    return mode
+
+
+@functools.lru_cache(maxsize=None)
+def get_validation_sample_rate() -> int:
+    """Get how many instantiations per brick class share one validation."""
+    return getattr(settings, "BRICKASTLEY_VALIDATION_SAMPLE_RATE", 100)
+
+
+def _make_fast_init(
+    brick_name: str, brick_kwargs: dict[str, Any], defaults: dict[str, Any]
+) -> Callable[[Any, dict[str, Any]], None]:
+    """
+    Generate a straight-line function that sets kwargs without type checks.
+
+    Used when validation is off (or skipped by sampling). Missing required
+    kwargs are still reported since that is a structural error.
+    """
+    lines = ["def __brick_fast_init__(self, kwargs):", "    pop = kwargs.pop"]
+    lines.append("    attrs = {}")
+    for attr_name in HTML_ATTRS:
+        if attr_name not in brick_kwargs:
+            lines.append(f"    if {attr_name!r} in kwargs:")
+            lines.append(f"        attrs[{attr_name!r}] = pop({attr_name!r})")
+
+    namespace: dict[str, Any] = {"BrickValidationError": BrickValidationError}
+    for index, kwarg_name in enumerate(brick_kwargs):
+        if kwarg_name in defaults:
+            namespace[f"_default_{index}"] = defaults[kwarg_name]
+            lines.append(
+                f"    self.{kwarg_name} = pop({kwarg_name!r}, _default_{index})"
+            )
+        else:
+            message = f"Missing required kwarg '{kwarg_name}' for brick '{brick_name}'"
+            lines.append("    try:")
+            lines.append(f"        self.{kwarg_name} = pop({kwarg_name!r})")
+            lines.append("    except KeyError:")
+            lines.append(f"        raise BrickValidationError({message!r}) from None")
+
+    lines.append("    self.extra = kwargs")
+    lines.append("    self.attrs = attrs")
+    exec("\n".join(lines), namespace)
+    return namespace["__brick_fast_init__"]
+
+
+def _get_context_data_from_async(self: Brick, **kwargs: Any) -> dict[str, Any]:
+    """Run aget_context_data() for bricks that only define the async version."""
+    return async_to_sync(self.aget_context_data)(**kwargs)
+
+
+class override_autoescape:
+    """
+    Switch a context to another autoescape setting for a with block.
+
+    Brick templates are escaped according to their own engine, also when
+    they render on a parent context inside ``{% autoescape off %}``.
+    """
+
+    __slots__ = ("context", "autoescape", "previous")
+
+    def __init__(self, context: Context, autoescape: bool) -> None:
+        self.context = context
+        self.autoescape = autoescape
+
+    def __enter__(self) -> None:
+        self.previous = self.context.autoescape
+        self.context.autoescape = self.autoescape
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.context.autoescape = self.previous
+
+
+def _is_lazy_str(value: Any) -> bool:
+    """Check if a value is a Django lazy translation string."""
+    # Check for str-specific method 'upper' to ensure it's a lazy string, not lazy list etc.
+    return isinstance(value, Promise) and hasattr(value, "upper")
+
+
+def _compile_validator(
+    expected_type: Any, kwarg_name: str, brick_name: str
+) -> Callable[[Any], None] | None:
+    """
+    Compile a validator callable for a single kwarg.
+
+    The type hint is inspected once, so the returned callable only performs
+    an isinstance check per call, plus an item check for containers with
+    typed items such as ``list[int]``. Returns None for ``Any``, meaning the
+    kwarg needs no validation at all. Type hints that can't be reduced to an
+    isinstance check fall back to the generic ``_validate_type`` walk.
+    """
+    if expected_type is Any:
+        return None
+
+    origin = typing.get_origin(expected_type)
+
+    if origin in _UNION_ORIGINS:
+        members = typing.get_args(expected_type)
+    else:
+        members = (expected_type,)
+
+    nullable = type(None) in members
+    classes = []
+    for member in members:
+        if member is type(None):
+            continue
+        if member is Any:
+            return None
+        member_class = typing.get_origin(member) or member
+        if not isinstance(member_class, type):
+            return lambda value: _validate_type(
+                value, expected_type, kwarg_name, brick_name
+            )
+        classes.append(member_class)
+
+    accepted = tuple(classes)
+    accepts_lazy_str = str in accepted
+    if len(members) == 1 and origin is None:
+        expected_label = expected_type.__name__
+    else:
+        expected_label = str(expected_type)
+
+    container_check = compile_container_check(expected_type)
+
+    def validate(value: Any) -> None:
+        if isinstance(value, accepted):
+            if container_check is None or container_check(value):
+                return
+            raise BrickValidationError(
+                f"kwarg '{kwarg_name}' in '{brick_name}' brick expected "
+                f"{expected_label}, got {type(value).__name__} with items of "
+                "another type"
+            )
+        if value is None:
+            if nullable:
+                return
+            raise BrickValidationError(
+                f"kwarg '{kwarg_name}' in '{brick_name}' brick received None "
+                "but is not optional"
+            )
+        if accepts_lazy_str and _is_lazy_str(value):
+            return
+        raise BrickValidationError(
+            f"kwarg '{kwarg_name}' in '{brick_name}' brick expected "
+            f"{expected_label}, got {type(value).__name__}"
+        )
+
+    return validate
+
+
 class BrickMeta(MediaDefiningClass):
     """
     Metaclass for Brick that processes kwarg definitions.
 
     Inherits from MediaDefiningClass to support the Media inner class
     pattern used by Django forms and widgets.
+
+    Passing ``slots=True`` as a class keyword (or setting
+    ``BRICKASTLEY_SLOTS = True``) generates ``__slots__`` for the brick's
+    kwargs, so instances don't carry a ``__dict__``.
     """
 
     def __new__(
-        mcs, name: str, bases: tuple, namespace: dict, **kwargs: Any
+        mcs,
+        name: str,
+        bases: tuple,
+        namespace: dict,
+        slots: bool | None = None,
+        **kwargs: Any,
     ) -> BrickMeta:
         cls = super().__new__(mcs, name, bases, namespace)
 
@@ -119,18 +367,97 @@ class BrickMeta(MediaDefiningClass):
                         continue
                     if hasattr(base, "__class_kwargs__"):
                         continue
+                    if _is_class_var(kwarg_type):
+                        continue
                     hints[kwarg_name] = kwarg_type
                     # Check for default value
-                    if hasattr(base, kwarg_name):
-                        defaults[kwarg_name] = getattr(base, kwarg_name)
+                    default = _class_default(base, kwarg_name)
+                    if default is not _MISSING:
+                        defaults[kwarg_name] = default
 
         # Filter out ClassVar kwargs and known class attributes
-        class_attrs = {"template_name", "brick_name"}
-        cls.__brick_kwargs__ = {k: v for k, v in hints.items() if k not in class_attrs}
+        class_attrs = {
+            "template_name",
+            "brick_name",
+            "isolated",
+            "cache",
+            "inline",
+            "memoize",
+            "using",
+        }
+        brick_kwargs = {k: v for k, v in hints.items() if k not in class_attrs}
+
+        if slots is None:
+            slots = _use_slots()
+        if slots and "__slots__" not in namespace:
+            # Re-create the class with slots for kwargs that no base class
+            # provides a slot for yet. Defaults move out of the namespace since
+            # a slot can't share its name with a class attribute.
+            slot_names = tuple(
+                k
+                for k in brick_kwargs
+                if not isinstance(getattr(cls, k, None), types.MemberDescriptorType)
+            )
+            slotted_namespace = {
+                k: v for k, v in namespace.items() if k not in slot_names
+            }
+            slotted_namespace["__slots__"] = slot_names
+            slotted_namespace["__brick_slot_defaults__"] = {
+                k: namespace[k] for k in slot_names if k in namespace
+            }
+            cls = super().__new__(mcs, name, bases, slotted_namespace)
+
+        # Names derived from the class name. brick_name and template_name are
+        # still looked up on every call since register(name=...) sets
+        # brick_name after the class is created.
+        snake_name = _camel_to_snake(name)
+        cls.__brick_default_name__ = snake_name
+        cls.__brick_default_template_name__ = f"bricks/{snake_name}.html"
+        # get_template_name() overridden as an instance method picks the
+        # template per brick, bypassing the template cache of the class
+        cls.__brick_template_per_instance__ = not isinstance(
+            inspect.getattr_static(cls, "get_template_name"),
+            (classmethod, staticmethod),
+        )
+
+        cls.__brick_kwargs__ = brick_kwargs
         cls.__brick_defaults__ = {
             k: v for k, v in defaults.items() if k not in class_attrs
         }
 
+        # Compile validators once so instantiation does no type introspection
+        validators = {}
+        for kwarg_name, kwarg_type in cls.__brick_kwargs__.items():
+            validator = _compile_validator(kwarg_type, kwarg_name, name)
+            if validator is not None:
+                validators[kwarg_name] = validator
+        cls.__brick_validators__ = validators
+
+        # Coerce template literals to kwarg types when templates are parsed
+        converters = {}
+        for kwarg_name, kwarg_type in cls.__brick_kwargs__.items():
+            converter = compile_literal_converter(kwarg_type)
+            if converter is not None:
+                converters[kwarg_name] = converter
+        cls.__brick_converters__ = converters
+
+        # Used when validation is off or skipped by sampling
+        cls.__brick_fast_init__ = _make_fast_init(
+            name, cls.__brick_kwargs__, cls.__brick_defaults__
+        )
+        cls.__brick_sample_counter__ = itertools.count()
+
+        # Bricks that only load their context asynchronously still render
+        # from sync code, such as templates rendered under WSGI
+        cls.__brick_async_context__ = (
+            cls.aget_context_data is not Brick.aget_context_data
+        )
+        if (
+            cls.__brick_async_context__
+            and cls.get_context_data is Brick.get_context_data
+        ):
+            cls.get_context_data = _get_context_data_from_async
+
         return cls
 
 
@@ -158,25 +485,98 @@ class Brick(metaclass=BrickMeta):
     template_name: ClassVar[str | None] = None
     brick_name: ClassVar[str | None] = None
 
+    # Alias of the template engine to load the template from; None tries
+    # every engine in TEMPLATES
+    using: ClassVar[str | None] = None
+
+    # Render without access to the parent template context
+    isolated: ClassVar[bool] = False
+
+    # Cache for the rendered HTML of bricks that only depend on their kwargs
+    cache: ClassVar[BrickCache | None] = None
+
+    # Inline the brick template into calling templates; None follows the
+    # BRICKASTLEY_INLINE setting
+    inline: ClassVar[bool | None] = None
+
+    # Reuse the output of identical brick tags within one template render
+    memoize: ClassVar[bool] = False
+
+    __slots__ = ("extra", "attrs")
+
     # Set by metaclass
     __brick_kwargs__: ClassVar[dict[str, type]]
     __brick_defaults__: ClassVar[dict[str, Any]]
+    __brick_validators__: ClassVar[dict[str, Callable[[Any], None]]]
+    __brick_converters__: ClassVar[dict[str, Callable[[Any, str], Any]]]
+    __brick_fast_init__: Callable[[dict[str, Any]], None]
+    __brick_sample_counter__: ClassVar[itertools.count]
+    __brick_async_context__: ClassVar[bool] = False
+    __brick_default_name__: ClassVar[str]
+    __brick_default_template_name__: ClassVar[str]
+    __brick_template_per_instance__: ClassVar[bool] = False
 
     def __init__(self, **kwargs: Any) -> None:
-        self._validate_and_set_kwargs(kwargs)
+        mode = get_validation_mode()
+        if mode == "off" or (mode == "sample" and not self._should_sample()):
+            self.__brick_fast_init__(kwargs)
+        else:
+            self._validate_and_set_kwargs(kwargs, strict=mode == "strict")
+
+    @classmethod
+    def _should_sample(cls) -> bool:
+        """Whether this instantiation is one of the 1 in N that get validated."""
+        rate = get_validation_sample_rate()
+        return next(cls.__brick_sample_counter__) % rate == 0
+
+    @classmethod
+    def _from_tag_kwargs(
+        cls, kwargs: dict[str, Any], validated: frozenset[str]
+    ) -> Brick:
+        """
+        Create a brick from the kwargs of a brick tag.
+
+        The kwargs named in ``validated`` were checked when the template was
+        compiled, so only the remaining ones are validated here. Bricks that
+        override __init__() are created normally.
+
+        The kwargs dict isn't modified, callers still use it as a key.
+        """
+        if cls.__init__ is not Brick.__init__:
+            return cls(**kwargs)
+        # Both init paths pop kwargs from the dict they are given
+        kwargs = dict(kwargs)
+        brick = cls.__new__(cls)
+        mode = get_validation_mode()
+        if (
+            mode == "off"
+            or validated.issuperset(kwargs)
+            or (mode == "sample" and not cls._should_sample())
+        ):
+            brick.__brick_fast_init__(kwargs)
+        else:
+            brick._validate_and_set_kwargs(
+                kwargs, strict=mode == "strict", skip=validated
+            )
+        return brick
+
+    def _validate_and_set_kwargs(
+        self,
+        kwargs: dict[str, Any],
+        strict: bool = True,
+        skip: frozenset[str] = frozenset(),
+    ) -> None:
+        """
+        Validate kwargs against kwarg definitions and set as attributes.
 
-    def _validate_and_set_kwargs(self, kwargs: dict[str, Any]) -> None:
-        """Validate kwargs against kwarg definitions and set as attributes."""
+        Type mismatches raise BrickValidationError if ``strict`` is set and
+        are logged as warnings otherwise. Kwargs named in ``skip`` were
+        validated already and are only set.
+        """
         brick_kwargs = self.__brick_kwargs__
         defaults = self.__brick_defaults__
 
-        # Check for required kwargs
-        for kwarg_name in brick_kwargs:
-            if kwarg_name not in kwargs and kwarg_name not in defaults:
-                raise BrickValidationError(
-                    f"Missing required kwarg '{kwarg_name}' for brick "
-                    f"'{self.__class__.__name__}'"
-                )
+        self._check_required_kwargs(kwargs)
 
         # Collect extra kwargs not defined in the brick class
         self.extra: dict[str, Any] = {}
@@ -185,7 +585,7 @@ class Brick(metaclass=BrickMeta):
         # directly to the template context without needing explicit definition.
         # Only extract if NOT defined as a brick kwarg.
         self.attrs: dict[str, Any] = {}
-        for attr_name in ("class", "id", "title"):
+        for attr_name in HTML_ATTRS:
             if attr_name in kwargs and attr_name not in brick_kwargs:
                 self.attrs[attr_name] = kwargs.pop(attr_name)
 
@@ -196,21 +596,8 @@ class Brick(metaclass=BrickMeta):
                 self.extra[kwarg_name] = value
                 continue
 
-            expected_type = brick_kwargs[kwarg_name]
-            try:
-                _validate_type(
-                    value, expected_type, kwarg_name, self.__class__.__name__
-                )
-            except BrickValidationError:
-                if getattr(settings, "DEBUG", False):
-                    raise
-                else:
-                    logger.warning(
-                        f"Type validation failed for kwarg '{kwarg_name}' in "
-                        f"brick '{self.__class__.__name__}': expected "
-                        f"{expected_type}, got {type(value).__name__}"
-                    )
-
+            if kwarg_name not in skip:
+                self._validate_kwarg(kwarg_name, value, strict)
             setattr(self, kwarg_name, value)
 
         # Set defaults for missing optional kwargs
@@ -218,19 +605,121 @@ class Brick(metaclass=BrickMeta):
             if kwarg_name not in kwargs:
                 setattr(self, kwarg_name, default)
 
+    @classmethod
+    def _check_required_kwargs(cls, kwargs: dict[str, Any]) -> None:
+        """Raise BrickValidationError if a required kwarg is missing."""
+        defaults = cls.__brick_defaults__
+        for kwarg_name in cls.__brick_kwargs__:
+            if kwarg_name not in kwargs and kwarg_name not in defaults:
+                raise BrickValidationError(
+                    f"Missing required kwarg '{kwarg_name}' for brick "
+                    f"'{cls.__name__}'"
+                )
+
+    @classmethod
+    def _validate_kwarg(cls, kwarg_name: str, value: Any, strict: bool) -> None:
+        """Validate a single kwarg value, raising or logging on a mismatch."""
+        validator = cls.__brick_validators__.get(kwarg_name)
+        if validator is None:
+            return
+        try:
+            validator(value)
+        except BrickValidationError:
+            if strict:
+                raise
+            else:
+                logger.warning(
+                    f"Type validation failed for kwarg '{kwarg_name}' in "
+                    f"brick '{cls.__name__}': expected "
+                    f"{cls.__brick_kwargs__[kwarg_name]}, got {type(value).__name__}"
+                )
+
+    @classmethod
+    def _context_from_kwargs(
+        cls,
+        kwargs: dict[str, Any],
+        validated: frozenset[str] = frozenset(),
+        **extra_context: Any,
+    ) -> dict[str, Any]:
+        """
+        Build the default template context straight from kwargs.
+
+        Equivalent to instantiating the brick and calling the default
+        get_context_data(), including validation, but without creating an
+        instance. Used for bricks inlined into the calling template. Kwargs
+        named in ``validated`` were validated already.
+        """
+        brick_kwargs = cls.__brick_kwargs__
+        cls._check_required_kwargs(kwargs)
+
+        mode = get_validation_mode()
+        validate = not validated.issuperset(kwargs) and (
+            mode in ("strict", "warn") or (mode == "sample" and cls._should_sample())
+        )
+
+        context = dict(cls.__brick_defaults__)
+        extra: dict[str, Any] = {}
+        attrs: dict[str, Any] = {}
+        for kwarg_name, value in kwargs.items():
+            if kwarg_name in brick_kwargs:
+                if validate and kwarg_name not in validated:
+                    cls._validate_kwarg(kwarg_name, value, mode == "strict")
+                context[kwarg_name] = value
+            elif kwarg_name in HTML_ATTRS:
+                attrs[kwarg_name] = value
+            else:
+                extra[kwarg_name] = value
+
+        context["extra"] = extra
+        context.update(attrs)
+        context.update(extra_context)
+        return context
+
     @classmethod
     def get_brick_name(cls) -> str:
         """Get the template tag name for this brick."""
-        if cls.brick_name:
-            return cls.brick_name
-        return _camel_to_snake(cls.__name__)
+        return cls.brick_name or cls.__brick_default_name__
 
     @classmethod
     def get_template_name(cls) -> str:
         """Get the template path for this brick."""
-        if cls.template_name:
-            return cls.template_name
-        return f"bricks/{_camel_to_snake(cls.__name__)}.html"
+        return cls.template_name or cls.__brick_default_template_name__
+
+    @classmethod
+    def get_media(cls) -> Media:
+        """Get the brick's media without creating a brick instance."""
+        # The media property only reads class attributes
+        return cls.__new__(cls).media
+
+    @classmethod
+    def get_template(cls, using: str | None = None) -> Any:
+        """
+        Get the resolved template for this brick.
+
+        The template is looked up through Django's template loaders once per
+        brick class and engine, then reused for every render. The engine
+        defaults to the brick's ``using`` attribute.
+        """
+        if using is None:
+            using = cls.using
+        key = (cls, using)
+        try:
+            return _template_cache[key]
+        except KeyError:
+            tpl = loader.get_template(cls.get_template_name(), using=using)
+            _template_cache[key] = tpl
+            return tpl
+
+    def _get_own_template(self) -> Any:
+        """
+        Get the template to render this brick with.
+
+        Bricks overriding get_template_name() as an instance method load their
+        template on every render instead of through the class's cache.
+        """
+        if self.__brick_template_per_instance__:
+            return loader.get_template(self.get_template_name(), using=self.using)
+        return self.get_template()
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         """
@@ -251,21 +740,194 @@ class Brick(metaclass=BrickMeta):
         context.update(kwargs)
         return context
 
-    def render(self, context: dict[str, Any] | None = None) -> str:
+    async def aget_context_data(self, **kwargs: Any) -> dict[str, Any]:
+        """
+        Get the template context for rendering, asynchronously.
+
+        Override this method instead of get_context_data() to load data with
+        async code. When a template is rendered with arender_template(), the
+        async context data of all its bricks is loaded concurrently. By
+        default, a custom get_context_data() is run in a thread.
+        """
+        get_context_data = type(self).get_context_data
+        if get_context_data in (Brick.get_context_data, _get_context_data_from_async):
+            return Brick.get_context_data(self, **kwargs)
+        return await sync_to_async(get_context_data)(self, **kwargs)
+
+    def render(self, context: Context | dict[str, Any] | None = None) -> str:
         """Render the brick to a string.
 
         Args:
             context: Optional parent template context. If provided, brick
-                variables are merged on top, giving access to request and
-                other context processor variables.
+                variables are layered on top, giving access to request and
+                other context processor variables. Ignored for isolated bricks.
         """
-        tpl = loader.get_template(self.get_template_name())
-        brick_context = self.get_context_data()
-        if context is not None:
-            full_context = {**context, **brick_context}
-        else:
-            full_context = brick_context
-        return tpl.render(full_context)
+        if self.cache is not None:
+            return self._render_cached(context)
+        return self._render_template(self.get_context_data(), context)
+
+    async def arender(self, context: Context | dict[str, Any] | None = None) -> str:
+        """Render the brick to a string from async code.
+
+        The context data is loaded with aget_context_data(), the template is
+        rendered in a thread like other sync code.
+        """
+        if type(self).render is not Brick.render or self.cache is not None:
+            return await sync_to_async(self.render)(context=context)
+        brick_context = await self.aget_context_data()
+        return await sync_to_async(self._render_template)(brick_context, context)
+
+    def get_cache_key(self, **kwargs: Any) -> str | None:
+        """
+        Get the key under which the rendered brick is cached.
+
+        Override this method to customize caching. By default, the key is
+        derived from the brick class and its kwarg values, extra and attrs.
+        Returning None renders the brick without the cache.
+        """
+        values = {
+            kwarg_name: getattr(self, kwarg_name)
+            for kwarg_name in self.__brick_kwargs__
+            if hasattr(self, kwarg_name)
+        }
+        values["extra"] = self.extra
+        values["attrs"] = self.attrs
+        values.update(kwargs)
+        return make_cache_key(self.__class__, values)
+
+    def _render_cached(
+        self, context: Context | dict[str, Any] | None, **kwargs: Any
+    ) -> str:
+        """Render the brick through its cache."""
+        key = self.get_cache_key(**kwargs)
+        if key is not None:
+            html = self.cache.get(key)
+            if html is not None:
+                return html
+        html = self._render_template(self.get_context_data(**kwargs), context)
+        if key is not None:
+            self.cache.set(key, html)
+        return html
+
+    def _render_template(
+        self,
+        brick_context: dict[str, Any],
+        context: Context | dict[str, Any] | None,
+    ) -> str:
+        """Render the brick template with the brick context on top of context.
+
+        A template ``Context`` is not copied: the brick context is pushed onto
+        it for the duration of the render, so the cost doesn't grow with the
+        size of the parent context. Isolated, cached and memoized bricks get a
+        fresh context that only shares the parent's rendering options. The
+        autoescape setting is always the one of the brick template's engine.
+
+        Django templates are rendered through the compiled template directly,
+        skipping the backend's make_context() for dict contexts.
+        """
+        tpl = self._get_own_template()
+        isolated = self.isolated or self.cache is not None or self.memoize
+        if isinstance(tpl, DjangoTemplate):
+            autoescape = tpl.backend.engine.autoescape
+            if isinstance(context, Context):
+                if isolated:
+                    # Copied because the new context writes into its top dict
+                    context = context.new(dict(brick_context))
+                    context.autoescape = autoescape
+                    return tpl.template.render(context)
+                with (
+                    context.push(brick_context),
+                    override_autoescape(context, autoescape),
+                ):
+                    return tpl.template.render(context)
+            if context is not None and not isolated:
+                brick_context = {**context, **brick_context}
+            else:
+                brick_context = dict(brick_context)
+            return tpl.template.render(Context(brick_context, autoescape=autoescape))
+
+        if context is not None and not isolated:
+            if isinstance(context, Context):
+                context = context.flatten()
+            brick_context = {**context, **brick_context}
+        return tpl.render(brick_context)
+
+    @classmethod
+    def render_many(
+        cls,
+        kwargs_list: Iterable[dict[str, Any]],
+        context: Context | dict[str, Any] | None = None,
+    ) -> SafeString:
+        """Render one brick per kwargs dict and join the output.
+
+        All bricks are created, and thereby validated, before the first one
+        is rendered. The template is resolved once and a single context layer
+        is reused for all bricks, so rendering a list of bricks costs much
+        less than rendering them one by one.
+
+        Args:
+            kwargs_list: Kwargs for each brick to render.
+            context: Optional parent template context, as for render().
+        """
+        bricks = [cls(**kwargs) for kwargs in kwargs_list]
+        return cls._render_batch(bricks, context)
+
+    @classmethod
+    def _render_batch(
+        cls,
+        bricks: Sequence[Brick],
+        context: Context | dict[str, Any] | None,
+        loop_name: str | None = None,
+        loop_items: Sequence[Any] = (),
+    ) -> SafeString:
+        """Render bricks of this class through one reused context layer.
+
+        If ``loop_name`` is given, the corresponding item of ``loop_items`` is
+        available under that name while each brick is rendered.
+        """
+        # Bricks choosing their template per instance render one by one
+        tpl = None if cls.__brick_template_per_instance__ else cls.get_template()
+        if (
+            cls.render is not Brick.render
+            or cls.cache is not None
+            or not isinstance(tpl, DjangoTemplate)
+        ):
+            output = []
+            for index, brick in enumerate(bricks):
+                if loop_name is not None and isinstance(context, Context):
+                    with context.push({loop_name: loop_items[index]}):
+                        output.append(brick.render(context=context))
+                else:
+                    output.append(brick.render(context=context))
+            return mark_safe("".join(output))
+
+        if not isinstance(context, Context):
+            context = Context(
+                dict(context or {}), autoescape=tpl.backend.engine.autoescape
+            )
+        if cls.isolated or cls.memoize:
+            context = context.new()
+
+        output = []
+        with (
+            context.push() as layer,
+            override_autoescape(context, tpl.backend.engine.autoescape),
+        ):
+            for index, brick in enumerate(bricks):
+                timer = start_timer(cls)
+                html = None
+                try:
+                    layer.clear()
+                    if loop_name is not None:
+                        layer[loop_name] = loop_items[index]
+                    layer.update(brick.get_context_data())
+                    timer.lap("context")
+                    html = tpl.template.render(context)
+                    timer.lap("render")
+                finally:
+                    timer.finish(html)
+                output.append(html)
+        return mark_safe("".join(output))
 
 
 class BlockBrick(Brick):
@@ -291,19 +953,108 @@ class BlockBrick(Brick):
         </div>
     """
 
-    def render(self, children: str = "", context: dict[str, Any] | None = None) -> str:
+    __slots__ = ()
+
+    def render(
+        self,
+        children: str = "",
+        context: Context | dict[str, Any] | None = None,
+    ) -> str:
         """Render the brick with children content.
 
         Args:
             children: Rendered content from the block's child nodes.
             context: Optional parent template context. If provided, brick
-                variables are merged on top, giving access to request and
-                other context processor variables.
+                variables are layered on top, giving access to request and
+                other context processor variables. Ignored for isolated bricks.
         """
-        tpl = loader.get_template(self.get_template_name())
-        brick_context = self.get_context_data(children=children)
-        if context is not None:
-            full_context = {**context, **brick_context}
-        else:
-            full_context = brick_context
-        return tpl.render(full_context)
+        if self.cache is not None:
+            return self._render_cached(context, children=children)
+        return self._render_template(self.get_context_data(children=children), context)
+
+    async def arender(
+        self,
+        children: str = "",
+        context: Context | dict[str, Any] | None = None,
+    ) -> str:
+        """Render the brick with children content from async code."""
+        if type(self).render is not BlockBrick.render or self.cache is not None:
+            return await sync_to_async(self.render)(children=children, context=context)
+        brick_context = await self.aget_context_data(children=children)
+        return await sync_to_async(self._render_template)(brick_context, context)
+
+    def stream(
+        self,
+        children: str | Iterable[str] = "",
+        context: Context | dict[str, Any] | None = None,
+    ) -> Iterator[str]:
+        """Render the brick as a stream of chunks.
+
+        The part of the template before ``{{ children }}`` is yielded first,
+        then the children chunk by chunk, then the rest of the template. This
+        is useful with ``StreamingHttpResponse`` for bricks wrapping a lot of
+        content. Bricks that can't be split are rendered as a single chunk.
+
+        Args:
+            children: Content for the block, as a string or iterable of
+                chunks. Chunks that aren't marked safe are escaped, as with
+                render().
+            context: Optional parent template context, as for render().
+        """
+        if not isinstance(context, Context):
+            tpl = self._get_own_template()
+            autoescape = (
+                tpl.backend.engine.autoescape
+                if isinstance(tpl, DjangoTemplate)
+                else True
+            )
+            context = Context(dict(context or {}), autoescape=autoescape)
+        if isinstance(children, str):
+            children = [children]
+        escaped = (render_value_in_context(chunk, context) for chunk in children)
+        return self._stream(escaped, context)
+
+    def _stream(self, children: Iterable[str], context: Context) -> Iterator[str]:
+        """Yield the brick template split around the already rendered children.
+
+        Children are consumed between the two halves, with the brick's own
+        variables popped from the context again.
+        """
+        cls = self.__class__
+        tpl = self._get_own_template()
+        split = None
+        if (
+            cls.render is BlockBrick.render
+            and cls.get_context_data is Brick.get_context_data
+            and cls.cache is None
+            and isinstance(tpl, DjangoTemplate)
+        ):
+            split = split_template(tpl.template)
+        if split is None:
+            yield self.render(children=mark_safe("".join(children)), context=context)
+            return
+
+        head, tail = split
+        brick_context = self.get_context_data()
+        yield self._render_nodelist(head, tpl.template, brick_context, context)
+        yield from children
+        yield self._render_nodelist(tail, tpl.template, brick_context, context)
+
+    def _render_nodelist(
+        self,
+        nodelist: NodeList,
+        template: BaseTemplate,
+        brick_context: dict[str, Any],
+        context: Context,
+    ) -> str:
+        """Render part of the brick template with the brick context on top."""
+        if self.isolated or self.memoize:
+            # Copied because the new context writes into its top dict
+            context = context.new(dict(brick_context))
+            context.autoescape = template.engine.autoescape
+            return render_nodelist(nodelist, template, context)
+        with (
+            context.push(brick_context),
+            override_autoescape(context, template.engine.autoescape),
+        ):
+            return render_nodelist(nodelist, template, context)
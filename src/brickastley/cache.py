@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+from django.core.cache import caches
+from django.utils.functional import Promise
+from django.utils.safestring import SafeData
+from django.utils.translation import get_language
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a BrickCache, modelled on functools.lru_cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int | None
+
+
+class BrickCache:
+    """
+    Cache for the rendered HTML of pure bricks.
+
+    Assign an instance to the ``cache`` attribute of a brick whose output only
+    depends on its kwargs:
+
+        @register
+        class Icon(Brick):
+            name: str
+            cache = BrickCache(maxsize=512)
+
+    By default rendered fragments are kept in a size-bounded in-process LRU.
+    Pass ``backend`` to store them in one of Django's ``CACHES`` instead.
+
+    Args:
+        maxsize: Maximum number of fragments kept in the in-process LRU.
+        timeout: Seconds after which a fragment expires, or None to keep it
+            until it is evicted.
+        backend: Optional alias of a Django cache backend to use instead of
+            the in-process LRU.
+        key_prefix: Prefix for keys stored in a Django cache backend.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        timeout: float | None = None,
+        backend: str | None = None,
+        key_prefix: str = "brickastley",
+    ) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.backend = backend
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[str, tuple[float | None, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Get a cached fragment, or None if it is missing or expired."""
+        if self.backend is not None:
+            value = caches[self.backend].get(f"{self.key_prefix}:{key}")
+        else:
+            value = self._get_local(key)
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def _get_local(self, key: str) -> str | None:
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                return None
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a rendered fragment."""
+        if self.backend is not None:
+            caches[self.backend].set(
+                f"{self.key_prefix}:{key}", value, timeout=self.timeout
+            )
+            return
+
+        expires = None
+        if self.timeout is not None:
+            expires = time.monotonic() + self.timeout
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """Get hit and miss counters and the current size."""
+        if self.backend is not None:
+            return CacheInfo(self.hits, self.misses, None, None)
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def cache_clear(self) -> None:
+        """Clear the in-process fragments and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Kwarg value types that can safely be part of a cache key
+_KEY_SCALARS = (str, int, float, bool, Decimal, type(None))
+
+
+def _freeze(value: Any, typed: bool = False) -> Any:
+    """
+    Convert a kwarg value into a hashable representation for a cache key.
+
+    If ``typed`` is set, scalars are tagged with their type, since equal
+    values such as 1, 1.0 and True compare equal as keys but render
+    differently.
+
+    Raises TypeError for values whose repr doesn't identify their content,
+    such as arbitrary objects.
+    """
+    if isinstance(value, SafeData):
+        return ("safe", str(value))
+    if isinstance(value, Promise):
+        return str(value)
+    if isinstance(value, _KEY_SCALARS):
+        return (type(value), value) if typed else value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, typed) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v, typed)) for k, v in value.items()))
+    raise TypeError(f"{type(value).__name__} can't be part of a brick cache key")
+
+
+def make_cache_key(brick_class: type, values: dict[str, Any]) -> str | None:
+    """
+    Build a cache key from the brick class and its resolved kwargs.
+
+    The active language is part of the key, since brick templates may
+    translate text. Returns None if a value can't be represented safely in a
+    key, in which case the brick is rendered without the cache.
+    """
+    try:
+        frozen = tuple(sorted((name, _freeze(value)) for name, value in values.items()))
+    except TypeError:
+        return None
+    digest = hashlib.sha1(repr((get_language(), frozen)).encode()).hexdigest()
+    return f"{brick_class.__module__}.{brick_class.__qualname__}:{digest}"
+
+
+def make_memo_key(brick_class: type, values: dict[str, Any]) -> tuple | None:
+    """
+    Build a key for memoizing a brick render within one template render.
+
+    Unlike make_cache_key(), the key isn't hashed since it never leaves the
+    process. Returns None if a value can't be represented safely in a key.
+    """
+    try:
+        frozen = tuple(sorted((k, _freeze(v, typed=True)) for k, v in values.items()))
+    except TypeError:
+        return None
+    return (brick_class, frozen)
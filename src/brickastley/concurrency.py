@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Iterable
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, loader
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import Template, VariableDoesNotExist
+from django.template.context import Context, make_context
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.template.loader_tags import ExtendsNode, IncludeNode
+
+if TYPE_CHECKING:
+    from django.template.base import Node, NodeList
+    from django.template.engine import Engine
+
+    from .brick import Brick
+
+# Key in the base render context dict holding prefetched brick context data
+PREFETCH_KEY = "brickastley_prefetched"
+
+# Nodes whose bodies may not render, or render with other variables
+_CONDITIONAL_NODES = (ForNode, IfNode, WithNode)
+
+
+def get_prefetched(
+    node: Node, context: Context, kwargs: dict[str, Any] | None
+) -> dict[str, Any] | None:
+    """
+    Get the context data prefetched for a brick node.
+
+    Returns None if nothing was prefetched for the node, or if it was
+    prefetched for other kwargs than the ones the node renders with now.
+    """
+    prefetched = context.render_context.dicts[0].get(PREFETCH_KEY)
+    if not prefetched:
+        return None
+    entry = prefetched.get(node)
+    if entry is None or entry[0] != kwargs:
+        return None
+    return entry[1]
+
+
+def _sub_template(node: Node, engine: Engine, context: Context) -> Template | None:
+    """
+    Get the template an extends or include node renders, if it's static.
+
+    Returns None if the template can't be found, leaving the error to the
+    render, which may not get to the node at all.
+    """
+    try:
+        if isinstance(node, ExtendsNode):
+            name = node.parent_name.resolve(context)
+        else:
+            name = node.template.resolve(context)
+        if isinstance(name, str):
+            return engine.get_template(name)
+    except (TemplateDoesNotExist, TemplateSyntaxError, VariableDoesNotExist, OSError):
+        return None
+    # Backend templates wrap the compiled template
+    name = getattr(name, "template", name)
+    return name if isinstance(name, Template) else None
+
+
+def collect_prefetches(
+    nodelist: NodeList,
+    context: Context,
+    engine: Engine,
+    found: list[tuple[Node, dict[str, Any] | None, Brick]] | None = None,
+) -> list[tuple[Node, dict[str, Any] | None, Brick]]:
+    """
+    Find the bricks of a nodelist that load their context asynchronously.
+
+    Returns a (node, kwargs, brick) tuple per brick tag. Templates used by
+    ``{% extends %}`` and ``{% include %}`` are searched too. The bodies of
+    ``{% for %}``, ``{% if %}`` and ``{% with %}`` are not, since they may not
+    render at all or render with other variables.
+    """
+    if found is None:
+        found = []
+    for node in nodelist:
+        if isinstance(node, _CONDITIONAL_NODES):
+            continue
+        get_prefetch = getattr(node, "get_prefetch", None)
+        if get_prefetch is not None:
+            prefetch = get_prefetch(context)
+            if prefetch is not None:
+                found.append((node, *prefetch))
+        if isinstance(node, (ExtendsNode, IncludeNode)):
+            sub_template = _sub_template(node, engine, context)
+            if sub_template is not None:
+                collect_prefetches(sub_template.nodelist, context, engine, found)
+        for attr in node.child_nodelists:
+            child_nodelist = getattr(node, attr, None)
+            if child_nodelist:
+                collect_prefetches(child_nodelist, context, engine, found)
+    return found
+
+
+def _collect_template_prefetches(
+    template: Template, context: Context
+) -> list[tuple[Node, dict[str, Any] | None, Brick]]:
+    """
+    Find the bricks of a template to prefetch, with the template bound.
+
+    Resolving kwargs may need the template, e.g. for the engine's
+    string_if_invalid, so it is bound like Template.render() does.
+    """
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                return collect_prefetches(template.nodelist, context, template.engine)
+        return collect_prefetches(template.nodelist, context, template.engine)
+
+
+async def aprefetch_bricks(template: Template, context: Context) -> None:
+    """
+    Load the async context data of all bricks in a template concurrently.
+
+    Brick kwargs are resolved and the template tree is searched in a thread,
+    since both may touch the database. The aget_context_data() calls of all
+    bricks found are then gathered on the event loop, and their results are
+    stored in the render context for the brick nodes to pick up. Bricks whose
+    data fails to load aren't stored, so they load it again when rendered
+    and raise from there.
+    """
+    found = await sync_to_async(_collect_template_prefetches)(template, context)
+    if not found:
+        return
+    results = await asyncio.gather(
+        *(brick.aget_context_data() for node, kwargs, brick in found),
+        return_exceptions=True,
+    )
+    prefetched = context.render_context.dicts[0].setdefault(PREFETCH_KEY, {})
+    for (node, kwargs, brick), brick_context in zip(found, results):
+        if not isinstance(brick_context, BaseException):
+            prefetched[node] = (kwargs, brick_context)
+
+
+async def arender_template(
+    template_name: str | Iterable[str],
+    context: dict[str, Any] | None = None,
+    request: HttpRequest | None = None,
+    using: str | None = None,
+) -> str:
+    """
+    Render a template from async code, loading brick data concurrently.
+
+    Usage:
+        async def dashboard(request):
+            html = await arender_template("dashboard.html", {...}, request)
+            return HttpResponse(html)
+
+    Bricks that override aget_context_data() have their context data loaded
+    concurrently before the template is rendered in a thread. Bricks inside
+    loops, conditions or ``{% with %}``, or whose kwargs depend on variables
+    set while rendering, load their data when they are rendered.
+    """
+    if isinstance(template_name, (list, tuple)):
+        backend_template = await sync_to_async(loader.select_template)(
+            template_name, using=using
+        )
+    else:
+        backend_template = await sync_to_async(loader.get_template)(
+            template_name, using=using
+        )
+
+    if not isinstance(backend_template, DjangoTemplate):
+        return await sync_to_async(backend_template.render)(context, request)
+
+    template_context = make_context(
+        context, request, autoescape=backend_template.backend.engine.autoescape
+    )
+    await aprefetch_bricks(backend_template.template, template_context)
+    return await sync_to_async(backend_template.template.render)(template_context)
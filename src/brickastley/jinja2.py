@@ -0,0 +1,79 @@
+"""
+Jinja2 support for bricks.
+
+Requires Jinja2, installed with ``pip install django-brick-astley[jinja2]``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from django.utils.safestring import mark_safe
+from jinja2 import Environment, TemplateRuntimeError, pass_context
+from jinja2.ext import Extension
+from jinja2.runtime import Context as JinjaContext
+from markupsafe import Markup
+
+from .brick import BlockBrick
+from .registry import get_brick, get_lazy_registry, get_registry
+
+
+def make_brick_global(name: str) -> Callable[..., Markup]:
+    """
+    Create the Jinja2 global rendering the brick registered under a name.
+
+    Simple bricks are called like functions, block bricks with ``{% call %}``,
+    which passes the rendered block as ``caller``. The brick class is looked
+    up on every call, so bricks registered lazily are imported on first use.
+    """
+
+    @pass_context
+    def render_brick(
+        context: JinjaContext, caller: Callable[[], str] | None = None, **kwargs: Any
+    ) -> Markup:
+        brick_class = get_brick(name)
+        if brick_class is None:
+            raise TemplateRuntimeError(f"Brick '{name}' is not registered")
+        brick = brick_class(**kwargs)
+        parent_context = None if brick_class.isolated else context.get_all()
+        if issubclass(brick_class, BlockBrick):
+            children = mark_safe(caller()) if caller is not None else ""
+            return Markup(brick.render(children=children, context=parent_context))
+        if caller is not None:
+            raise TemplateRuntimeError(
+                f"Brick '{name}' is not a block brick and can't be used with "
+                "{% call %}"
+            )
+        return Markup(brick.render(context=parent_context))
+
+    render_brick.__name__ = name
+    return render_brick
+
+
+class BrickExtension(Extension):
+    """
+    Jinja2 extension exposing all registered bricks as globals.
+
+    Usage:
+        TEMPLATES = [
+            {
+                "BACKEND": "django.template.backends.jinja2.Jinja2",
+                "OPTIONS": {"extensions": ["brickastley.jinja2.BrickExtension"]},
+            },
+        ]
+
+    Templates:
+        {{ button(label="Save", variant="primary") }}
+
+        {% call card(title="Hello") %}
+            <p>Card content here</p>
+        {% endcall %}
+
+    Bricks are validated and build their context like in Django templates.
+    Their templates are loaded from any engine, unless they set ``using``.
+    """
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        for name in (*get_registry(), *get_lazy_registry()):
+            environment.globals.setdefault(name, make_brick_global(name))
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from ...autodiscover import autodiscover
+from ...manifest import build_manifest, dump_manifest
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a manifest of all registered bricks, which is loaded at startup "
+        "instead of importing the bricks modules."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--output",
+            help="Path of the manifest file. Defaults to BRICKASTLEY_MANIFEST.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Exit with an error if the manifest is missing or out of date.",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options["output"] or getattr(settings, "BRICKASTLEY_MANIFEST", None)
+        if not path:
+            raise CommandError("Pass --output or set BRICKASTLEY_MANIFEST.")
+        path = Path(path)
+
+        # The registry may have been filled from a manifest or lazily
+        autodiscover()
+        content = dump_manifest(build_manifest())
+
+        if options["check"]:
+            if not path.exists() or path.read_text() != content:
+                raise CommandError(
+                    f"Brick manifest {path} is out of date. "
+                    "Run 'manage.py brickastley_build' to update it."
+                )
+            self.stdout.write(f"Brick manifest {path} is up to date.")
+            return
+
+        path.write_text(content)
+        self.stdout.write(self.style.SUCCESS(f"Wrote brick manifest to {path}."))
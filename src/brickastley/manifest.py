@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+import typing
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .brick import BlockBrick
+from .registry import get_brick, get_lazy_registry, get_registry, register_lazy
+
+if TYPE_CHECKING:
+    from .brick import Brick
+
+# Bumped when the manifest layout changes incompatibly
+MANIFEST_VERSION = 1
+
+
+def _type_name(kwarg_type: Any) -> str:
+    """Get a readable name for a kwarg type hint."""
+    if isinstance(kwarg_type, type) and not typing.get_args(kwarg_type):
+        if kwarg_type.__module__ == "builtins":
+            return kwarg_type.__qualname__
+        return f"{kwarg_type.__module__}.{kwarg_type.__qualname__}"
+    return repr(kwarg_type).replace("typing.", "")
+
+
+def _describe_brick(brick_class: type[Brick]) -> dict[str, Any]:
+    """Describe a brick class for the manifest."""
+    defaults = brick_class.__brick_defaults__
+    kwargs = {}
+    for kwarg_name, kwarg_type in brick_class.__brick_kwargs__.items():
+        kwarg: dict[str, Any] = {"type": _type_name(kwarg_type)}
+        if kwarg_name in defaults:
+            kwarg["default"] = repr(defaults[kwarg_name])
+        else:
+            kwarg["required"] = True
+        kwargs[kwarg_name] = kwarg
+
+    template_name = None
+    if not brick_class.__brick_template_per_instance__:
+        template_name = brick_class.get_template_name()
+    media = brick_class.get_media()
+    css = {
+        medium: [str(path) for path in paths] for medium, paths in media._css.items()
+    }
+    return {
+        "module": brick_class.__module__,
+        "class": brick_class.__qualname__,
+        "template": template_name,
+        "block": issubclass(brick_class, BlockBrick),
+        "kwargs": kwargs,
+        "media": {"css": css, "js": [str(path) for path in media._js]},
+    }
+
+
+def build_manifest() -> dict[str, Any]:
+    """
+    Build the manifest of all registered bricks.
+
+    Bricks registered lazily are imported first, so that the manifest
+    describes the brick classes themselves.
+    """
+    for name in list(get_lazy_registry()):
+        get_brick(name)
+    bricks = {
+        name: _describe_brick(brick_class)
+        for name, brick_class in sorted(get_registry().items())
+    }
+    return {"version": MANIFEST_VERSION, "bricks": bricks}
+
+
+def dump_manifest(manifest: dict[str, Any]) -> str:
+    """Serialize a manifest in a stable, diff-friendly way."""
+    return json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+
+
+def load_manifest(path: str | Path) -> dict[str, Any] | None:
+    """
+    Load a manifest file written by the brickastley_build command.
+
+    Returns None if the file doesn't exist or was written for another
+    manifest version.
+    """
+    try:
+        manifest = json.loads(Path(path).read_text())
+    except FileNotFoundError:
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def register_manifest(manifest: dict[str, Any]) -> None:
+    """Register all bricks of a manifest lazily, without importing them."""
+    for name, brick in manifest["bricks"].items():
+        register_lazy(name, brick["module"])
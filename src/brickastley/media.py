@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from django.forms.widgets import Media
+from django.template import TemplateDoesNotExist
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import FilterExpression, Template
+from django.template.context import Context
+from django.template.loader_tags import ExtendsNode, IncludeNode
+
+if TYPE_CHECKING:
+    from django.template.base import NodeList
+
+    from .brick import Brick
+
+# Key in the base render context dict holding the brick classes rendered
+RENDERED_BRICKS_KEY = "brickastley_rendered_bricks"
+
+# Media of each brick class, computed on first use
+_media_cache: dict[type, Media] = {}
+
+# Media of the bricks used by each compiled template, computed on first use
+_template_media: WeakKeyDictionary[Template, Media] = WeakKeyDictionary()
+
+
+def get_brick_media(brick_class: type[Brick]) -> Media:
+    """Get the media of a brick class, computing it only once."""
+    try:
+        return _media_cache[brick_class]
+    except KeyError:
+        media = _media_cache[brick_class] = brick_class.get_media()
+        return media
+
+
+def clear_media_cache() -> None:
+    """Clear the cached media of all brick classes and templates."""
+    _media_cache.clear()
+    _template_media.clear()
+
+
+def record_brick(context: Context, brick_class: type[Brick]) -> None:
+    """
+    Record that a brick is rendered as part of the current template render.
+
+    The brick classes are kept in the base render context dict, which is
+    shared by included templates and bricks rendered with the same context.
+    """
+    base = context.render_context.dicts[0]
+    try:
+        base[RENDERED_BRICKS_KEY][brick_class] = None
+    except KeyError:
+        base[RENDERED_BRICKS_KEY] = {brick_class: None}
+
+
+def get_rendered_media(context: Context) -> Media:
+    """Get the merged media of the bricks rendered with a context so far."""
+    media = Media()
+    for brick_class in context.render_context.dicts[0].get(RENDERED_BRICKS_KEY, ()):
+        media += get_brick_media(brick_class)
+    return media
+
+
+def _constant_template(
+    filter_expression: FilterExpression, template: Template
+) -> Template | None:
+    """Get the template a constant name in an extends or include tag refers to."""
+    name = filter_expression.var
+    if (
+        filter_expression.is_var
+        or filter_expression.filters
+        or not isinstance(name, str)
+    ):
+        return None
+    try:
+        return template.engine.get_template(name)
+    except TemplateDoesNotExist:
+        return None
+
+
+def _scan_nodelist(
+    nodelist: NodeList,
+    template: Template,
+    brick_classes: dict[type[Brick], None],
+    seen: set[Template],
+) -> None:
+    """Collect the brick classes used by a nodelist and the templates it uses."""
+    for node in nodelist:
+        brick_class = getattr(node, "brick_class", None)
+        if brick_class is not None and brick_class not in brick_classes:
+            brick_classes[brick_class] = None
+            brick_template = None
+            # Templates chosen per instance aren't known without a brick
+            if not brick_class.__brick_template_per_instance__:
+                try:
+                    brick_template = brick_class.get_template()
+                except TemplateDoesNotExist:
+                    pass
+            if isinstance(brick_template, DjangoTemplate):
+                _scan_template(brick_template.template, brick_classes, seen)
+
+        sub_template = None
+        if isinstance(node, ExtendsNode):
+            sub_template = _constant_template(node.parent_name, template)
+        elif isinstance(node, IncludeNode):
+            sub_template = _constant_template(node.template, template)
+        if sub_template is not None:
+            _scan_template(sub_template, brick_classes, seen)
+
+        for attr in node.child_nodelists:
+            child_nodelist = getattr(node, attr, None)
+            if child_nodelist:
+                _scan_nodelist(child_nodelist, template, brick_classes, seen)
+
+
+def _scan_template(
+    template: Template, brick_classes: dict[type[Brick], None], seen: set[Template]
+) -> None:
+    """Collect the brick classes used by a template, once per template."""
+    if template in seen:
+        return
+    seen.add(template)
+    _scan_nodelist(template.nodelist, template, brick_classes, seen)
+
+
+def get_template_media(template: Any) -> Media:
+    """
+    Get the merged media of all bricks a template can render.
+
+    The compiled template is scanned once for brick tags, following
+    ``{% extends %}`` and ``{% include %}`` with constant template names and
+    the templates of the bricks themselves. Bricks in branches that aren't
+    rendered are included too.
+
+    Args:
+        template: A compiled template or a Django backend template.
+    """
+    template = getattr(template, "template", template)
+    try:
+        return _template_media[template]
+    except KeyError:
+        pass
+    brick_classes: dict[type[Brick], None] = {}
+    _scan_template(template, brick_classes, set())
+    media = Media()
+    for brick_class in brick_classes:
+        media += get_brick_media(brick_class)
+    _template_media[template] = media
+    return media
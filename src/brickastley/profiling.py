@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable
+
+from django.http import HttpRequest, HttpResponse
+
+from .signals import brick_rendered
+
+logger = logging.getLogger(__name__)
+
+# Nesting depth of the brick currently being rendered
+_render_depth: ContextVar[int] = ContextVar("brickastley_render_depth", default=0)
+
+# Profiler collecting brick renders for the current request
+_request_profiler: ContextVar[BrickProfiler | None] = ContextVar(
+    "brickastley_request_profiler", default=None
+)
+
+
+class RenderTimer:
+    """Measures the phases of a single brick render and reports them."""
+
+    def __init__(self, brick_class: type) -> None:
+        self.brick_class = brick_class
+        self.timings = {"validation": 0.0, "context": 0.0, "render": 0.0}
+        self.depth = _render_depth.get()
+        self._token = _render_depth.set(self.depth + 1)
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Attribute the time since the previous lap to a phase."""
+        now = time.perf_counter()
+        self.timings[phase] += now - self._last
+        self._last = now
+
+    def skip(self) -> None:
+        """Don't attribute the time since the previous lap to any phase."""
+        self._last = time.perf_counter()
+
+    def finish(self, output: str | None) -> None:
+        """Restore the nesting depth and send brick_rendered if rendered."""
+        _render_depth.reset(self._token)
+        if output is None:
+            return
+        template_name = None
+        if not self.brick_class.__brick_template_per_instance__:
+            template_name = self.brick_class.get_template_name()
+        brick_rendered.send(
+            sender=self.brick_class,
+            brick_name=self.brick_class.get_brick_name(),
+            template_name=template_name,
+            validation_time=self.timings["validation"],
+            context_time=self.timings["context"],
+            render_time=self.timings["render"],
+            output_size=len(output),
+            depth=self.depth,
+        )
+
+
+class NullTimer:
+    """Stand-in for RenderTimer while nobody listens to brick_rendered."""
+
+    def lap(self, phase: str) -> None:
+        pass
+
+    def skip(self) -> None:
+        pass
+
+    def finish(self, output: str | None) -> None:
+        pass
+
+
+_null_timer = NullTimer()
+
+
+def start_timer(brick_class: type) -> RenderTimer | NullTimer:
+    """Start timing a brick render, if anybody listens to brick_rendered."""
+    if brick_rendered.receivers:
+        return RenderTimer(brick_class)
+    return _null_timer
+
+
+class BrickStats:
+    """Aggregated render statistics of a single brick."""
+
+    __slots__ = (
+        "brick_name",
+        "template_name",
+        "count",
+        "total_time",
+        "max_time",
+        "validation_time",
+        "context_time",
+        "render_time",
+        "output_size",
+        "max_depth",
+    )
+
+    def __init__(self, brick_name: str, template_name: str) -> None:
+        self.brick_name = brick_name
+        self.template_name = template_name
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.validation_time = 0.0
+        self.context_time = 0.0
+        self.render_time = 0.0
+        self.output_size = 0
+        self.max_depth = 0
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.count if self.count else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"<BrickStats {self.brick_name}: {self.count} renders, "
+            f"{self.total_time * 1000:.2f}ms total>"
+        )
+
+
+class BrickProfiler:
+    """
+    Aggregates brick_rendered signals into per-brick statistics.
+
+    Use as a context manager to profile all brick renders in a block of code:
+
+        with BrickProfiler() as profiler:
+            response = client.get("/")
+        for stats in profiler.top(5):
+            print(stats.brick_name, stats.total_time)
+
+    The render time of a block brick doesn't include rendering its children,
+    so bricks nested inside a block brick are only counted once.
+    """
+
+    def __init__(self) -> None:
+        self.stats: dict[str, BrickStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, sender: type, **kwargs: Any) -> None:
+        """Record a single brick render. Usable as a brick_rendered receiver."""
+        elapsed = (
+            kwargs["validation_time"] + kwargs["context_time"] + kwargs["render_time"]
+        )
+        with self._lock:
+            stats = self.stats.get(kwargs["brick_name"])
+            if stats is None:
+                stats = BrickStats(kwargs["brick_name"], kwargs["template_name"])
+                self.stats[kwargs["brick_name"]] = stats
+            stats.count += 1
+            stats.total_time += elapsed
+            stats.max_time = max(stats.max_time, elapsed)
+            stats.validation_time += kwargs["validation_time"]
+            stats.context_time += kwargs["context_time"]
+            stats.render_time += kwargs["render_time"]
+            stats.output_size += kwargs["output_size"]
+            stats.max_depth = max(stats.max_depth, kwargs["depth"])
+
+    def top(self, n: int = 10, key: str = "total_time") -> list[BrickStats]:
+        """Get the n bricks with the highest value for key."""
+        with self._lock:
+            stats = list(self.stats.values())
+        return sorted(stats, key=lambda s: getattr(s, key), reverse=True)[:n]
+
+    def reset(self) -> None:
+        """Forget all recorded renders."""
+        with self._lock:
+            self.stats.clear()
+
+    def connect(self) -> None:
+        brick_rendered.connect(self.record, dispatch_uid=id(self))
+
+    def disconnect(self) -> None:
+        brick_rendered.disconnect(dispatch_uid=id(self))
+
+    def __enter__(self) -> BrickProfiler:
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.disconnect()
+
+
+# Statistics across all requests handled by BrickProfilerMiddleware
+process_profiler = BrickProfiler()
+
+
+def _record_request_render(sender: type, **kwargs: Any) -> None:
+    profiler = _request_profiler.get()
+    if profiler is not None:
+        profiler.record(sender, **kwargs)
+        process_profiler.record(sender, **kwargs)
+
+
+class BrickProfilerMiddleware:
+    """
+    Profile the bricks rendered during each request.
+
+    The request profiler is available as ``request.brick_profiler`` and the
+    slowest bricks are logged to the ``brickastley.profiling`` logger at DEBUG
+    level. Statistics across requests are collected in ``process_profiler``.
+    The number of bricks logged is set by ``BRICKASTLEY_PROFILING_TOP``
+    (default 10).
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        from django.conf import settings
+
+        self.get_response = get_response
+        self.top = getattr(settings, "BRICKASTLEY_PROFILING_TOP", 10)
+        brick_rendered.connect(
+            _record_request_render, dispatch_uid="brickastley_request_profiler"
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        profiler = BrickProfiler()
+        request.brick_profiler = profiler  # type: ignore[attr-defined]
+        token = _request_profiler.set(profiler)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_profiler.reset(token)
+
+        for stats in profiler.top(self.top):
+            logger.debug(
+                "%s %s: %d renders, %.2fms total, %.2fms max",
+                request.path,
+                stats.brick_name,
+                stats.count,
+                stats.total_time * 1000,
+                stats.max_time * 1000,
+            )
+        return response
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import importlib
 from typing import TYPE_CHECKING, Callable, TypeVar, overload
 
 if TYPE_CHECKING:
@@ -10,20 +11,62 @@ B = TypeVar("B", bound="Brick")
 # Global registry mapping brick names to brick classes
 _registry: dict[str, type[Brick]] = {}
 
+# Bricks known by name whose modules haven't been imported yet, mapping brick
+# names to module paths
+_lazy_registry: dict[str, str] = {}
+
 
 def get_registry() -> dict[str, type[Brick]]:
-    """Get the global brick registry."""
+    """Get the global brick registry of imported bricks."""
     return _registry
 
 
+def get_lazy_registry() -> dict[str, str]:
+    """Get the brick names registered lazily, mapped to their module paths."""
+    return _lazy_registry
+
+
 def get_brick(name: str) -> type[Brick] | None:
-    """Get a brick class by its registered name."""
+    """
+    Get a brick class by its registered name.
+
+    Bricks registered lazily are imported on first lookup, registering the
+    template tags of all bricks their module defines.
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        pass
+    module_path = _lazy_registry.get(name)
+    if module_path is None:
+        return None
+    # Importing the module runs its @register decorators
+    importlib.import_module(module_path)
+    # The module may register bricks besides the ones registered lazily
+    from .templatetags.brickastley import register_brick_tags
+
+    register_brick_tags()
     return _registry.get(name)
 
 
+def register_lazy(name: str, module_path: str) -> None:
+    """
+    Register a brick by name without importing it.
+
+    The module is imported, and thereby registers the brick class, when the
+    brick is first looked up with get_brick().
+
+    Args:
+        name: The brick's template tag name
+        module_path: Dotted path of the module defining the brick
+    """
+    _lazy_registry[name] = module_path
+
+
 def clear_registry() -> None:
     """Clear the brick registry. Useful for testing."""
     _registry.clear()
+    _lazy_registry.clear()
 
 
 @overload
@@ -0,0 +1,15 @@
+from django.dispatch import Signal
+
+# Sent after a brick tag has been rendered, with the brick class as sender.
+#
+# Keyword arguments:
+#   brick_name: Registered tag name of the brick.
+#   template_name: Template the brick was rendered with.
+#   validation_time: Seconds spent resolving kwargs and creating the brick.
+#   context_time: Seconds spent building the brick context.
+#   render_time: Seconds spent rendering the brick template.
+#   output_size: Length of the rendered HTML.
+#   depth: Nesting depth, 0 for bricks not rendered inside another brick.
+#
+# Timings are only measured while the signal has receivers.
+brick_rendered = Signal()
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable, Iterator
+from weakref import WeakKeyDictionary
+
+from django.http import HttpRequest
+from django.template import loader
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import NodeList, Template, TextNode, Variable, VariableNode
+from django.template.context import Context, make_context
+from django.template.loader_tags import (
+    BLOCK_CONTEXT_KEY,
+    BlockContext,
+    BlockNode,
+    ExtendsNode,
+)
+
+_CHILDREN_RE = re.compile(r"\bchildren\b")
+
+# Templates split around their {{ children }} variable, or None if they can't be
+_split_cache: WeakKeyDictionary[Template, tuple[NodeList, NodeList] | None] = (
+    WeakKeyDictionary()
+)
+
+
+def _is_children_node(node: Any) -> bool:
+    """Check if a node is a plain ``{{ children }}`` variable."""
+    if not isinstance(node, VariableNode):
+        return False
+    filter_expression = node.filter_expression
+    return (
+        not filter_expression.filters
+        and isinstance(filter_expression.var, Variable)
+        and filter_expression.var.var == "children"
+    )
+
+
+def split_template(template: Template) -> tuple[NodeList, NodeList] | None:
+    """
+    Split a template into the nodes before and after ``{{ children }}``.
+
+    A template can only be split if it mentions ``children`` exactly once, as
+    a top-level ``{{ children }}`` without filters. Otherwise None is returned
+    and the template has to be rendered as a whole.
+    """
+    try:
+        return _split_cache[template]
+    except KeyError:
+        pass
+
+    split = None
+    if len(_CHILDREN_RE.findall(template.source)) == 1:
+        for index, node in enumerate(template.nodelist):
+            if _is_children_node(node):
+                split = (
+                    NodeList(template.nodelist[:index]),
+                    NodeList(template.nodelist[index + 1 :]),
+                )
+                break
+    _split_cache[template] = split
+    return split
+
+
+def stream_nodelist(nodelist: NodeList, context: Context) -> Iterator[str]:
+    """
+    Render the nodes of a nodelist one by one.
+
+    Block bricks, ``{% extends %}`` and ``{% block %}`` tags are streamed
+    recursively. Any other node, including loops and conditions, is rendered
+    as a single chunk.
+    """
+    for node in nodelist:
+        stream = getattr(node, "stream", None)
+        if stream is not None:
+            yield from stream(context)
+        elif isinstance(node, ExtendsNode):
+            yield from _stream_extends(node, context)
+        elif isinstance(node, BlockNode):
+            yield from _stream_block(node, context)
+        else:
+            chunk = node.render_annotated(context)
+            if chunk:
+                yield chunk
+
+
+def _stream_extends(node: ExtendsNode, context: Context) -> Iterator[str]:
+    """Stream a child template through its parent, like ExtendsNode.render()."""
+    compiled_parent = node.get_parent(context)
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    # The parent's blocks are only added if it doesn't extend another template
+    for parent_node in compiled_parent.nodelist:
+        if not isinstance(parent_node, TextNode):
+            if not isinstance(parent_node, ExtendsNode):
+                blocks = {
+                    block.name: block
+                    for block in compiled_parent.nodelist.get_nodes_by_type(BlockNode)
+                }
+                block_context.add_blocks(blocks)
+            break
+
+    with context.render_context.push_state(compiled_parent, isolated_context=False):
+        yield from stream_nodelist(compiled_parent.nodelist, context)
+
+
+def _stream_block(node: BlockNode, context: Context) -> Iterator[str]:
+    """Stream the overriding version of a block, like BlockNode.render()."""
+    block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
+    with context.push():
+        if block_context is None:
+            context["block"] = node
+            yield from stream_nodelist(node.nodelist, context)
+            return
+
+        push = block = block_context.pop(node.name)
+        if block is None:
+            block = node
+        block = type(node)(block.name, block.nodelist)
+        block.context = context
+        context["block"] = block
+        yield from stream_nodelist(block.nodelist, context)
+        if push is not None:
+            block_context.push(node.name, push)
+
+
+def render_nodelist(nodelist: NodeList, template: Template, context: Context) -> str:
+    """Render nodes of a template, like Template.render() renders all of them."""
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                return nodelist.render(context)
+        return nodelist.render(context)
+
+
+def _stream_template(template: Template, context: Context) -> Iterator[str]:
+    """Stream a compiled template, like Template.render()."""
+    with context.render_context.push_state(template):
+        if context.template is None:
+            with context.bind_template(template):
+                context.template_name = template.name
+                yield from stream_nodelist(template.nodelist, context)
+        else:
+            yield from stream_nodelist(template.nodelist, context)
+
+
+def stream_template(
+    template_name: str | Iterable[str],
+    context: dict[str, Any] | None = None,
+    request: HttpRequest | None = None,
+    using: str | None = None,
+) -> Iterator[str]:
+    """
+    Render a template as a stream of chunks.
+
+    Usage:
+        return StreamingHttpResponse(stream_template("page.html", {...}, request))
+
+    The template is looked up immediately, so a missing template raises
+    before the response starts. Templates of other engines than the Django
+    template engine are rendered as a single chunk.
+    """
+    if isinstance(template_name, (list, tuple)):
+        backend_template = loader.select_template(template_name, using=using)
+    else:
+        backend_template = loader.get_template(template_name, using=using)
+
+    if not isinstance(backend_template, DjangoTemplate):
+        return iter([backend_template.render(context, request)])
+
+    template_context = make_context(
+        context, request, autoescape=backend_template.backend.engine.autoescape
+    )
+    return _stream_template(backend_template.template, template_context)
@@ -1,21 +1,94 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterator
 
+import logging
+import re
+
+from asgiref.local import Local
 from django import template
-from django.forms.utils import flatatt
-from django.template.base import FilterExpression, Parser, Token
+from django.conf import settings
+from django.template.backends.django import Template as DjangoTemplate
+from django.template.base import (
+    FilterExpression,
+    Parser,
+    Token,
+    VariableDoesNotExist,
+)
 from django.template.context import Context
-from django.utils.safestring import mark_safe
-
-from ..brick import BlockBrick, Brick
-from ..registry import get_registry
+from django.template.defaulttags import CycleNode, IfChangedNode
+from django.template.loader_tags import BlockNode, ExtendsNode
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeString, mark_safe
+
+from ..brick import (
+    BlockBrick,
+    Brick,
+    BrickValidationError,
+    get_validation_mode,
+    override_autoescape,
+)
+from ..cache import make_memo_key
+from ..concurrency import get_prefetched
+from ..media import get_rendered_media, get_template_media, record_brick
+from ..profiling import start_timer
+from ..registry import get_brick, get_lazy_registry, get_registry
+from ..streaming import stream_nodelist
 
 if TYPE_CHECKING:
     from django.template.base import NodeList
 
 register = template.Library()
 
+logger = logging.getLogger(__name__)
+
+# Key in the base render context dict holding memoized brick output
+MEMO_KEY = "brickastley_memo"
+
+# Nodes that rely on per-template render state and prevent inlining
+NON_INLINABLE_NODES = (ExtendsNode, BlockNode, CycleNode, IfChangedNode)
+
+# Per brick name: number of inlined tags and why other tags were not inlined
+_inline_report: dict[str, dict[str, Any]] = {}
+
+# Bricks whose templates are being compiled for inlining, in this thread
+_inlining = Local()
+
+
+# Characters escaped in attribute values, as by django.utils.html.escape()
+_HTML_ESCAPES = {
+    ord("&"): "&amp;",
+    ord("<"): "&lt;",
+    ord(">"): "&gt;",
+    ord('"'): "&quot;",
+    ord("'"): "&#x27;",
+}
+
+# HTML attribute names of kwarg names, e.g. data_id -> data-id
+_attr_names: dict[str, str] = {}
+
+
+def _attr_name(key: str) -> str:
+    """Translate a kwarg name to an escaped HTML attribute name, memoized."""
+    try:
+        return _attr_names[key]
+    except KeyError:
+        name = _attr_names[key] = str(key).replace("_", "-").translate(_HTML_ESCAPES)
+        return name
+
+
+def _attr_value(value: Any) -> str:
+    """Escape an attribute value, skipping the work for safe and numeric values."""
+    value_type = type(value)
+    if value_type is str:
+        return value.translate(_HTML_ESCAPES)
+    if value_type is SafeString or value_type is int or value_type is float:
+        return str(value)
+    if value_type is list or value_type is tuple:
+        # Class lists: drop empty and repeated entries
+        return " ".join(dict.fromkeys(_attr_value(item) for item in value if item))
+    return conditional_escape(value)
+
 
 @register.filter
 def attrs(value: dict[str, Any]) -> str:
@@ -24,7 +97,10 @@ def attrs(value: dict[str, Any]) -> str:
 
     Underscores in keys are converted to hyphens (e.g., data_id -> data-id).
     Boolean True renders as just the attribute name (e.g., disabled=True -> disabled).
-    Boolean False or None values are skipped.
+    Boolean False or None values are skipped. Lists and tuples, such as lists
+    of classes, are joined with spaces, skipping empty and repeated entries.
+
+    Attributes are sorted by name, like django.forms.utils.flatatt().
 
     Usage:
         <div{{ extra|attrs }}>
@@ -33,21 +109,33 @@ def attrs(value: dict[str, Any]) -> str:
     if not value:
         return ""
 
-    # Convert underscores to hyphens and filter out False/None values
-    converted = {}
+    rendered = []
     for key, val in value.items():
         if val is False or val is None:
             continue
-        html_key = key.replace("_", "-")
+        name = _attr_name(key)
         if val is True:
-            converted[html_key] = html_key  # e.g., disabled="disabled"
+            rendered.append((name, name))  # e.g., disabled="disabled"
         else:
-            converted[html_key] = val
+            rendered.append((name, _attr_value(val)))
+    rendered.sort()
+
+    return mark_safe("".join([f' {name}="{val}"' for name, val in rendered]))
+
 
-    return mark_safe(flatatt(converted))
+# Literal numbers in brick tags, e.g. 42, -5, 3.14 or 1e3
+_INT_RE = re.compile(r"-?[0-9]+")
+_FLOAT_RE = re.compile(
+    r"[-+]?(?:[0-9]+\.[0-9]*|\.[0-9]+|[0-9]+(?=[eE]))(?:[eE][-+]?[0-9]+)?"
+)
 
+# Literals parsed without the template engine
+_KEYWORD_LITERALS = {"True": True, "False": False, "None": None}
 
-def parse_tag_kwargs(parser: Parser, bits: list[str]) -> dict[str, Any]:
+
+def parse_tag_kwargs(
+    parser: Parser, bits: list[str], brick_class: type[Brick] | None = None
+) -> dict[str, Any]:
     """
     Parse keyword arguments from template tag bits.
 
@@ -58,45 +146,112 @@ def parse_tag_kwargs(parser: Parser, bits: list[str]) -> dict[str, Any]:
         - kwarg=42 (integers)
         - kwarg=3.14 (floats)
         - kwarg=True/False (booleans)
+
+    If a brick class is given, literals are coerced to the types of its
+    kwargs where they don't match already, e.g. ``count="3"`` for an ``int``
+    kwarg or ``date="2024-01-31"`` for a ``date`` kwarg.
     """
     kwargs: dict[str, Any] = {}
+    converters = brick_class.__brick_converters__ if brick_class else {}
 
     for bit in bits:
-        if "=" not in bit:
+        name, sep, value = bit.partition("=")
+        if not sep:
             raise template.TemplateSyntaxError(
                 f"Invalid argument '{bit}'. Arguments must be in kwarg=value format."
             )
 
-        name, value = bit.split("=", 1)
-
-        # Handle booleans
-        if value == "True":
-            kwargs[name] = True
-        elif value == "False":
-            kwargs[name] = False
-        # Handle None
-        elif value == "None":
-            kwargs[name] = None
-        # Handle integers
-        elif value.lstrip("-").isdigit():
-            kwargs[name] = int(value)
-        # Handle floats
-        elif _is_float(value):
-            kwargs[name] = float(value)
-        # Handle as filter expression (supports variables, filters, and quoted strings)
+        text = value
+        if value in _KEYWORD_LITERALS:
+            parsed = _KEYWORD_LITERALS[value]
+        elif _INT_RE.fullmatch(value):
+            parsed = int(value)
+        elif _FLOAT_RE.fullmatch(value):
+            parsed = float(value)
         else:
-            kwargs[name] = parser.compile_filter(value)
+            # Variables, filters and quoted strings
+            parsed = parser.compile_filter(value)
+            if not is_constant(parsed):
+                kwargs[name] = parsed
+                continue
+            text = parsed.var
+
+        converter = converters.get(name)
+        if converter is not None:
+            converted = converter(_constant_value(parsed), text)
+            if converted is not _constant_value(parsed):
+                parsed = converted
+        kwargs[name] = parsed
 
     return kwargs
 
 
-def _is_float(value: str) -> bool:
-    """Check if a string represents a float."""
-    try:
-        float(value)
-        return "." in value or "e" in value.lower()
-    except ValueError:
-        return False
+def is_constant(value: Any) -> bool:
+    """
+    Check if a parsed kwarg value is the same on every render.
+
+    Numbers, booleans and None are parsed into Python values already. Quoted
+    strings without filters are constant too; translated strings are not,
+    since they depend on the active language.
+    """
+    if not isinstance(value, FilterExpression):
+        return True
+    return not value.is_var and not value.filters and type(value.var) is SafeString
+
+
+def _constant_value(value: Any) -> Any:
+    """Get the value of a constant kwarg."""
+    return value.var if isinstance(value, FilterExpression) else value
+
+
+def resolve_constant_kwargs(kwargs: dict[str, Any]) -> dict[str, Any] | None:
+    """Resolve kwargs at compile time, or return None if any is not constant."""
+    if not all(is_constant(value) for value in kwargs.values()):
+        return None
+    return {key: _constant_value(value) for key, value in kwargs.items()}
+
+
+def validate_tag_kwargs(
+    brick_class: type[Brick], kwargs: dict[str, Any]
+) -> frozenset[str]:
+    """
+    Validate the kwargs of a brick tag when the template is compiled.
+
+    Missing required kwargs always raise TemplateSyntaxError. Constant kwargs
+    are type checked according to the validation mode: a mismatch raises
+    TemplateSyntaxError in strict mode and is logged once otherwise.
+
+    Returns the names of the kwargs that need no validation when the tag is
+    rendered: the constant ones checked here and those without a type check.
+    Bricks that override __init__() may supply or change kwargs themselves,
+    so nothing is checked for them.
+    """
+    if brick_class.__init__ is not Brick.__init__:
+        return frozenset()
+    brick_kwargs = brick_class.__brick_kwargs__
+    defaults = brick_class.__brick_defaults__
+    for kwarg_name in brick_kwargs:
+        if kwarg_name not in kwargs and kwarg_name not in defaults:
+            raise template.TemplateSyntaxError(
+                f"Missing required kwarg '{kwarg_name}' for brick "
+                f"'{brick_class.__name__}'"
+            )
+
+    mode = get_validation_mode()
+    validators = brick_class.__brick_validators__
+    validated = set()
+    for kwarg_name, value in kwargs.items():
+        if kwarg_name not in validators:
+            validated.add(kwarg_name)
+        elif mode != "off" and is_constant(value):
+            try:
+                brick_class._validate_kwarg(
+                    kwarg_name, _constant_value(value), mode == "strict"
+                )
+            except BrickValidationError as e:
+                raise template.TemplateSyntaxError(str(e)) from e
+            validated.add(kwarg_name)
+    return frozenset(validated)
 
 
 def resolve_kwargs(kwargs: dict[str, Any], context: Context) -> dict[str, Any]:
@@ -110,48 +265,578 @@ def resolve_kwargs(kwargs: dict[str, Any], context: Context) -> dict[str, Any]:
     return resolved
 
 
+def _shares_brick(brick_class: type[Brick]) -> bool:
+    """
+    Check if one brick instance can render a tag with constant kwargs.
+
+    Bricks overriding __init__(), get_context_data() or render() may create
+    or change their instance differently for every render, so they get a
+    fresh one each time.
+    """
+    base_class = BlockBrick if issubclass(brick_class, BlockBrick) else Brick
+    return (
+        brick_class.__init__ is Brick.__init__
+        and brick_class.get_context_data is Brick.get_context_data
+        and brick_class.render is base_class.render
+    )
+
+
+def _check_constant_brick(
+    brick_class: type[Brick], kwargs: dict[str, Any], validated: frozenset[str]
+) -> frozenset[str]:
+    """
+    Validate the constant kwargs of a brick created for every render.
+
+    Returns the kwargs that need no validation when the brick is created.
+    Bricks with a custom __init__() aren't created when the template is
+    compiled, since it may need the database or request state.
+    """
+    if brick_class.__init__ is not Brick.__init__:
+        return validated
+    brick_class._from_tag_kwargs(kwargs, validated)
+    return frozenset(kwargs)
+
+
+def _get_prefetch(
+    node: BrickNode | BlockBrickNode, context: Context
+) -> tuple[dict[str, Any] | None, Brick] | None:
+    """
+    Get the kwargs and brick whose async context data a node can use.
+
+    Returns None for bricks without aget_context_data(), that don't render
+    through their template directly, or whose kwargs don't resolve yet.
+    """
+    if not (node.brick_class.__brick_async_context__ and node.split_render):
+        return None
+    if node.brick is not None:
+        return None, node.brick
+    if node.constant_kwargs is not None:
+        return None, node.make_brick(None)
+    try:
+        kwargs = resolve_kwargs(node.kwargs, context)
+        return kwargs, node.brick_class._from_tag_kwargs(kwargs, node.validated)
+    except (BrickValidationError, TypeError, VariableDoesNotExist):
+        return None
+
+
 class BrickNode(template.Node):
-    """Template node for simple (self-closing) bricks."""
+    """
+    Template node for simple (self-closing) bricks.
+
+    Kwargs named in ``validated`` were checked when the template was compiled
+    and aren't validated again when rendering. If all kwargs are constant,
+    they are validated once when the template is compiled. The brick is
+    created then too, unless it overrides __init__(), get_context_data() or
+    render(), which may create or change the instance differently each time;
+    such bricks are created again for every render. The context of a shared
+    brick is built once as well, unless it renders through its cache.
+
+    Memoized bricks render once per distinct set of kwargs within a template
+    render; repeated tags reuse the output without validating again.
+    """
 
     def __init__(
-        self, brick_class: type[Brick], kwargs: dict[str, Any]
+        self,
+        brick_class: type[Brick],
+        kwargs: dict[str, Any],
+        validated: frozenset[str] = frozenset(),
     ) -> None:
         self.brick_class = brick_class
         self.kwargs = kwargs
+        self.validated = validated
+        self.brick: Brick | None = None
+        self.brick_context: dict[str, Any] | None = None
+        # Constant kwargs of bricks created for every render
+        self.constant_kwargs: dict[str, Any] | None = None
+        # Whether context building and rendering can be timed separately
+        self.split_render = (
+            brick_class.render is Brick.render and brick_class.cache is None
+        )
+
+        self.memo_key: tuple | None = None
+
+        constant_kwargs = resolve_constant_kwargs(kwargs)
+        if constant_kwargs is not None:
+            if brick_class.memoize:
+                self.memo_key = make_memo_key(brick_class, constant_kwargs)
+            if _shares_brick(brick_class):
+                self.brick = brick_class._from_tag_kwargs(constant_kwargs, validated)
+                if self.split_render:
+                    self.brick_context = self.brick.get_context_data()
+            else:
+                self.constant_kwargs = constant_kwargs
+                self.validated = _check_constant_brick(
+                    brick_class, constant_kwargs, validated
+                )
+
+    def get_prefetch(
+        self, context: Context
+    ) -> tuple[dict[str, Any] | None, Brick] | None:
+        """Get the kwargs and brick to load async context data for ahead."""
+        return _get_prefetch(self, context)
+
+    def make_brick(self, resolved_kwargs: dict[str, Any] | None) -> Brick:
+        """Create the brick for a render, from its constant kwargs if None."""
+        if resolved_kwargs is None:
+            resolved_kwargs = self.constant_kwargs
+        return self.brick_class._from_tag_kwargs(resolved_kwargs, self.validated)
 
     def render(self, context: Context) -> str:
-        resolved_kwargs = resolve_kwargs(self.kwargs, context)
-        brick = self.brick_class(**resolved_kwargs)
-        return mark_safe(brick.render(context=context.flatten()))
+        record_brick(context, self.brick_class)
+        timer = start_timer(self.brick_class)
+        output = None
+        try:
+            brick = self.brick
+            resolved_kwargs = None
+            if brick is None and self.constant_kwargs is None:
+                resolved_kwargs = resolve_kwargs(self.kwargs, context)
+
+            memo = memo_key = None
+            if self.brick_class.memoize:
+                memo_key = self.memo_key
+                if resolved_kwargs is not None:
+                    memo_key = make_memo_key(self.brick_class, resolved_kwargs)
+                if memo_key is not None:
+                    memo = context.render_context.dicts[0].setdefault(MEMO_KEY, {})
+                    output = memo.get(memo_key)
+                    if output is not None:
+                        timer.lap("render")
+                        return mark_safe(output)
+
+            if brick is None:
+                brick = self.make_brick(resolved_kwargs)
+            timer.lap("validation")
+
+            if self.split_render:
+                brick_context = self.brick_context
+                if brick_context is None and self.brick_class.__brick_async_context__:
+                    brick_context = get_prefetched(self, context, resolved_kwargs)
+                if brick_context is None:
+                    brick_context = brick.get_context_data()
+                timer.lap("context")
+                output = brick._render_template(brick_context, context)
+            else:
+                output = brick.render(context=context)
+            timer.lap("render")
+            if memo is not None:
+                memo[memo_key] = output
+        finally:
+            timer.finish(output)
+        return mark_safe(output)
 
 
 class BlockBrickNode(template.Node):
-    """Template node for block bricks that wrap children."""
+    """
+    Template node for block bricks that wrap children.
+
+    Kwargs named in ``validated`` were checked when the template was compiled
+    and aren't validated again when rendering. If all kwargs are constant,
+    they are validated once when the template is compiled, and the brick is
+    shared by all renders like for simple bricks.
+
+    Memoized bricks render once per distinct set of kwargs and children
+    within a template render.
+    """
 
     def __init__(
         self,
         brick_class: type[BlockBrick],
         kwargs: dict[str, Any],
         nodelist: NodeList,
+        validated: frozenset[str] = frozenset(),
     ) -> None:
         self.brick_class = brick_class
         self.kwargs = kwargs
         self.nodelist = nodelist
+        self.validated = validated
+        self.brick: BlockBrick | None = None
+        # Constant kwargs of bricks created for every render
+        self.constant_kwargs: dict[str, Any] | None = None
+        # Whether context building and rendering can be timed separately
+        self.split_render = (
+            brick_class.render is BlockBrick.render and brick_class.cache is None
+        )
+
+        self.memo_key: tuple | None = None
+
+        constant_kwargs = resolve_constant_kwargs(kwargs)
+        if constant_kwargs is not None:
+            if brick_class.memoize:
+                self.memo_key = make_memo_key(brick_class, constant_kwargs)
+            if _shares_brick(brick_class):
+                self.brick = brick_class._from_tag_kwargs(constant_kwargs, validated)
+            else:
+                self.constant_kwargs = constant_kwargs
+                self.validated = _check_constant_brick(
+                    brick_class, constant_kwargs, validated
+                )
+
+    def get_prefetch(
+        self, context: Context
+    ) -> tuple[dict[str, Any] | None, BlockBrick] | None:
+        """Get the kwargs and brick to load async context data for ahead."""
+        return _get_prefetch(self, context)
+
+    def make_brick(self, resolved_kwargs: dict[str, Any] | None) -> BlockBrick:
+        """Create the brick for a render, from its constant kwargs if None."""
+        if resolved_kwargs is None:
+            resolved_kwargs = self.constant_kwargs
+        return self.brick_class._from_tag_kwargs(resolved_kwargs, self.validated)
 
     def render(self, context: Context) -> str:
-        resolved_kwargs = resolve_kwargs(self.kwargs, context)
-        children = self.nodelist.render(context)
-        brick = self.brick_class(**resolved_kwargs)
-        return mark_safe(brick.render(children=children, context=context.flatten()))
+        record_brick(context, self.brick_class)
+        timer = start_timer(self.brick_class)
+        output = None
+        try:
+            brick = self.brick
+            resolved_kwargs = None
+            if brick is None and self.constant_kwargs is None:
+                resolved_kwargs = resolve_kwargs(self.kwargs, context)
+            timer.lap("validation")
+            children = self.nodelist.render(context)
+            timer.skip()
+
+            memo = memo_key = None
+            if self.brick_class.memoize:
+                memo_key = self.memo_key
+                if resolved_kwargs is not None:
+                    memo_key = make_memo_key(self.brick_class, resolved_kwargs)
+                if memo_key is not None:
+                    # The children are part of the output
+                    memo_key = (memo_key, children)
+                    memo = context.render_context.dicts[0].setdefault(MEMO_KEY, {})
+                    output = memo.get(memo_key)
+                    if output is not None:
+                        timer.lap("render")
+                        return mark_safe(output)
+
+            if brick is None:
+                brick = self.make_brick(resolved_kwargs)
+            timer.lap("validation")
+
+            if self.split_render:
+                brick_context = None
+                if self.brick_class.__brick_async_context__:
+                    brick_context = get_prefetched(self, context, resolved_kwargs)
+                if brick_context is None:
+                    brick_context = brick.get_context_data(children=children)
+                else:
+                    brick_context = {**brick_context, "children": children}
+                timer.lap("context")
+                output = brick._render_template(brick_context, context)
+            else:
+                output = brick.render(children=children, context=context)
+            timer.lap("render")
+            if memo is not None:
+                memo[memo_key] = output
+        finally:
+            timer.finish(output)
+        return mark_safe(output)
+
+    def stream(self, context: Context) -> Iterator[str]:
+        """Render the brick in chunks, streaming the children in between."""
+        record_brick(context, self.brick_class)
+        brick = self.brick
+        if brick is None:
+            resolved_kwargs = None
+            if self.constant_kwargs is None:
+                resolved_kwargs = resolve_kwargs(self.kwargs, context)
+            brick = self.make_brick(resolved_kwargs)
+        return brick._stream(stream_nodelist(self.nodelist, context), context)
+
+
+class InlineBrickNode(template.Node):
+    """
+    Template node for simple bricks inlined into the calling template.
+
+    The nodes of the brick template are rendered directly with the brick
+    context pushed onto the caller's context, without creating a brick
+    instance or rendering a nested template.
+    """
+
+    def __init__(
+        self,
+        brick_class: type[Brick],
+        kwargs: dict[str, Any],
+        nodelist: NodeList,
+        validated: frozenset[str] = frozenset(),
+    ) -> None:
+        self.brick_class = brick_class
+        self.kwargs = kwargs
+        self.nodelist = nodelist
+        self.validated = validated
+        self.brick_context: dict[str, Any] | None = None
+        # Brick templates escape according to their own engine
+        self.autoescape = brick_class.get_template().backend.engine.autoescape
+
+        constant_kwargs = resolve_constant_kwargs(kwargs)
+        if constant_kwargs is not None:
+            self.brick_context = brick_class._context_from_kwargs(
+                constant_kwargs, validated
+            )
+
+    def render_brick(self, brick_context: dict[str, Any], context: Context) -> str:
+        if self.brick_class.isolated:
+            context = context.new(dict(brick_context))
+            context.autoescape = self.autoescape
+            return self.nodelist.render(context)
+        with (
+            context.push(brick_context),
+            override_autoescape(context, self.autoescape),
+        ):
+            return self.nodelist.render(context)
+
+    def render(self, context: Context) -> str:
+        record_brick(context, self.brick_class)
+        timer = start_timer(self.brick_class)
+        output = None
+        try:
+            brick_context = self.brick_context
+            if brick_context is None:
+                resolved_kwargs = resolve_kwargs(self.kwargs, context)
+                brick_context = self.brick_class._context_from_kwargs(
+                    resolved_kwargs, self.validated
+                )
+            timer.lap("context")
+            output = self.render_brick(brick_context, context)
+            timer.lap("render")
+        finally:
+            timer.finish(output)
+        return output
+
+
+class InlineBlockBrickNode(InlineBrickNode):
+    """Template node for block bricks inlined into the calling template."""
+
+    child_nodelists = ("nodelist", "children_nodelist")
+
+    def __init__(
+        self,
+        brick_class: type[BlockBrick],
+        kwargs: dict[str, Any],
+        nodelist: NodeList,
+        children_nodelist: NodeList,
+        validated: frozenset[str] = frozenset(),
+    ) -> None:
+        super().__init__(brick_class, kwargs, nodelist, validated)
+        self.children_nodelist = children_nodelist
+
+    def render(self, context: Context) -> str:
+        record_brick(context, self.brick_class)
+        timer = start_timer(self.brick_class)
+        output = None
+        try:
+            if self.brick_context is None:
+                resolved_kwargs = resolve_kwargs(self.kwargs, context)
+            timer.lap("context")
+            children = self.children_nodelist.render(context)
+            timer.skip()
+            if self.brick_context is None:
+                brick_context = self.brick_class._context_from_kwargs(
+                    resolved_kwargs, self.validated, children=children
+                )
+            else:
+                brick_context = {**self.brick_context, "children": children}
+            timer.lap("context")
+            output = self.render_brick(brick_context, context)
+            timer.lap("render")
+        finally:
+            timer.finish(output)
+        return output
+
+
+class BricksForNode(template.Node):
+    """Template node rendering one brick per item of a sequence."""
+
+    def __init__(
+        self,
+        loopvar: str,
+        sequence: FilterExpression,
+        brick_class: type[Brick],
+        kwargs: dict[str, Any],
+    ) -> None:
+        self.loopvar = loopvar
+        self.sequence = sequence
+        self.brick_class = brick_class
+        self.kwargs = kwargs
+
+    def render(self, context: Context) -> str:
+        items = self.sequence.resolve(context, ignore_failures=True)
+        if not items:
+            return ""
+        items = list(items)
+        record_brick(context, self.brick_class)
+
+        # Resolve and validate the kwargs of all bricks before rendering any
+        with context.push() as layer:
+            kwargs_list = []
+            for item in items:
+                layer[self.loopvar] = item
+                kwargs_list.append(resolve_kwargs(self.kwargs, context))
+        bricks = [self.brick_class(**kwargs) for kwargs in kwargs_list]
+
+        return self.brick_class._render_batch(bricks, context, self.loopvar, items)
+
+
+@register.tag
+def bricks_for(parser: Parser, token: Token) -> BricksForNode:
+    """
+    Render a brick for each item of a sequence.
+
+    Usage:
+        {% bricks_for item in items button label=item.name %}
+
+    This renders the same output as a ``{% for %}`` loop around the brick tag,
+    but resolves the brick template once and validates all bricks up front.
+    """
+    bits = token.split_contents()
+    if len(bits) < 5 or bits[2] != "in":
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag should look like "
+            f"'{{% {bits[0]} item in items brick_name kwarg=value ... %}}'"
+        )
+    loopvar, sequence, brick_name = bits[1], bits[3], bits[4]
+    brick_class = get_brick(brick_name)
+    if brick_class is None:
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag got unknown brick '{brick_name}'"
+        )
+    kwargs = parse_tag_kwargs(parser, bits[5:], brick_class)
+    return BricksForNode(loopvar, parser.compile_filter(sequence), brick_class, kwargs)
+
+
+class BrickMediaNode(template.Node):
+    """Template node emitting the media of the bricks used by a page."""
+
+    def __init__(self, kind: str | None) -> None:
+        self.kind = kind
+
+    def render(self, context: Context) -> str:
+        media = get_rendered_media(context)
+        if context.template is not None:
+            # Bricks found in the page's templates, whether rendered yet or not
+            media = get_template_media(context.template) + media
+        if self.kind == "css":
+            return mark_safe("\n".join(media.render_css()))
+        if self.kind == "js":
+            return mark_safe("\n".join(media.render_js()))
+        return media.render()
+
+
+@register.tag
+def brick_media(parser: Parser, token: Token) -> BrickMediaNode:
+    """
+    Render the merged media of the bricks used by a page.
+
+    Usage:
+        {% brick_media %}
+        {% brick_media css %}
+        {% brick_media js %}
+
+    Bricks are found by scanning the page's templates in advance, so the tag
+    can be placed in the head. Bricks in templates that are only known while
+    rendering are included if they're rendered before the tag. Each asset is
+    included once, however many bricks use it.
+    """
+    bits = token.split_contents()
+    if len(bits) > 2 or (len(bits) == 2 and bits[1] not in ("css", "js")):
+        raise template.TemplateSyntaxError(
+            f"'{bits[0]}' tag takes an optional 'css' or 'js' argument"
+        )
+    return BrickMediaNode(bits[1] if len(bits) == 2 else None)
+
+
+def get_inline_report() -> dict[str, dict[str, Any]]:
+    """
+    Get a report of which brick tags were inlined.
+
+    Maps brick names to the number of inlined tags (``"inlined"``) and the
+    reasons tags of that brick were rendered through a regular brick node
+    instead (``"fallbacks"``).
+    """
+    return _inline_report
+
+
+def _record_inlining(brick_class: type[Brick], reason: str | None) -> None:
+    entry = _inline_report.setdefault(
+        brick_class.get_brick_name(), {"inlined": 0, "fallbacks": {}}
+    )
+    if reason is None:
+        entry["inlined"] += 1
+    else:
+        entry["fallbacks"][reason] = entry["fallbacks"].get(reason, 0) + 1
+        logger.debug("Brick '%s' not inlined: %s", brick_class.get_brick_name(), reason)
+
+
+def get_inline_nodelist(brick_class: type[Brick]) -> NodeList | None:
+    """
+    Get the compiled nodes of a brick template if the brick can be inlined.
+
+    Bricks are inlined if they opt in via ``inline = True`` (or the
+    ``BRICKASTLEY_INLINE`` setting), keep the default __init__(), render(),
+    get_context_data() and class-level get_template_name(), don't use a cache
+    or memoize and have a Django template without nodes that depend on
+    per-template render state or use the brick itself. Returns None otherwise.
+    """
+    inline = brick_class.inline
+    if inline is None:
+        inline = getattr(settings, "BRICKASTLEY_INLINE", False)
+    if not inline:
+        return None
+
+    reason = None
+    nodelist = None
+    base_class = BlockBrick if issubclass(brick_class, BlockBrick) else Brick
+    if brick_class.__init__ is not Brick.__init__:
+        reason = "custom __init__()"
+    elif brick_class.render is not base_class.render:
+        reason = "custom render()"
+    elif brick_class.get_context_data is not Brick.get_context_data:
+        reason = "custom get_context_data()"
+    elif brick_class.__brick_template_per_instance__:
+        reason = "template chosen per instance"
+    elif brick_class.cache is not None:
+        reason = "uses a cache"
+    elif brick_class.memoize:
+        reason = "memoized"
+    else:
+        compiling = getattr(_inlining, "bricks", None)
+        if compiling is None:
+            compiling = _inlining.bricks = set()
+        if brick_class in compiling:
+            # The brick's own template uses it, e.g. for a tree
+            reason = "recursive template"
+        else:
+            compiling.add(brick_class)
+            try:
+                tpl = brick_class.get_template()
+            except template.TemplateDoesNotExist:
+                reason = "template does not exist"
+            else:
+                if not isinstance(tpl, DjangoTemplate):
+                    reason = "not a Django template"
+                elif tpl.template.nodelist.get_nodes_by_type(NON_INLINABLE_NODES):
+                    reason = "template uses extends, block, cycle or ifchanged"
+                else:
+                    nodelist = tpl.template.nodelist
+            finally:
+                compiling.discard(brick_class)
+
+    _record_inlining(brick_class, reason)
+    return nodelist
 
 
 def create_simple_tag(brick_class: type[Brick]):
     """Create a simple tag function for a brick."""
 
-    def tag_func(parser: Parser, token: Token) -> BrickNode:
+    def tag_func(parser: Parser, token: Token) -> template.Node:
         bits = token.split_contents()[1:]  # Skip the tag name
-        kwargs = parse_tag_kwargs(parser, bits)
-        return BrickNode(brick_class, kwargs)
+        kwargs = parse_tag_kwargs(parser, bits, brick_class)
+        validated = validate_tag_kwargs(brick_class, kwargs)
+        inline_nodelist = get_inline_nodelist(brick_class)
+        if inline_nodelist is not None:
+            return InlineBrickNode(brick_class, kwargs, inline_nodelist, validated)
+        return BrickNode(brick_class, kwargs, validated)
 
     return tag_func
 
@@ -161,12 +846,43 @@ def create_block_tag(brick_class: type[BlockBrick]):
     tag_name = brick_class.get_brick_name()
     end_tag = f"end{tag_name}"
 
-    def tag_func(parser: Parser, token: Token) -> BlockBrickNode:
+    def tag_func(parser: Parser, token: Token) -> template.Node:
         bits = token.split_contents()[1:]  # Skip the tag name
-        kwargs = parse_tag_kwargs(parser, bits)
+        kwargs = parse_tag_kwargs(parser, bits, brick_class)
+        validated = validate_tag_kwargs(brick_class, kwargs)
         nodelist = parser.parse((end_tag,))
         parser.delete_first_token()  # Remove the end tag
-        return BlockBrickNode(brick_class, kwargs, nodelist)
+        inline_nodelist = get_inline_nodelist(brick_class)
+        if inline_nodelist is not None:
+            return InlineBlockBrickNode(
+                brick_class, kwargs, inline_nodelist, nodelist, validated
+            )
+        return BlockBrickNode(brick_class, kwargs, nodelist, validated)
+
+    return tag_func
+
+
+def create_lazy_tag(name: str):
+    """
+    Create a tag function for a brick that hasn't been imported yet.
+
+    The brick's module is imported when the tag is first parsed. The tag then
+    replaces itself with the regular tag function of the brick.
+    """
+
+    def tag_func(parser: Parser, token: Token) -> template.Node:
+        brick_class = get_brick(name)
+        if brick_class is None:
+            raise template.TemplateSyntaxError(
+                f"Brick '{name}' was not registered by "
+                f"'{get_lazy_registry().get(name)}'"
+            )
+        if issubclass(brick_class, BlockBrick):
+            brick_tag_func = create_block_tag(brick_class)
+        else:
+            brick_tag_func = create_simple_tag(brick_class)
+        register.tags[name] = brick_tag_func
+        return brick_tag_func(parser, token)
 
     return tag_func
 
@@ -188,6 +904,10 @@ def register_brick_tags() -> None:
         # Register the tag with Django's template library
         register.tag(name, tag_func)
 
+    for name in get_lazy_registry():
+        if name not in register.tags:
+            register.tag(name, create_lazy_tag(name))
+
 
 # Note: We don't call register_brick_tags() here at import time
 # because autodiscovery may not have run yet. Instead, we register
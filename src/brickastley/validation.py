@@ -0,0 +1,295 @@
+from __future__ import annotations
+
+import collections.abc
+import datetime
+import decimal
+import enum
+import functools
+import itertools
+import random
+import types
+import typing
+from typing import Any, Callable, Iterable
+
+from asgiref.local import Local
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import request_finished
+from django.dispatch import receiver
+from django.utils.functional import Promise
+
+# typing.Union and, on Python 3.10+, the X | Y union type
+_UNION_ORIGINS = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+# Values accepted by the BRICKASTLEY_CONTAINER_VALIDATION setting
+CONTAINER_STRATEGIES = ("first", "sample", "full", "cached")
+
+# Containers whose single type argument applies to every item
+_ITEM_ORIGINS = (
+    list,
+    set,
+    frozenset,
+    collections.abc.Sequence,
+    collections.abc.MutableSequence,
+    collections.abc.Set,
+    collections.abc.MutableSet,
+    collections.abc.Collection,
+    collections.abc.Iterable,
+)
+
+# Containers whose two type arguments apply to keys and values
+_MAPPING_ORIGINS = (
+    dict,
+    collections.abc.Mapping,
+    collections.abc.MutableMapping,
+)
+
+# Containers validated in the current request by the "cached" strategy,
+# keyed by object id and checker. The objects are kept alive so that their
+# ids aren't reused before the cache is cleared.
+_validated = Local()
+
+# Most containers remembered by the "cached" strategy. Outside of requests,
+# e.g. in management commands, the cache is only ever cleared at this size.
+MAX_CACHED_CONTAINERS = 1000
+
+Check = Callable[[Any], bool]
+
+
+@functools.lru_cache(maxsize=None)
+def get_container_validation() -> tuple[str, int]:
+    """
+    Get the configured strategy and size for validating container items.
+
+    ``BRICKASTLEY_CONTAINER_VALIDATION`` defaults to ``"first"``, checking the
+    first ``BRICKASTLEY_CONTAINER_SAMPLE_SIZE`` (default 10) items.
+    """
+    strategy = getattr(settings, "BRICKASTLEY_CONTAINER_VALIDATION", "first")
+    if strategy not in CONTAINER_STRATEGIES:
+        raise ImproperlyConfigured(
+            "BRICKASTLEY_CONTAINER_VALIDATION must be one of "
+            f"{', '.join(CONTAINER_STRATEGIES)}, got {strategy!r}"
+        )
+    return strategy, getattr(settings, "BRICKASTLEY_CONTAINER_SAMPLE_SIZE", 10)
+
+
+@receiver(request_finished, dispatch_uid="brickastley_clear_validated")
+def clear_validated_containers(**kwargs: Any) -> None:
+    """Forget the containers validated during the request that finished."""
+    _validated.containers = {}
+
+
+def _select(items: Any, strategy: str, size: int) -> Iterable[Any]:
+    """Get the items of a container to check for the given strategy."""
+    if strategy == "first":
+        return itertools.islice(items, size)
+    if strategy == "sample":
+        if not isinstance(items, collections.abc.Sequence):
+            # Sets and mappings can't be sampled without copying them
+            return itertools.islice(items, size)
+        if len(items) <= size:
+            return items
+        return [items[index] for index in random.sample(range(len(items)), size)]
+    return items
+
+
+def _class_check(expected_class: type) -> Check:
+    """Compile an isinstance check, accepting lazy strings for str."""
+    if expected_class is str:
+        return lambda value: isinstance(value, str) or (
+            isinstance(value, Promise) and hasattr(value, "upper")
+        )
+    return lambda value: isinstance(value, expected_class)
+
+
+def compile_check(expected_type: Any) -> Check | None:
+    """
+    Compile a predicate checking a value against a type hint, items included.
+
+    Items of lists, sets, dicts and tuples are checked according to the
+    container validation strategy at the time of the check. Returns None for
+    ``Any``, meaning every value matches.
+    """
+    if expected_type is Any:
+        return None
+    if expected_type is None or expected_type is type(None):
+        return lambda value: value is None
+
+    origin = typing.get_origin(expected_type)
+    args = typing.get_args(expected_type)
+
+    if origin in _UNION_ORIGINS:
+        checks = []
+        for arg in args:
+            check = compile_check(arg)
+            if check is None:
+                return None
+            checks.append(check)
+        return lambda value: any(check(value) for check in checks)
+
+    if origin is None:
+        if isinstance(expected_type, type):
+            return _class_check(expected_type)
+        return None
+
+    if not isinstance(origin, type):
+        # Literal, Callable and other special forms aren't checked
+        return None
+    is_origin = _class_check(origin)
+
+    if origin is tuple and args:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return _items_check(is_origin, compile_check(args[0]))
+        item_checks = [compile_check(arg) for arg in args]
+        return lambda value: (
+            is_origin(value)
+            and len(value) == len(item_checks)
+            and all(
+                check is None or check(item) for check, item in zip(item_checks, value)
+            )
+        )
+    if origin in _ITEM_ORIGINS and len(args) == 1:
+        return _items_check(is_origin, compile_check(args[0]))
+    if origin in _MAPPING_ORIGINS and len(args) == 2:
+        return _mapping_check(is_origin, compile_check(args[0]), compile_check(args[1]))
+    return is_origin
+
+
+def _items_check(is_origin: Check, item_check: Check | None) -> Check:
+    """Compile a check for a container and the type of its items."""
+    if item_check is None:
+        return is_origin
+
+    def check(value: Any) -> bool:
+        if not is_origin(value):
+            return False
+        if iter(value) is value:
+            # Iterators and generators would be used up by checking them
+            return True
+        strategy, size = get_container_validation()
+        return all(item_check(item) for item in _select(value, strategy, size))
+
+    return check
+
+
+def _mapping_check(
+    is_origin: Check, key_check: Check | None, value_check: Check | None
+) -> Check:
+    """Compile a check for a mapping and the types of its keys and values."""
+    if key_check is None and value_check is None:
+        return is_origin
+
+    def check(value: Any) -> bool:
+        if not is_origin(value):
+            return False
+        strategy, size = get_container_validation()
+        for key in _select(value, strategy, size):
+            if key_check is not None and not key_check(key):
+                return False
+            if value_check is not None and not value_check(value[key]):
+                return False
+        return True
+
+    return check
+
+
+def compile_container_check(expected_type: Any) -> Check | None:
+    """
+    Compile the item check of a kwarg's type hint.
+
+    Returns None if the type hint has no container with typed items, so the
+    isinstance check of the kwarg's validator is all there is to do. With the
+    "cached" strategy a container passing the check isn't checked again until
+    the current request finishes, or until MAX_CACHED_CONTAINERS containers
+    have been remembered.
+    """
+    if not _has_item_types(expected_type):
+        return None
+    check = compile_check(expected_type)
+    if check is None:
+        return None
+
+    def container_check(value: Any) -> bool:
+        if get_container_validation()[0] != "cached":
+            return check(value)
+        containers = getattr(_validated, "containers", None)
+        if containers is None:
+            containers = _validated.containers = {}
+        key = (id(value), check)
+        if containers.get(key) is value:
+            return True
+        if not check(value):
+            return False
+        if len(containers) >= MAX_CACHED_CONTAINERS:
+            containers.clear()
+        containers[key] = value
+        return True
+
+    return container_check
+
+
+def _has_item_types(expected_type: Any) -> bool:
+    """Check if a type hint constrains the items of a container anywhere."""
+    origin = typing.get_origin(expected_type)
+    args = typing.get_args(expected_type)
+    if origin in _UNION_ORIGINS:
+        return any(_has_item_types(arg) for arg in args)
+    return origin is not None and isinstance(origin, type) and bool(args)
+
+
+def _member_converter(member: Any) -> Callable[[str], Any] | None:
+    """Get a function converting literal text to a type, if it has one."""
+    if not isinstance(member, type) or member is bool:
+        return None
+    if issubclass(member, enum.Enum):
+        # Members by name, or by the text of their value
+        members = {str(item.value): item for item in member}
+        members.update(member.__members__)
+        return members.__getitem__
+    if issubclass(member, decimal.Decimal):
+        return member
+    if issubclass(member, (int, float)):
+        return member
+    # datetime is a subclass of date, so it's checked first
+    for temporal in (datetime.datetime, datetime.date, datetime.time):
+        if issubclass(member, temporal):
+            return temporal.fromisoformat
+    return None
+
+
+def compile_literal_converter(expected_type: Any) -> Callable[[Any, str], Any] | None:
+    """
+    Compile a function coercing a template literal to a kwarg's type.
+
+    The returned function takes the value a literal was parsed into and the
+    literal's text. Values that already match the type hint are returned as
+    they are; others are converted from the text for ``int``, ``float``,
+    ``Decimal``, enum, ``date``, ``datetime`` and ``time`` hints, trying the
+    members of unions in order. Values that can't be converted are returned
+    unchanged and left to validation. Returns None for type hints without
+    such a conversion.
+    """
+    if typing.get_origin(expected_type) in _UNION_ORIGINS:
+        members = typing.get_args(expected_type)
+    else:
+        members = (expected_type,)
+    converters = [
+        converter
+        for converter in map(_member_converter, members)
+        if converter is not None
+    ]
+    if not converters:
+        return None
+    check = compile_check(expected_type)
+
+    def convert(value: Any, text: str) -> Any:
+        if check is None or check(value):
+            return value
+        for converter in converters:
+            try:
+                return converter(text)
+            except (ValueError, KeyError, ArithmeticError):
+                continue
+        return value
+
+    return convert
@@ -0,0 +1,17 @@
+"""Bricks module used to test lazy registration."""
+
+from brickastley import Brick, register
+
+
+@register
+class LazyButton(Brick):
+    label: str
+    variant: str = "primary"
+    template_name = "bricks/test_button.html"
+
+
+@register(name="lazy_link")
+class LazyLink(Brick):
+    label: str
+    variant: str = "link"
+    template_name = "bricks/test_button.html"
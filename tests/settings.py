@@ -2,6 +2,10 @@
 Django settings for testing brickastley package.
 """
 
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+
 SECRET_KEY = "test-secret-key-for-brickastley"
 
 DEBUG = True
@@ -38,7 +42,7 @@ DATABASES = {
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
-        "DIRS": [],
+        "DIRS": [BASE_DIR / "templates"],
         "APP_DIRS": True,
         "OPTIONS": {
             "context_processors": [
@@ -201,6 +201,322 @@ class TestTypeValidation:
         brick3 = MyBrick(value=None)
         assert brick3.value is None
 
+    def test_union_type_mismatch(self, settings):
+        """Values matching none of the union members are rejected."""
+        settings.DEBUG = True
+
+        class MyBrick(Brick):
+            value: str | int
+
+        with pytest.raises(BrickValidationError) as exc_info:
+            MyBrick(value=1.5)
+
+        assert "expected str | int, got float" in str(exc_info.value)
+
+    def test_none_for_non_optional_kwarg(self, settings):
+        """None is rejected for kwargs that are not optional."""
+        settings.DEBUG = True
+
+        class MyBrick(Brick):
+            name: str
+
+        with pytest.raises(BrickValidationError) as exc_info:
+            MyBrick(name=None)
+
+        assert "received None but is not optional" in str(exc_info.value)
+
+    def test_generic_type_checks_origin(self, settings):
+        """Generic types validate against their origin type."""
+        settings.DEBUG = True
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        assert MyBrick(items=[1, 2]).items == [1, 2]
+
+        with pytest.raises(BrickValidationError):
+            MyBrick(items=(1, 2))
+
+    def test_lazy_string_accepted_for_str(self):
+        """Lazy translation strings are accepted for str kwargs."""
+        from django.utils.translation import gettext_lazy
+
+        class MyBrick(Brick):
+            label: str | None = None
+
+        brick = MyBrick(label=gettext_lazy("Hello"))
+        assert str(brick.label) == "Hello"
+
+
+class TestValidationModes:
+    """Tests for the BRICKASTLEY_VALIDATION setting."""
+
+    def test_default_mode_follows_debug(self, settings):
+        """Without the setting, DEBUG selects strict or warn."""
+        from brickastley.brick import get_validation_mode
+
+        settings.DEBUG = True
+        assert get_validation_mode() == "strict"
+        settings.DEBUG = False
+        assert get_validation_mode() == "warn"
+
+    def test_invalid_mode_raises(self, settings):
+        """Unknown modes are reported as a configuration error."""
+        from django.core.exceptions import ImproperlyConfigured
+
+        settings.BRICKASTLEY_VALIDATION = "lenient"
+
+        class MyBrick(Brick):
+            count: int
+
+        with pytest.raises(ImproperlyConfigured):
+            MyBrick(count=1)
+
+    def test_strict_raises_without_debug(self, settings):
+        """strict raises on type mismatches regardless of DEBUG."""
+        settings.DEBUG = False
+        settings.BRICKASTLEY_VALIDATION = "strict"
+
+        class MyBrick(Brick):
+            count: int
+
+        with pytest.raises(BrickValidationError):
+            MyBrick(count="not an int")
+
+    def test_warn_logs_in_debug(self, settings, caplog):
+        """warn only logs type mismatches, even in DEBUG."""
+        settings.DEBUG = True
+        settings.BRICKASTLEY_VALIDATION = "warn"
+
+        class MyBrick(Brick):
+            count: int
+
+        assert MyBrick(count="not an int").count == "not an int"
+        assert "Type validation failed" in caplog.text
+
+    def test_off_skips_type_checks(self, settings, caplog):
+        """off sets kwargs without validating their types."""
+        settings.BRICKASTLEY_VALIDATION = "off"
+
+        class MyBrick(Brick):
+            count: int
+            color: str = "blue"
+
+        brick = MyBrick(count="not an int")
+        assert brick.count == "not an int"
+        assert brick.color == "blue"
+        assert caplog.text == ""
+
+    def test_off_still_requires_kwargs(self, settings):
+        """off still reports missing required kwargs."""
+        settings.BRICKASTLEY_VALIDATION = "off"
+
+        class MyBrick(Brick):
+            name: str
+
+        with pytest.raises(BrickValidationError) as exc_info:
+            MyBrick()
+
+        assert "Missing required kwarg 'name' for brick 'MyBrick'" in str(
+            exc_info.value
+        )
+
+    def test_off_collects_extra_and_attrs(self, settings):
+        """off splits extra kwargs and HTML attributes like the validating path."""
+        settings.BRICKASTLEY_VALIDATION = "off"
+
+        class MyBrick(Brick):
+            name: str
+            title: str = ""
+
+        brick = MyBrick(**{"name": "test", "class": "c", "title": "T", "data_id": "1"})
+        assert brick.title == "T"
+        assert brick.attrs == {"class": "c"}
+        assert brick.extra == {"data_id": "1"}
+
+    def test_sample_validates_one_in_n(self, settings, caplog):
+        """sample validates every Nth instantiation per brick class."""
+        settings.BRICKASTLEY_VALIDATION = "sample"
+        settings.BRICKASTLEY_VALIDATION_SAMPLE_RATE = 3
+
+        class MyBrick(Brick):
+            count: int
+
+        for _ in range(6):
+            MyBrick(count="not an int")
+
+        assert caplog.text.count("Type validation failed") == 2
+
+
+class TestContainerValidation:
+    """Tests for validating the items of container kwargs."""
+
+    @pytest.fixture(autouse=True)
+    def strict(self, settings):
+        settings.BRICKASTLEY_VALIDATION = "strict"
+
+    def test_list_items_checked(self):
+        """Items of typed lists are validated, not just the list type."""
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        assert MyBrick(items=[1, 2]).items == [1, 2]
+        with pytest.raises(BrickValidationError, match="items of another type"):
+            MyBrick(items=[1, "2"])
+
+    def test_dict_keys_and_values_checked(self):
+        """Keys and values of typed dicts are validated, nested types too."""
+
+        class MyBrick(Brick):
+            groups: dict[str, list[int]]
+
+        MyBrick(groups={"a": [1], "b": []})
+        with pytest.raises(BrickValidationError):
+            MyBrick(groups={"a": ["1"]})
+        with pytest.raises(BrickValidationError):
+            MyBrick(groups={1: [1]})
+
+    def test_optional_and_tuple_items(self):
+        """Unions and tuples of typed items are validated per member."""
+
+        class MyBrick(Brick):
+            pairs: tuple[str, int] | None = None
+            tags: tuple[str, ...] | list[str] = ()
+
+        MyBrick(pairs=("a", 1), tags=["x"])
+        MyBrick(pairs=None, tags=("x", "y"))
+        with pytest.raises(BrickValidationError):
+            MyBrick(pairs=("a", "b"))
+        with pytest.raises(BrickValidationError):
+            MyBrick(tags=("x", 1))
+
+    def test_first_strategy_checks_leading_items(self, settings):
+        """The default strategy only checks the first items."""
+        settings.BRICKASTLEY_CONTAINER_SAMPLE_SIZE = 3
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        MyBrick(items=[1, 2, 3, "4"])
+        with pytest.raises(BrickValidationError):
+            MyBrick(items=[1, 2, "3", 4])
+
+    def test_full_strategy_checks_all_items(self, settings):
+        """The full strategy checks every item."""
+        settings.BRICKASTLEY_CONTAINER_VALIDATION = "full"
+        settings.BRICKASTLEY_CONTAINER_SAMPLE_SIZE = 3
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        with pytest.raises(BrickValidationError):
+            MyBrick(items=[1, 2, 3, "4"])
+
+    def test_sample_strategy_checks_random_items(self, settings):
+        """The sample strategy checks a bounded random selection of items."""
+        from unittest import mock
+
+        settings.BRICKASTLEY_CONTAINER_VALIDATION = "sample"
+        settings.BRICKASTLEY_CONTAINER_SAMPLE_SIZE = 2
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        items = [1, 2, 3, "4"]
+        with mock.patch("random.sample", return_value=[0, 1]):
+            MyBrick(items=items)
+        with mock.patch("random.sample", return_value=[1, 3]):
+            with pytest.raises(BrickValidationError):
+                MyBrick(items=items)
+
+    def test_cached_strategy_checks_once_per_request(self, settings):
+        """The cached strategy checks each container once per request."""
+        from brickastley.validation import clear_validated_containers
+
+        settings.BRICKASTLEY_CONTAINER_VALIDATION = "cached"
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        items = [1, 2]
+        MyBrick(items=items)
+        items.append("3")
+        # The same list isn't checked again within the request
+        MyBrick(items=items)
+
+        clear_validated_containers()
+        with pytest.raises(BrickValidationError):
+            MyBrick(items=items)
+
+    def test_iterators_not_consumed(self):
+        """Items of iterators and generators aren't checked."""
+        from typing import Iterable
+
+        class MyBrick(Brick):
+            items: Iterable[int]
+
+        brick = MyBrick(items=(n for n in range(20)))
+        assert list(brick.items) == list(range(20))
+        with pytest.raises(BrickValidationError):
+            MyBrick(items=["1"])
+
+    def test_cached_strategy_is_bounded(self, settings, monkeypatch):
+        """The cached strategy forgets containers beyond its limit."""
+        from brickastley import validation
+
+        settings.BRICKASTLEY_CONTAINER_VALIDATION = "cached"
+        monkeypatch.setattr(validation, "MAX_CACHED_CONTAINERS", 2)
+        validation.clear_validated_containers()
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        lists = [[1], [2], [3]]
+        for items in lists:
+            MyBrick(items=items)
+        assert len(validation._validated.containers) == 1
+
+        # The first list was forgotten, so it's checked again
+        lists[0].append("x")
+        with pytest.raises(BrickValidationError):
+            MyBrick(items=lists[0])
+
+    def test_invalid_strategy_raises(self, settings):
+        """Unknown strategies are reported as a configuration error."""
+        from django.core.exceptions import ImproperlyConfigured
+
+        settings.BRICKASTLEY_CONTAINER_VALIDATION = "some"
+
+        class MyBrick(Brick):
+            items: list[int]
+
+        with pytest.raises(ImproperlyConfigured):
+            MyBrick(items=[1])
+
+
+class TestCompiledValidators:
+    """Tests for validators compiled by the metaclass."""
+
+    def test_validators_compiled_per_kwarg(self):
+        """Each typed kwarg gets a compiled validator."""
+
+        class MyBrick(Brick):
+            name: str
+            count: int = 0
+
+        assert set(MyBrick.__brick_validators__) == {"name", "count"}
+
+    def test_any_kwarg_has_no_validator(self):
+        """Any-typed kwargs are skipped entirely."""
+        from typing import Any
+
+        class MyBrick(Brick):
+            payload: Any
+
+        assert "payload" not in MyBrick.__brick_validators__
+        assert MyBrick(payload=object()).payload is not None
+
 
 class TestBrickNaming:
     """Tests for brick name derivation."""
@@ -247,6 +563,45 @@ class TestBrickNaming:
 
         assert MyButton.get_template_name() == "custom/button.html"
 
+    def test_registered_name_overrides_default(self):
+        """A name given to register() is used, the template name is not affected."""
+        from brickastley import register
+        from brickastley.registry import clear_registry
+
+        @register(name="registered_button")
+        class MyButton(Brick):
+            label: str
+
+        clear_registry()
+        assert MyButton.get_brick_name() == "registered_button"
+        assert MyButton.get_template_name() == "bricks/my_button.html"
+
+    def test_names_resolved_once_per_class(self, monkeypatch):
+        """Default names are derived when the class is created, not per call."""
+        from brickastley import brick
+
+        class MyButton(Brick):
+            label: str
+
+        def fail(name):
+            raise AssertionError("name converted again")
+
+        monkeypatch.setattr(brick, "_camel_to_snake", fail)
+        assert MyButton.get_brick_name() == "my_button"
+        assert MyButton.get_template_name() == "bricks/my_button.html"
+
+    def test_subclass_gets_own_default_names(self):
+        """Subclasses derive default names from their own class name."""
+
+        class MyButton(Brick):
+            label: str
+
+        class IconButton(MyButton):
+            icon: str
+
+        assert IconButton.get_brick_name() == "icon_button"
+        assert IconButton.get_template_name() == "bricks/icon_button.html"
+
 
 class TestContextData:
     """Tests for context data generation."""
@@ -305,6 +660,61 @@ class TestContextData:
         assert context["extra"] == {}
 
 
+class TestRenderMany:
+    """Tests for Brick.render_many."""
+
+    def test_render_many_matches_single_renders(self):
+        """render_many() output equals rendering each brick on its own."""
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        kwargs_list = [
+            {"label": "One"},
+            {"label": "Two", "variant": "danger"},
+            {"label": "<b>", "data_id": "3"},
+        ]
+        expected = "".join(TestButton(**kw).render() for kw in kwargs_list)
+        assert TestButton.render_many(kwargs_list) == expected
+
+    def test_render_many_validates_before_rendering(self, settings):
+        """All bricks are validated before any of them is rendered."""
+        settings.DEBUG = True
+        rendered = []
+
+        class TestButton(Brick):
+            label: str
+
+            def get_context_data(self, **kwargs):
+                rendered.append(self.label)
+                return super().get_context_data(**kwargs)
+
+        with pytest.raises(BrickValidationError):
+            TestButton.render_many([{"label": "One"}, {"label": 2}])
+        assert rendered == []
+
+    def test_render_many_with_parent_context(self):
+        """Bricks see the parent context and don't leak into it."""
+        from django.template import Context
+
+        class TestContext(Brick):
+            label: str
+
+        context = Context({"parent_var": "x"})
+        result = TestContext.render_many([{"label": "A"}, {"label": "B"}], context)
+        assert result == "A|xB|x"
+        assert "label" not in context
+
+    def test_render_many_empty(self):
+        """Rendering no bricks returns an empty string."""
+
+        class TestButton(Brick):
+            label: str
+
+        assert TestButton.render_many([]) == ""
+
+
 class TestBlockBrick:
     """Tests for BlockBrick."""
 
@@ -336,6 +746,253 @@ class TestBlockBrick:
         assert hasattr(card, "render")
 
 
+class TestSlots:
+    """Tests for __slots__ generated by the metaclass."""
+
+    def test_slots_generated_from_kwargs(self):
+        """slots=True generates __slots__ for the brick kwargs."""
+
+        class MyBrick(Brick, slots=True):
+            name: str
+            color: str = "blue"
+
+        assert MyBrick.__slots__ == ("name", "color")
+        brick = MyBrick(name="test")
+        assert not hasattr(brick, "__dict__")
+        assert brick.name == "test"
+        assert brick.color == "blue"
+
+    def test_slotted_defaults_still_collected(self):
+        """Defaults of slotted bricks are still known to the metaclass."""
+
+        class MyBrick(Brick, slots=True):
+            name: str
+            color: str = "blue"
+
+        assert MyBrick.__brick_defaults__ == {"color": "blue"}
+        assert MyBrick(name="test").get_context_data()["color"] == "blue"
+
+    def test_slotted_brick_inheritance(self):
+        """Subclasses of slotted bricks only add slots for new kwargs."""
+
+        class BaseBrick(Brick, slots=True):
+            name: str
+            color: str = "blue"
+
+        class ChildBrick(BaseBrick, slots=True):
+            size: int = 1
+
+        assert ChildBrick.__slots__ == ("size",)
+        assert ChildBrick.__brick_defaults__ == {"color": "blue", "size": 1}
+        brick = ChildBrick(name="test", color="red")
+        assert not hasattr(brick, "__dict__")
+        assert (brick.name, brick.color, brick.size) == ("test", "red", 1)
+
+    def test_slotted_brick_can_override_parent_default(self):
+        """A subclass can change the default of an inherited slotted kwarg."""
+
+        class BaseBrick(Brick, slots=True):
+            color: str = "blue"
+
+        class ChildBrick(BaseBrick, slots=True):
+            color: str = "red"
+
+        assert ChildBrick().color == "red"
+        assert ChildBrick(color="green").color == "green"
+
+    def test_slotted_brick_supports_super(self):
+        """Methods using super() keep working after the class is re-created."""
+
+        class MyBrick(Brick, slots=True):
+            name: str
+
+            def get_context_data(self, **kwargs):
+                context = super().get_context_data(**kwargs)
+                context["upper"] = self.name.upper()
+                return context
+
+        assert MyBrick(name="test").get_context_data()["upper"] == "TEST"
+
+    def test_slots_from_setting(self, settings):
+        """BRICKASTLEY_SLOTS enables slots for all bricks."""
+        settings.BRICKASTLEY_SLOTS = True
+
+        class MyBrick(Brick):
+            name: str
+
+        assert MyBrick.__slots__ == ("name",)
+
+    def test_slots_opt_out(self, settings):
+        """slots=False opts out even when the setting is enabled."""
+        settings.BRICKASTLEY_SLOTS = True
+
+        class MyBrick(Brick, slots=False):
+            name: str
+
+        assert hasattr(MyBrick(name="test"), "__dict__")
+
+    def test_no_slots_by_default(self):
+        """Bricks keep a __dict__ unless slots are enabled."""
+
+        class MyBrick(Brick):
+            name: str
+
+        brick = MyBrick(name="test")
+        brick.custom = "value"
+        assert brick.custom == "value"
+
+
+class TestTemplateCache:
+    """Tests for per-class template caching."""
+
+    @pytest.fixture(autouse=True)
+    def clean_template_cache(self):
+        from brickastley.brick import clear_template_cache
+
+        clear_template_cache()
+        yield
+        clear_template_cache()
+
+    def test_template_resolved_once(self, monkeypatch):
+        """The loader is only consulted on the first render."""
+        from django.template import loader
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        calls = []
+        original = loader.get_template
+
+        def counting_get_template(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(loader, "get_template", counting_get_template)
+
+        assert TestButton(label="One").render() == (
+            '<button class="btn btn-primary">One</button>'
+        )
+        TestButton(label="Two").render()
+
+        assert len(calls) == 1
+
+    def test_using_selects_engine(self, settings):
+        """Bricks load their template from the engine named by using."""
+        engine = {**settings.TEMPLATES[0], "NAME": "bricks", "APP_DIRS": False}
+        settings.TEMPLATES = [*settings.TEMPLATES, engine]
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            using = "bricks"
+
+        assert "using" not in TestButton.__brick_kwargs__
+        assert TestButton.get_template().backend.name == "bricks"
+        assert TestButton(label="One").render() == (
+            '<button class="btn btn-primary">One</button>'
+        )
+
+    def test_dict_context_skips_make_context(self, monkeypatch):
+        """Dict contexts are wrapped once, not by the backend template."""
+        from django.template.backends import django as django_backend
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        def fail(*args, **kwargs):
+            raise AssertionError("make_context() called")
+
+        monkeypatch.setattr(django_backend, "make_context", fail)
+        assert TestButton(label="One").render({"request": None}) == (
+            '<button class="btn btn-primary">One</button>'
+        )
+
+    def test_dict_context_follows_engine_autoescape(self, settings):
+        """Contexts created for dict renders use the engine's autoescape."""
+        engine = {**settings.TEMPLATES[0]}
+        engine["OPTIONS"] = {**engine["OPTIONS"], "autoescape": False}
+        settings.TEMPLATES = [engine]
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        assert TestButton(label="<b>").render() == (
+            '<button class="btn btn-primary"><b></button>'
+        )
+
+    def test_template_cached_per_class(self):
+        """Each brick class has its own cached template."""
+
+        class TestButton(Brick):
+            label: str
+
+        class TestCard(BlockBrick):
+            title: str
+
+        assert TestButton.get_template() is TestButton.get_template()
+        assert TestButton.get_template() is not TestCard.get_template()
+
+    def test_clear_template_cache(self):
+        """Clearing the cache forces templates to be loaded again."""
+        from brickastley.brick import clear_template_cache
+
+        class TestButton(Brick):
+            label: str
+
+        tpl = TestButton.get_template()
+        clear_template_cache()
+
+        assert TestButton.get_template() is not tpl
+
+    def test_template_file_change_clears_cache(self):
+        """Changing a template file during development clears the cache."""
+        from pathlib import Path
+
+        from django.utils.autoreload import file_changed
+
+        class TestButton(Brick):
+            label: str
+
+        tpl = TestButton.get_template()
+        file_changed.send(sender=None, file_path=Path("bricks/test_button.html"))
+
+        assert TestButton.get_template() is not tpl
+
+    def test_instance_template_name(self):
+        """get_template_name() can pick the template per brick instance."""
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+            def get_template_name(self):
+                if self.label == "A":
+                    return "bricks/test_context.html"
+                return "bricks/test_button.html"
+
+        assert TestButton(label="A").render({"parent_var": "P"}) == "A|P"
+        assert TestButton(label="B").render() == (
+            '<button class="btn btn-primary">B</button>'
+        )
+        assert TestButton.render_many([{"label": "A"}, {"label": "B"}]) == (
+            'A|<button class="btn btn-primary">B</button>'
+        )
+
+    def test_block_brick_renders_cached_template(self):
+        """BlockBrick renders through the cached template with children."""
+
+        from django.utils.safestring import mark_safe
+
+        class TestCard(BlockBrick):
+            title: str
+
+        result = TestCard(title="Hello").render(children=mark_safe("<p>Body</p>"))
+        assert result == '<div class="card"><h2>Hello</h2><p>Body</p></div>'
+
+
 class TestMedia:
     """Tests for Media class support."""
 
@@ -0,0 +1,200 @@
+import pytest
+from django.template import Context
+from django.utils.safestring import mark_safe
+
+from brickastley import BlockBrick, Brick, BrickCache
+from brickastley.cache import make_cache_key
+
+
+@pytest.fixture(autouse=True)
+def clear_default_cache():
+    """Clear the default Django cache before and after each test."""
+    from django.core.cache import caches
+
+    caches["default"].clear()
+    yield
+    caches["default"].clear()
+
+
+class TestBrickCache:
+    """Tests for the BrickCache store."""
+
+    def test_get_missing_counts_miss(self):
+        """Looking up a missing key counts as a miss."""
+        cache = BrickCache()
+
+        assert cache.get("missing") is None
+        assert cache.cache_info().misses == 1
+
+    def test_set_and_get_counts_hit(self):
+        """Looking up a stored key counts as a hit."""
+        cache = BrickCache()
+        cache.set("key", "<b>html</b>")
+
+        assert cache.get("key") == "<b>html</b>"
+        assert cache.cache_info() == (1, 0, 256, 1)
+
+    def test_lru_eviction(self):
+        """The least recently used fragment is evicted beyond maxsize."""
+        cache = BrickCache(maxsize=2)
+        cache.set("a", "A")
+        cache.set("b", "B")
+        cache.get("a")
+        cache.set("c", "C")
+
+        assert cache.get("a") == "A"
+        assert cache.get("b") is None
+        assert cache.get("c") == "C"
+
+    def test_timeout(self, monkeypatch):
+        """Fragments expire after the timeout."""
+        import brickastley.cache
+
+        now = [1000.0]
+        monkeypatch.setattr(brickastley.cache.time, "monotonic", lambda: now[0])
+
+        cache = BrickCache(timeout=10)
+        cache.set("key", "html")
+        now[0] += 5
+        assert cache.get("key") == "html"
+        now[0] += 10
+        assert cache.get("key") is None
+
+    def test_cache_clear(self):
+        """cache_clear removes fragments and resets counters."""
+        cache = BrickCache()
+        cache.set("key", "html")
+        cache.get("key")
+        cache.cache_clear()
+
+        assert cache.cache_info() == (0, 0, 256, 0)
+
+    def test_django_backend(self):
+        """Fragments can be stored in a Django cache backend."""
+        from django.core.cache import caches
+
+        cache = BrickCache(backend="default", key_prefix="test")
+        cache.set("key", "html")
+
+        assert caches["default"].get("test:key") == "html"
+        assert cache.get("key") == "html"
+        assert cache.cache_info() == (1, 0, None, None)
+
+
+class TestCacheKey:
+    """Tests for cache key generation."""
+
+    def test_same_values_same_key(self):
+        """Equal kwargs produce equal keys regardless of order."""
+        assert make_cache_key(Brick, {"a": 1, "b": "x"}) == make_cache_key(
+            Brick, {"b": "x", "a": 1}
+        )
+
+    def test_different_values_different_key(self):
+        """Different kwargs produce different keys."""
+        assert make_cache_key(Brick, {"a": 1}) != make_cache_key(Brick, {"a": 2})
+
+    def test_language_in_key(self):
+        """Bricks may translate their text, so each language has its own key."""
+        from django.utils import translation
+
+        with translation.override("en"):
+            english = make_cache_key(Brick, {"a": 1})
+        with translation.override("de"):
+            german = make_cache_key(Brick, {"a": 1})
+        assert english != german
+
+    def test_safe_and_unsafe_strings_differ(self):
+        """Safe strings render differently, so they get their own key."""
+        assert make_cache_key(Brick, {"a": "<b>"}) != make_cache_key(
+            Brick, {"a": mark_safe("<b>")}
+        )
+
+    def test_containers_supported(self):
+        """Lists, tuples and dicts of simple values can be part of a key."""
+        assert make_cache_key(Brick, {"a": [1, 2], "b": {"c": None}}) is not None
+
+    def test_arbitrary_objects_not_cacheable(self):
+        """Objects whose repr doesn't identify their content disable caching."""
+        assert make_cache_key(Brick, {"a": object()}) is None
+
+
+class TestCachedBricks:
+    """Tests for rendering bricks through their cache."""
+
+    def test_cached_brick_renders_once(self):
+        """Repeated renders with the same kwargs are served from the cache."""
+        calls = []
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            cache = BrickCache()
+
+            def get_context_data(self, **kwargs):
+                calls.append(self.label)
+                return super().get_context_data(**kwargs)
+
+        first = TestButton(label="Save").render()
+        second = TestButton(label="Save").render()
+        TestButton(label="Other").render()
+
+        assert first == second == '<button class="btn btn-primary">Save</button>'
+        assert calls == ["Save", "Other"]
+        assert TestButton.cache.cache_info().hits == 1
+
+    def test_extra_kwargs_part_of_key(self):
+        """Extra kwargs produce different cache entries."""
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            cache = BrickCache()
+
+        assert 'data-id="a"' in TestButton(label="Save", data_id="a").render()
+        assert 'data-id="b"' in TestButton(label="Save", data_id="b").render()
+
+    def test_cached_brick_is_isolated(self):
+        """Cached bricks don't see the parent context."""
+
+        class TestContext(Brick):
+            label: str
+            cache = BrickCache()
+
+        assert TestContext(label="A").render(Context({"parent_var": "x"})) == "A|"
+
+    def test_block_brick_children_part_of_key(self):
+        """Block bricks are cached per children content."""
+
+        class TestCard(BlockBrick):
+            title: str
+            cache = BrickCache()
+
+        assert "One" in TestCard(title="T").render(children="One")
+        assert "Two" in TestCard(title="T").render(children="Two")
+        assert TestCard.cache.cache_info().hits == 0
+
+    def test_get_cache_key_none_bypasses_cache(self):
+        """Returning None from get_cache_key renders without the cache."""
+
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            cache = BrickCache()
+
+            def get_cache_key(self, **kwargs):
+                return None
+
+        TestButton(label="Save").render()
+        TestButton(label="Save").render()
+
+        assert TestButton.cache.cache_info() == (0, 0, 256, 0)
+
+    def test_cache_is_not_a_kwarg(self):
+        """The cache class attribute is not treated as a brick kwarg."""
+
+        class TestButton(Brick):
+            label: str
+            cache = BrickCache()
+
+        assert "cache" not in TestButton.__brick_kwargs__
@@ -0,0 +1,291 @@
+import asyncio
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.template import engines
+from django.template.context import make_context
+
+from brickastley import BlockBrick, Brick, register
+from brickastley.concurrency import aprefetch_bricks, arender_template
+from brickastley.registry import clear_registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clear registry before and after each test."""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+@pytest.fixture
+def reload_templatetags():
+    """Reload templatetags after registering bricks."""
+    from brickastley.templatetags import brickastley as brickastley_tags
+
+    return brickastley_tags.register_brick_tags
+
+
+def render_with_prefetch(source, context):
+    """Prefetch brick data for a template string, then render it."""
+    template = engines["django"].from_string(source).template
+    template_context = make_context(context)
+
+    async def _render():
+        await aprefetch_bricks(template, template_context)
+        return await sync_to_async(template.render)(template_context)
+
+    return asyncio.run(_render())
+
+
+class TestAsyncContextData:
+    """Tests for aget_context_data and arender."""
+
+    def test_async_only_brick_renders_sync(self):
+        """Bricks with only aget_context_data() render from sync code."""
+
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = "async"
+                return context
+
+        assert TestLabel(name="a").render() == "a:async;\n"
+
+    def test_arender_uses_async_context(self):
+        """arender() loads the context with aget_context_data()."""
+
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = "async"
+                return context
+
+        assert asyncio.run(TestLabel(name="a").arender()) == "a:async;\n"
+
+    def test_default_async_context_runs_sync_override(self):
+        """The default aget_context_data() runs a custom get_context_data()."""
+
+        class TestLabel(Brick):
+            name: str
+
+            def get_context_data(self, **kwargs):
+                context = super().get_context_data(**kwargs)
+                context["value"] = "sync"
+                return context
+
+        brick = TestLabel(name="a")
+        assert asyncio.run(brick.aget_context_data())["value"] == "sync"
+        assert not TestLabel.__brick_async_context__
+
+    def test_block_brick_arender(self):
+        """Block bricks render their children from async code."""
+        from django.utils.safestring import mark_safe
+
+        class TestCard(BlockBrick):
+            title: str
+
+        html = asyncio.run(TestCard(title="T").arender(mark_safe("<p>x</p>")))
+        assert html == '<div class="card"><h2>T</h2><p>x</p></div>'
+
+
+class TestPrefetch:
+    """Tests for loading the async context data of sibling bricks."""
+
+    def test_sibling_bricks_load_concurrently(self, reload_templatetags):
+        """aget_context_data() of sibling bricks runs concurrently."""
+        started = []
+
+        @register(name="async_sibling")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                started.append(self.name)
+                # Only completes early if the other brick starts meanwhile
+                for _ in range(1000):
+                    if len(started) == 2:
+                        context["value"] = "concurrent"
+                        break
+                    await asyncio.sleep(0.001)
+                else:
+                    context["value"] = "sequential"
+                return context
+
+        reload_templatetags()
+
+        html = render_with_prefetch(
+            '{% load brickastley %}{% async_sibling name="a" %}{% async_sibling name=b %}',
+            {"b": "b"},
+        )
+        assert html == "a:concurrent;\nb:concurrent;\n"
+        assert sorted(started) == ["a", "b"]
+
+    def test_prefetched_data_only_used_for_matching_kwargs(self, reload_templatetags):
+        """Bricks whose kwargs change while rendering load their own data."""
+        calls = []
+
+        @register(name="async_with")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                calls.append(self.name)
+                context["value"] = len(calls)
+                return context
+
+        reload_templatetags()
+
+        html = render_with_prefetch(
+            "{% load brickastley %}"
+            '{% firstof "inner" as name %}{% async_with name=name %}',
+            {"name": "outer"},
+        )
+        assert html == "inner:2;\n"
+        assert calls == ["outer", "inner"]
+
+    def test_prefetch_kwargs_kept_without_validation(
+        self, reload_templatetags, settings
+    ):
+        """Prefetched data is matched by kwargs when validation is off too."""
+        settings.BRICKASTLEY_VALIDATION = "off"
+
+        @register(name="async_unvalidated")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = f"loaded-for-{self.name}"
+                return context
+
+        reload_templatetags()
+
+        html = render_with_prefetch(
+            "{% load brickastley %}"
+            '{% firstof "late" as n %}{% async_unvalidated name=n %}',
+            {"n": "early"},
+        )
+        assert html == "late:loaded-for-late;\n"
+
+    def test_kwargs_missing_from_top_level_context(self, reload_templatetags):
+        """Kwargs only set while rendering don't break prefetching."""
+
+        @register(name="async_late")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = "async"
+                return context
+
+        reload_templatetags()
+
+        html = render_with_prefetch(
+            '{% load brickastley %}{% firstof "x" as n %}{% async_late name=n %}',
+            {},
+        )
+        assert html == "x:async;\n"
+
+    def test_bricks_in_loops_are_not_prefetched(self, reload_templatetags):
+        """Bricks inside loops load their data when they're rendered."""
+        calls = []
+
+        @register(name="async_loop")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                calls.append(self.name)
+                return context
+
+        reload_templatetags()
+
+        html = render_with_prefetch(
+            "{% load brickastley %}"
+            "{% for n in names %}{% async_loop name=n %}{% endfor %}",
+            {"names": ["x", "y"]},
+        )
+        assert html == "x:;\ny:;\n"
+        assert calls == ["x", "y"]
+
+    def test_bricks_in_conditions_are_not_prefetched(self, reload_templatetags):
+        """Bricks in branches that aren't taken don't load their data."""
+
+        @register(name="async_profile")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                if not self.name:
+                    raise LookupError("no such profile")
+                context["value"] = "async"
+                return context
+
+        reload_templatetags()
+
+        html = render_with_prefetch(
+            "{% load brickastley %}"
+            "{% if user_name %}{% async_profile name=user_name %}{% endif %}"
+            "{% if widget %}{% include widget.tpl %}{% endif %}done",
+            {},
+        )
+        assert html == "done"
+
+    def test_failed_prefetch_raises_when_rendered(self, reload_templatetags):
+        """Bricks whose data fails to load raise when they're rendered."""
+        calls = []
+
+        @register(name="async_failing")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                calls.append(self.name)
+                raise LookupError("no such profile")
+
+        @register(name="async_working")
+        class OtherLabel(Brick):
+            name: str
+            template_name = "bricks/test_label.html"
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = "async"
+                return context
+
+        reload_templatetags()
+
+        with pytest.raises(LookupError):
+            render_with_prefetch(
+                "{% load brickastley %}"
+                '{% async_working name="a" %}{% async_failing name="b" %}',
+                {},
+            )
+        assert calls == ["b", "b"]
+
+    def test_arender_template(self, reload_templatetags):
+        """arender_template() renders a template with prefetched bricks."""
+
+        @register(name="async_label")
+        class TestLabel(Brick):
+            name: str
+
+            async def aget_context_data(self, **kwargs):
+                context = await super().aget_context_data(**kwargs)
+                context["value"] = self.name.upper()
+                return context
+
+        reload_templatetags()
+
+        html = asyncio.run(arender_template("concurrency/page.html", {"other": "b"}))
+        assert html == "a:A;\nb:B;\n\n"
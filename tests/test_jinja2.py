@@ -0,0 +1,122 @@
+import pytest
+
+jinja2 = pytest.importorskip("jinja2")
+
+from brickastley import BlockBrick, Brick, BrickValidationError, register  # noqa: E402
+from brickastley.registry import clear_registry, register_lazy  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clear registry before and after each test."""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+def render(source, **context):
+    """Render a Jinja2 template source with the brick extension."""
+    environment = jinja2.Environment(
+        extensions=["brickastley.jinja2.BrickExtension"], autoescape=True
+    )
+    return environment.from_string(source).render(**context)
+
+
+class TestJinja2Extension:
+    """Tests for rendering bricks from Jinja2 templates."""
+
+    def test_simple_brick(self):
+        """Simple bricks are called like functions."""
+
+        @register(name="test_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        result = render('{{ test_button(label="Save", data_id=7) }}')
+        assert result == '<button class="btn btn-primary" data-id="7">Save</button>'
+
+    def test_block_brick(self):
+        """Block bricks wrap the body of a call block, unescaped."""
+
+        @register(name="test_card")
+        class TestCard(BlockBrick):
+            title: str
+
+        result = render(
+            "{% call test_card(title=title) %}<p>{{ body }}</p>{% endcall %}",
+            title="Hi & bye",
+            body="<b>",
+        )
+        assert result == (
+            '<div class="card"><h2>Hi &amp; bye</h2><p>&lt;b&gt;</p></div>'
+        )
+
+    def test_simple_brick_rejects_call(self):
+        """Simple bricks can't be used with a call block."""
+
+        @register(name="test_button")
+        class TestButton(Brick):
+            label: str
+
+        with pytest.raises(jinja2.TemplateRuntimeError, match="not a block brick"):
+            render('{% call test_button(label="Save") %}x{% endcall %}')
+
+    def test_kwargs_validated(self, settings):
+        """Kwargs are validated like in Django templates."""
+        settings.DEBUG = True
+
+        @register(name="test_button")
+        class TestButton(Brick):
+            label: str
+
+        with pytest.raises(BrickValidationError):
+            render("{{ test_button(label=42) }}")
+
+    def test_parent_context(self):
+        """Bricks see the variables of the Jinja2 template unless isolated."""
+
+        @register(name="test_context")
+        class TestContext(Brick):
+            label: str
+
+        @register(name="isolated_context")
+        class IsolatedContext(Brick):
+            label: str
+            isolated = True
+            template_name = "bricks/test_context.html"
+
+        source = '{{ test_context(label="A") }} {{ isolated_context(label="B") }}'
+        assert render(source, parent_var="P") == "A|P B|"
+
+    def test_custom_context_data(self):
+        """get_context_data() is used for the brick template."""
+
+        @register(name="test_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+            def get_context_data(self, **kwargs):
+                context = super().get_context_data(**kwargs)
+                context["label"] = self.label.upper()
+                return context
+
+        assert render('{{ test_button(label="save") }}') == (
+            '<button class="btn btn-primary">SAVE</button>'
+        )
+
+    def test_lazy_brick(self):
+        """Bricks registered lazily are imported when first rendered."""
+        import sys
+
+        sys.modules.pop("tests.lazy_bricks", None)
+        register_lazy("lazy_button", "tests.lazy_bricks")
+
+        try:
+            assert render('{{ lazy_button(label="Go") }}') == (
+                '<button class="btn btn-primary">Go</button>'
+            )
+            assert "tests.lazy_bricks" in sys.modules
+        finally:
+            sys.modules.pop("tests.lazy_bricks", None)
@@ -0,0 +1,108 @@
+import json
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from brickastley import BlockBrick, Brick, register
+from brickastley.manifest import build_manifest, load_manifest, register_manifest
+from brickastley.registry import clear_registry, get_lazy_registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clear registry before and after each test."""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+class TestBuildManifest:
+    """Tests for describing registered bricks in a manifest."""
+
+    def test_manifest_describes_bricks(self):
+        """The manifest holds module, template, kwargs, kind and media."""
+
+        @register(name="manifest_button")
+        class ManifestButton(Brick):
+            label: str
+            count: int | None = None
+
+            class Media:
+                css = {"all": ["css/button.css"]}
+                js = ["js/button.js"]
+
+        @register(name="manifest_card")
+        class ManifestCard(BlockBrick):
+            title: str
+
+        bricks = build_manifest()["bricks"]
+
+        assert list(bricks) == ["manifest_button", "manifest_card"]
+        assert bricks["manifest_button"] == {
+            "module": "tests.test_manifest",
+            "class": ManifestButton.__qualname__,
+            "template": "bricks/manifest_button.html",
+            "block": False,
+            "kwargs": {
+                "label": {"type": "str", "required": True},
+                "count": {"type": "int | None", "default": "None"},
+            },
+            "media": {"css": {"all": ["css/button.css"]}, "js": ["js/button.js"]},
+        }
+        assert bricks["manifest_card"]["block"] is True
+
+    def test_register_manifest_registers_lazily(self):
+        """Bricks of a manifest are registered without importing them."""
+        register_manifest(
+            {
+                "version": 1,
+                "bricks": {"lazy_button": {"module": "tests.lazy_bricks"}},
+            }
+        )
+        assert get_lazy_registry() == {"lazy_button": "tests.lazy_bricks"}
+
+    def test_load_missing_or_outdated_manifest(self, tmp_path):
+        """Missing manifests and other versions are ignored."""
+        path = tmp_path / "bricks.json"
+        assert load_manifest(path) is None
+
+        path.write_text(json.dumps({"version": 0, "bricks": {}}))
+        assert load_manifest(path) is None
+
+
+class TestBuildCommand:
+    """Tests for the brickastley_build management command."""
+
+    def test_build_and_check(self, tmp_path):
+        """The command writes the manifest, and --check compares it."""
+
+        @register(name="command_button")
+        class CommandButton(Brick):
+            label: str
+
+        path = tmp_path / "bricks.json"
+        call_command("brickastley_build", output=str(path))
+        manifest = load_manifest(path)
+        assert list(manifest["bricks"]) == ["command_button"]
+
+        call_command("brickastley_build", output=str(path), check=True)
+
+        @register(name="command_link")
+        class CommandLink(Brick):
+            href: str
+
+        with pytest.raises(CommandError, match="out of date"):
+            call_command("brickastley_build", output=str(path), check=True)
+
+    def test_check_missing_manifest(self, tmp_path):
+        """--check fails if the manifest doesn't exist."""
+        with pytest.raises(CommandError, match="out of date"):
+            call_command(
+                "brickastley_build", output=str(tmp_path / "missing.json"), check=True
+            )
+
+    def test_output_required(self, settings):
+        """Without --output or BRICKASTLEY_MANIFEST the command fails."""
+        settings.BRICKASTLEY_MANIFEST = None
+        with pytest.raises(CommandError, match="BRICKASTLEY_MANIFEST"):
+            call_command("brickastley_build")
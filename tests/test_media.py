@@ -0,0 +1,125 @@
+import pytest
+from django.template import Context, Template, TemplateSyntaxError
+
+from brickastley import BlockBrick, Brick, register
+from brickastley.media import get_rendered_media
+from brickastley.registry import clear_registry
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clear registry before and after each test."""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+@pytest.fixture
+def media_bricks():
+    """Register bricks with overlapping media."""
+    from brickastley.templatetags import brickastley as brickastley_tags
+
+    @register(name="media_button")
+    class TestButton(Brick):
+        label: str
+        variant: str = "primary"
+
+        class Media:
+            css = {"all": ["css/base.css", "css/button.css"]}
+            js = ["js/button.js"]
+
+    @register(name="media_card")
+    class TestCard(BlockBrick):
+        title: str
+
+        class Media:
+            css = {"all": ["css/base.css", "css/card.css"]}
+
+    @register(name="media_unused")
+    class TestContext(Brick):
+        label: str
+
+        class Media:
+            js = ["js/unused.js"]
+
+    brickastley_tags.register_brick_tags()
+
+
+class TestBrickMedia:
+    """Tests for collecting the media of rendered bricks."""
+
+    def test_media_of_rendered_bricks_only(self, media_bricks):
+        """Only the media of bricks rendered so far is emitted, deduplicated."""
+        template = Template(
+            "{% load brickastley %}"
+            '{% media_card title="T" %}{% media_button label="A" %}'
+            '{% media_button label="B" %}{% endmedia_card %}'
+            "|{% brick_media css %}|{% brick_media js %}"
+        )
+        css, js = template.render(Context()).split("|")[1:]
+
+        assert css.count("css/base.css") == 1
+        assert "css/card.css" in css and "css/button.css" in css
+        assert js.count("js/button.js") == 1
+        assert "unused" not in css + js
+
+    def test_media_before_bricks_from_template_scan(self, media_bricks):
+        """Bricks in the template are found before they're rendered."""
+        template = Template(
+            '{% load brickastley %}{% brick_media js %}|{% media_button label="A" %}'
+        )
+        js, html = template.render(Context()).split("|")
+        assert "js/button.js" in js
+        assert "unused" not in js
+
+    def test_template_scan_follows_extends_and_include(self, media_bricks):
+        """Parent and included templates are scanned, dynamic ones recorded."""
+        from django.template.loader import render_to_string
+
+        html = render_to_string("media/page.html", {"partial": "media/dynamic.html"})
+        head, body = html.split("<body>")
+
+        assert "css/card.css" in head and "css/button.css" in head
+        assert head.count("css/base.css") == 1
+        # The dynamic include is only known once it has been rendered
+        assert "js/unused.js" not in head
+        assert "js/button.js" in body and "js/unused.js" in body
+
+    def test_template_scan_includes_nested_brick_templates(self):
+        """Bricks used inside brick templates are found too."""
+        from brickastley.media import get_template_media
+        from brickastley.templatetags import brickastley as brickastley_tags
+
+        @register(name="media_inner")
+        class TestButton(Brick):
+            label: str
+
+            class Media:
+                js = ["js/inner.js"]
+
+        @register(name="media_outer")
+        class TestOuter(Brick):
+            pass
+
+        brickastley_tags.register_brick_tags()
+
+        template = Template("{% load brickastley %}{% media_outer %}")
+        assert get_template_media(template)._js == ["js/inner.js"]
+
+    def test_media_from_loops_and_batches(self, media_bricks):
+        """Bricks rendered in loops and batches are collected too."""
+        template = Template(
+            "{% load brickastley %}"
+            "{% for i in items %}{% media_button label=i %}{% endfor %}"
+            "{% bricks_for i in items media_unused label=i %}"
+        )
+        context = Context({"items": ["a", "b"]})
+        template.render(context)
+
+        media = get_rendered_media(context)
+        assert media._js == ["js/button.js", "js/unused.js"]
+
+    def test_bad_brick_media_argument(self):
+        """Only css and js are accepted as arguments."""
+        with pytest.raises(TemplateSyntaxError):
+            Template("{% load brickastley %}{% brick_media images %}")
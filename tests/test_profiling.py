@@ -0,0 +1,211 @@
+import pytest
+from django.http import HttpResponse
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from brickastley import BlockBrick, Brick, register
+from brickastley.profiling import (
+    BrickProfiler,
+    BrickProfilerMiddleware,
+    NullTimer,
+    process_profiler,
+    start_timer,
+)
+from brickastley.registry import clear_registry
+from brickastley.signals import brick_rendered
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clear registry before and after each test."""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+@pytest.fixture
+def reload_templatetags():
+    """Reload templatetags after registering bricks."""
+    from brickastley.templatetags import brickastley as brickastley_tags
+
+    def _reload():
+        brickastley_tags.register_brick_tags()
+
+    return _reload
+
+
+@pytest.fixture
+def renders():
+    """Collect brick_rendered signals sent during the test."""
+    received = []
+
+    def receiver(sender, **kwargs):
+        received.append((sender, kwargs))
+
+    brick_rendered.connect(receiver)
+    yield received
+    brick_rendered.disconnect(receiver)
+
+
+class TestBrickRenderedSignal:
+    """Tests for the brick_rendered signal."""
+
+    def test_no_timing_without_receivers(self):
+        """Renders are not timed while nobody listens."""
+        assert isinstance(start_timer(Brick), NullTimer)
+
+    def test_signal_sent_for_brick(self, reload_templatetags, renders):
+        """Rendering a brick tag sends brick_rendered with its timings."""
+
+        @register(name="profiled_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        reload_templatetags()
+
+        Template("{% load brickastley %}{% profiled_button label=name %}").render(
+            Context({"name": "Save"})
+        )
+
+        [(sender, kwargs)] = renders
+        assert sender is TestButton
+        assert kwargs["brick_name"] == "profiled_button"
+        assert kwargs["template_name"] == "bricks/test_button.html"
+        assert kwargs["output_size"] == len(
+            '<button class="btn btn-primary">Save</button>'
+        )
+        assert kwargs["depth"] == 0
+        for phase in ("validation_time", "context_time", "render_time"):
+            assert kwargs[phase] >= 0
+
+    def test_nesting_depth(self, reload_templatetags, renders):
+        """Bricks nested in block bricks report their depth."""
+
+        @register(name="profiled_card")
+        class TestCard(BlockBrick):
+            title: str
+
+        @register(name="profiled_nested_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        reload_templatetags()
+
+        Template(
+            '{% load brickastley %}{% profiled_card title="A" %}'
+            '{% profiled_card title="B" %}{% profiled_nested_button label="C" %}'
+            "{% endprofiled_card %}{% endprofiled_card %}"
+        ).render(Context({}))
+
+        depths = [(kwargs["brick_name"], kwargs["depth"]) for _, kwargs in renders]
+        assert depths == [
+            ("profiled_nested_button", 2),
+            ("profiled_card", 1),
+            ("profiled_card", 0),
+        ]
+
+    def test_signal_sent_for_inlined_brick(self, reload_templatetags, renders):
+        """Inlined bricks send brick_rendered too."""
+
+        @register(name="profiled_inline")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+        reload_templatetags()
+
+        Template('{% load brickastley %}{% profiled_inline label="A" %}').render(
+            Context({})
+        )
+
+        assert [kwargs["brick_name"] for _, kwargs in renders] == ["profiled_inline"]
+
+
+class TestBrickProfiler:
+    """Tests for the BrickProfiler aggregator."""
+
+    def record(self, profiler, name, render_time, depth=0):
+        profiler.record(
+            Brick,
+            brick_name=name,
+            template_name=f"bricks/{name}.html",
+            validation_time=0.0,
+            context_time=0.0,
+            render_time=render_time,
+            output_size=10,
+            depth=depth,
+        )
+
+    def test_aggregates_per_brick(self):
+        """Renders of the same brick are aggregated."""
+        profiler = BrickProfiler()
+        self.record(profiler, "button", 0.002)
+        self.record(profiler, "button", 0.004, depth=2)
+
+        stats = profiler.stats["button"]
+        assert stats.count == 2
+        assert stats.total_time == pytest.approx(0.006)
+        assert stats.max_time == pytest.approx(0.004)
+        assert stats.mean_time == pytest.approx(0.003)
+        assert stats.output_size == 20
+        assert stats.max_depth == 2
+
+    def test_top(self):
+        """top returns the slowest bricks first."""
+        profiler = BrickProfiler()
+        self.record(profiler, "fast", 0.001)
+        self.record(profiler, "slow", 0.01)
+        self.record(profiler, "medium", 0.005)
+
+        assert [s.brick_name for s in profiler.top(2)] == ["slow", "medium"]
+
+    def test_context_manager(self, reload_templatetags):
+        """Used as a context manager, the profiler records renders in the block."""
+
+        @register(name="profiler_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        reload_templatetags()
+        template = Template('{% load brickastley %}{% profiler_button label="A" %}')
+
+        with BrickProfiler() as profiler:
+            template.render(Context({}))
+        template.render(Context({}))
+
+        assert profiler.stats["profiler_button"].count == 1
+        assert not brick_rendered.receivers
+
+
+class TestBrickProfilerMiddleware:
+    """Tests for the per-request profiling middleware."""
+
+    def test_profiles_request(self, reload_templatetags):
+        """Bricks rendered during a request are collected on the request."""
+
+        @register(name="middleware_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        reload_templatetags()
+        template = Template('{% load brickastley %}{% middleware_button label="A" %}')
+        process_profiler.reset()
+
+        def view(request):
+            return HttpResponse(template.render(Context({})))
+
+        middleware = BrickProfilerMiddleware(view)
+        request = RequestFactory().get("/")
+        try:
+            middleware(request)
+            template.render(Context({}))  # Outside of a request
+        finally:
+            brick_rendered.disconnect(dispatch_uid="brickastley_request_profiler")
+
+        assert request.brick_profiler.stats["middleware_button"].count == 1
+        assert process_profiler.stats["middleware_button"].count == 1
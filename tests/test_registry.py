@@ -124,3 +124,135 @@ class TestClearRegistry:
         clear_registry()
 
         assert len(get_registry()) == 0
+
+
+@pytest.fixture
+def lazy_module():
+    """Unload the lazy bricks module and its tag before and after a test."""
+    import sys
+
+    from brickastley.templatetags.brickastley import register as library
+
+    def _unload():
+        sys.modules.pop("tests.lazy_bricks", None)
+        library.tags.pop("lazy_button", None)
+        library.tags.pop("lazy_link", None)
+
+    _unload()
+    yield "tests.lazy_bricks"
+    _unload()
+
+
+class TestLazyRegistry:
+    """Tests for bricks registered by name without importing them."""
+
+    def test_get_brick_imports_module(self, lazy_module):
+        """get_brick() imports the module of a lazily registered brick."""
+        import sys
+
+        from brickastley.registry import get_lazy_registry, register_lazy
+
+        register_lazy("lazy_button", lazy_module)
+        assert lazy_module not in sys.modules
+        assert get_lazy_registry() == {"lazy_button": lazy_module}
+
+        brick_class = get_brick("lazy_button")
+        assert brick_class.__name__ == "LazyButton"
+        assert lazy_module in sys.modules
+
+    def test_lazy_tag_imports_module_on_parse(self, lazy_module):
+        """Template tags of lazy bricks import the module when parsed."""
+        import sys
+
+        from django.template import Context, Template
+
+        from brickastley.registry import register_lazy
+        from brickastley.templatetags.brickastley import register_brick_tags
+
+        register_lazy("lazy_button", lazy_module)
+        register_brick_tags()
+        assert lazy_module not in sys.modules
+
+        template = Template('{% load brickastley %}{% lazy_button label="Go" %}')
+        assert lazy_module in sys.modules
+        assert template.render(Context()) == (
+            '<button class="btn btn-primary">Go</button>'
+        )
+
+    def test_imported_module_registers_all_tags(self, lazy_module):
+        """Importing a lazy module adds the tags of all bricks it defines."""
+        from django.template import Context, Template
+
+        from brickastley.registry import register_lazy
+        from brickastley.templatetags.brickastley import register_brick_tags
+
+        register_lazy("lazy_button", lazy_module)
+        register_brick_tags()
+        get_brick("lazy_button")
+
+        template = Template('{% load brickastley %}{% lazy_link label="Go" %}')
+        assert template.render(Context()) == (
+            '<button class="btn btn-link">Go</button>'
+        )
+
+    def test_lazy_tag_for_unregistered_name(self, lazy_module):
+        """A lazy tag whose module doesn't register the brick fails to parse."""
+        from django.template import Template, TemplateSyntaxError
+
+        from brickastley.registry import register_lazy
+        from brickastley.templatetags.brickastley import register_brick_tags
+
+        register_lazy("lazy_missing", lazy_module)
+        register_brick_tags()
+        with pytest.raises(TemplateSyntaxError, match="was not registered"):
+            Template("{% load brickastley %}{% lazy_missing %}")
+
+
+class TestScanBrickNames:
+    """Tests for finding registered bricks in source code."""
+
+    def test_scan_register_forms(self):
+        """Bare, called and attribute register decorators are recognized."""
+        from brickastley.autodiscover import scan_brick_names
+
+        source = """
+import brickastley
+from brickastley import Brick, register
+
+@register
+class PrimaryButton(Brick):
+    label: str
+
+@register(name="btn")
+class Button(Brick):
+    label: str
+
+@brickastley.register
+class Card(Brick):
+    brick_name = "info_card"
+
+class NotABrick:
+    pass
+"""
+        assert scan_brick_names(source) == ["primary_button", "btn", "info_card"]
+
+    def test_scan_ignores_other_decorators(self):
+        """Classes without a register decorator are not bricks."""
+        from brickastley.autodiscover import scan_brick_names
+
+        source = "import dataclasses\n@dataclasses.dataclass\nclass A:\n    x: int\n"
+        assert scan_brick_names(source) == []
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            '@register(name=PREFIX + "_card")\nclass Card(Brick):\n    pass\n',
+            "class Icon(Brick):\n    pass\n\nregister(Icon)\n",
+            "@register\nclass Card(Brick):\n    brick_name = PREFIX\n",
+        ],
+    )
+    def test_scan_gives_up_on_other_forms(self, source):
+        """Computed names and direct register() calls can't be scanned."""
+        from brickastley.autodiscover import scan_brick_names
+
+        assert scan_brick_names(source) is None
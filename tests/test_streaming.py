@@ -0,0 +1,140 @@
+import pytest
+from django.template import Context, engines
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from brickastley import BlockBrick, register
+from brickastley.registry import clear_registry
+from brickastley.streaming import split_template, stream_template
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    """Clear registry before and after each test."""
+    clear_registry()
+    yield
+    clear_registry()
+
+
+class TestSplitTemplate:
+    """Tests for splitting templates around {{ children }}."""
+
+    def test_split_around_children(self):
+        """Nodes before and after {{ children }} are split apart."""
+        template = engines["django"].from_string("<div>{{ title }}{{ children }}</div>")
+
+        head, tail = split_template(template.template)
+        assert head.render(Context({"title": "T"})) == "<div>T"
+        assert tail.render(Context({})) == "</div>"
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "<div>{% if children %}{{ children }}{% endif %}</div>",
+            "<div>{{ children|upper }}</div>",
+            "<div>{% if title %}{{ children }}{% endif %}</div>",
+            "<div>{{ title }}</div>",
+        ],
+    )
+    def test_unsplittable_templates(self, source):
+        """Templates using children in other ways can't be split."""
+        template = engines["django"].from_string(source)
+        assert split_template(template.template) is None
+
+
+class TestBlockBrickStream:
+    """Tests for BlockBrick.stream."""
+
+    def test_stream_matches_render(self):
+        """Joined chunks equal the regular render."""
+
+        class TestCard(BlockBrick):
+            title: str
+
+        card = TestCard(title="Hello")
+        chunks = list(card.stream(["<p>One</p>", "<p>Two</p>"]))
+
+        assert chunks == [
+            '<div class="card"><h2>Hello</h2>',
+            "&lt;p&gt;One&lt;/p&gt;",
+            "&lt;p&gt;Two&lt;/p&gt;",
+            "</div>",
+        ]
+        assert "".join(chunks) == card.render(children="<p>One</p><p>Two</p>")
+
+    def test_stream_safe_children_not_escaped(self):
+        """Children marked safe are streamed as they are."""
+
+        class TestCard(BlockBrick):
+            title: str
+
+        chunks = list(TestCard(title="Hi").stream(mark_safe("<p>Body</p>")))
+        assert chunks[1] == "<p>Body</p>"
+
+    def test_head_is_yielded_before_children_are_consumed(self):
+        """The head of the brick is sent before the children are rendered."""
+        consumed = []
+
+        def children():
+            consumed.append(True)
+            yield mark_safe("<p>Body</p>")
+
+        class TestCard(BlockBrick):
+            title: str
+
+        stream = TestCard(title="Hi").stream(children())
+        assert next(stream) == '<div class="card"><h2>Hi</h2>'
+        assert consumed == []
+        assert list(stream) == ["<p>Body</p>", "</div>"]
+
+    def test_custom_context_data_renders_as_one_chunk(self):
+        """Bricks with custom get_context_data fall back to a single chunk."""
+
+        class TestCard(BlockBrick):
+            title: str
+
+            def get_context_data(self, **kwargs):
+                context = super().get_context_data(**kwargs)
+                context["title"] = self.title.upper()
+                return context
+
+        chunks = list(TestCard(title="hi").stream(mark_safe("<p>Body</p>")))
+        assert chunks == ['<div class="card"><h2>HI</h2><p>Body</p></div>']
+
+    def test_stream_does_not_leak_into_parent_context(self):
+        """Brick variables are popped from the parent context again."""
+
+        class TestCard(BlockBrick):
+            title: str
+
+        context = Context({"parent_var": "x"})
+        list(TestCard(title="Hi").stream("Body", context))
+        assert "title" not in context
+
+
+class TestStreamTemplate:
+    """Tests for stream_template."""
+
+    def test_stream_template_matches_render(self):
+        """A streamed page equals the regular render, in several chunks."""
+        from brickastley.templatetags import brickastley as brickastley_tags
+
+        @register(name="stream_card")
+        class TestCard(BlockBrick):
+            title: str
+
+        brickastley_tags.register_brick_tags()
+
+        context = {"title": "Outer", "items": ["a", "<b>"]}
+        chunks = list(stream_template("streaming/page.html", context))
+
+        assert "".join(chunks) == render_to_string("streaming/page.html", context)
+        assert chunks[0] == "<html><body>"
+        assert len(chunks) > 3
+
+    def test_missing_template_raises_immediately(self):
+        """Missing templates raise before the stream is consumed."""
+        from django.template import TemplateDoesNotExist
+
+        with pytest.raises(TemplateDoesNotExist):
+            stream_template("streaming/missing.html")
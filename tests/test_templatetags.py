@@ -1,8 +1,10 @@
+from typing import Any
+
 import pytest
 from django.template import Context, Template, TemplateSyntaxError, engines
 from django.template.base import Parser
 
-from brickastley import BlockBrick, Brick, register
+from brickastley import BlockBrick, Brick, BrickValidationError, register
 from brickastley.registry import clear_registry
 
 
@@ -214,6 +216,946 @@ class TestBlockBrickRendering:
         assert node.nodelist is nodelist
 
 
+class TestConstantKwargs:
+    """Tests for bricks whose kwargs are all constant."""
+
+    def test_is_constant(self, parser):
+        """Literals are constant, variables, filters and translations are not."""
+        from brickastley.templatetags.brickastley import is_constant
+
+        assert is_constant(42)
+        assert is_constant(None)
+        assert is_constant(parser.compile_filter('"Hello"'))
+        assert not is_constant(parser.compile_filter("name"))
+        assert not is_constant(parser.compile_filter('"Hello"|upper'))
+        assert not is_constant(parser.compile_filter('_("Hello")'))
+
+    def test_constant_brick_built_at_compile_time(self, reload_templatetags):
+        """Bricks with constant kwargs are instantiated once, at compile time."""
+        from brickastley.templatetags.brickastley import BrickNode
+
+        instances = []
+
+        @register(name="constant_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+            def __new__(cls, **kwargs):
+                instance = super().__new__(cls)
+                instances.append(instance)
+                return instance
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% constant_button label="Save" count=3 %}'
+        )
+        node = template.nodelist.get_nodes_by_type(BrickNode)[0]
+        assert node.brick is instances[0]
+        assert node.brick_context["label"] == "Save"
+
+        expected = '<button class="btn btn-primary" count="3">Save</button>'
+        assert template.render(Context({})) == expected
+        assert template.render(Context({})) == expected
+        assert len(instances) == 1
+
+    def test_custom_context_data_built_per_render(self, reload_templatetags):
+        """Context is not precomputed when get_context_data is overridden."""
+        from brickastley.templatetags.brickastley import BrickNode
+
+        calls = []
+
+        @register(name="custom_context_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+            def get_context_data(self, **kwargs):
+                calls.append(self)
+                return super().get_context_data(**kwargs)
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% custom_context_button label="Save" %}'
+        )
+        node = template.nodelist.get_nodes_by_type(BrickNode)[0]
+        assert node.brick is None
+        assert node.brick_context is None
+        assert node.constant_kwargs == {"label": "Save"}
+
+        template.render(Context({}))
+        template.render(Context({}))
+        assert len(calls) == 2
+        assert calls[0] is not calls[1]
+
+    @pytest.mark.parametrize("block", [False, True])
+    def test_custom_context_data_gets_fresh_brick(self, reload_templatetags, block):
+        """Changes get_context_data() makes to the brick don't carry over."""
+
+        class Mixin:
+            def get_context_data(self, **kwargs):
+                self.label += "!"
+                return super().get_context_data(**kwargs)
+
+        if block:
+
+            @register(name="shouting_card")
+            class ShoutingCard(Mixin, BlockBrick):
+                label: str
+                template_name = "bricks/test_context.html"
+
+            source = '{% shouting_card label="Go" %}x{% endshouting_card %}'
+        else:
+
+            @register(name="shouting_button")
+            class ShoutingButton(Mixin, Brick):
+                label: str
+                template_name = "bricks/test_context.html"
+
+            source = '{% shouting_button label="Go" %}'
+
+        reload_templatetags()
+
+        template = Template("{% load brickastley %}" + source)
+        outputs = [template.render(Context({})) for _ in range(3)]
+        assert outputs == ["Go!|"] * 3
+
+    def test_custom_init_runs_per_render(self, reload_templatetags):
+        """Bricks with a custom __init__() are only created while rendering."""
+        from brickastley.templatetags.brickastley import BrickNode
+
+        calls = []
+
+        @register(name="counting_init_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.label += str(len(calls))
+                calls.append(self)
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% counting_init_button label="x" %}'
+        )
+        node = template.nodelist.get_nodes_by_type(BrickNode)[0]
+        assert node.brick is None
+        assert calls == []
+
+        outputs = [template.render(Context({})) for _ in range(3)]
+        assert outputs == [
+            f'<button class="btn btn-primary">x{index}</button>' for index in range(3)
+        ]
+
+    def test_variable_kwargs_resolved_per_render(self, reload_templatetags):
+        """Bricks with variable kwargs are built on every render."""
+        from brickastley.templatetags.brickastley import BrickNode
+
+        @register(name="variable_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        reload_templatetags()
+
+        template = Template("{% load brickastley %}{% variable_button label=name %}")
+        node = template.nodelist.get_nodes_by_type(BrickNode)[0]
+        assert node.brick is None
+
+        assert ">One<" in template.render(Context({"name": "One"}))
+        assert ">Two<" in template.render(Context({"name": "Two"}))
+
+    def test_constant_validation_error_at_compile_time(
+        self, reload_templatetags, settings
+    ):
+        """Invalid constant kwargs fail when the template is compiled."""
+        settings.DEBUG = True
+
+        @register(name="invalid_constant_button")
+        class TestButton(Brick):
+            label: str
+
+        reload_templatetags()
+
+        with pytest.raises(TemplateSyntaxError, match="expected str, got int"):
+            Template("{% load brickastley %}{% invalid_constant_button label=42 %}")
+
+    def test_constant_block_brick(self, reload_templatetags):
+        """Block bricks with constant kwargs still render their children."""
+        from brickastley.templatetags.brickastley import BlockBrickNode
+
+        @register(name="constant_card")
+        class TestCard(BlockBrick):
+            title: str
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% constant_card title="Hi" %}{{ body }}{% endconstant_card %}'
+        )
+        node = template.nodelist.get_nodes_by_type(BlockBrickNode)[0]
+        assert node.brick is not None
+        assert template.render(Context({"body": "One"})) == (
+            '<div class="card"><h2>Hi</h2>One</div>'
+        )
+        assert template.render(Context({"body": "Two"})) == (
+            '<div class="card"><h2>Hi</h2>Two</div>'
+        )
+
+
+class TestCompileTimeValidation:
+    """Tests for validating tag kwargs when the template is compiled."""
+
+    def test_missing_required_kwarg(self, reload_templatetags, settings):
+        """A missing required kwarg fails at compile time in any mode."""
+        settings.BRICKASTLEY_VALIDATION = "off"
+
+        @register(name="required_button")
+        class TestButton(Brick):
+            label: str
+
+        reload_templatetags()
+
+        with pytest.raises(TemplateSyntaxError, match="Missing required kwarg 'label'"):
+            Template("{% load brickastley %}{% required_button %}")
+
+    def test_custom_init_supplies_kwargs(self, reload_templatetags, settings):
+        """Bricks with a custom __init__() are left to validate themselves."""
+        settings.DEBUG = True
+
+        @register(name="stamp")
+        class Stamp(Brick):
+            label: str
+            variant: str = "primary"
+            template_name = "bricks/test_button.html"
+
+            def __init__(self, **kwargs):
+                kwargs.setdefault("label", "Approved")
+                super().__init__(**kwargs)
+
+        reload_templatetags()
+
+        template = Template("{% load brickastley %}{% stamp %}")
+        assert template.render(Context({})) == (
+            '<button class="btn btn-primary">Approved</button>'
+        )
+
+    def test_block_brick_literal_type(self, reload_templatetags, settings):
+        """Block tags check their literal kwargs too, even next to variables."""
+        settings.DEBUG = True
+
+        @register(name="literal_card")
+        class TestCard(BlockBrick):
+            title: str
+            count: int = 0
+
+        reload_templatetags()
+
+        with pytest.raises(TemplateSyntaxError, match="expected int"):
+            Template(
+                '{% load brickastley %}{% literal_card title=name count="three" %}'
+                "{% endliteral_card %}"
+            )
+
+    def test_literal_type_warns_once(self, reload_templatetags, settings, caplog):
+        """In warn mode a wrong literal is logged when compiling, not per render."""
+        settings.BRICKASTLEY_VALIDATION = "warn"
+
+        @register(name="warned_button")
+        class TestButton(Brick):
+            label: str
+
+        reload_templatetags()
+
+        template = Template("{% load brickastley %}{% warned_button label=42 %}")
+        assert len(caplog.records) == 1
+        template.render(Context({}))
+        template.render(Context({}))
+        assert len(caplog.records) == 1
+
+    def test_literal_kwargs_skipped_at_render(self, reload_templatetags, settings):
+        """Only the kwargs that depend on the context are validated per render."""
+        from brickastley.templatetags.brickastley import BrickNode
+
+        settings.DEBUG = True
+
+        @register(name="prevalidated_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            extra_data: Any = None
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% prevalidated_button label=name variant="ghost" '
+            'extra_data=1 class="wide" %}'
+        )
+        node = template.nodelist.get_nodes_by_type(BrickNode)[0]
+        assert node.validated == {"variant", "extra_data", "class"}
+
+        validated = []
+        original = TestButton._validate_kwarg.__func__
+
+        def spy(cls, kwarg_name, value, strict):
+            validated.append(kwarg_name)
+            return original(cls, kwarg_name, value, strict)
+
+        TestButton._validate_kwarg = classmethod(spy)
+        assert "ghost" in template.render(Context({"name": "Go"}))
+        assert validated == ["label"]
+
+        with pytest.raises(BrickValidationError):
+            template.render(Context({"name": 42}))
+
+
+class TestInlining:
+    """Tests for bricks inlined into the calling template."""
+
+    @pytest.fixture(autouse=True)
+    def clear_inline_report(self):
+        from brickastley.templatetags.brickastley import get_inline_report
+
+        get_inline_report().clear()
+        yield
+        get_inline_report().clear()
+
+    def test_inline_brick_uses_inline_node(self, reload_templatetags):
+        """Bricks opting into inlining compile to an InlineBrickNode."""
+        from brickastley.templatetags.brickastley import InlineBrickNode
+
+        @register(name="inline_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+        reload_templatetags()
+
+        template = Template("{% load brickastley %}{% inline_button label=name %}")
+        assert template.nodelist.get_nodes_by_type(InlineBrickNode)
+        assert template.render(Context({"name": "Save"})) == (
+            '<button class="btn btn-primary">Save</button>'
+        )
+
+    def test_inline_brick_is_not_instantiated(self, reload_templatetags):
+        """Inlined bricks render without creating brick instances."""
+        instances = []
+
+        @register(name="inline_no_instance")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+            def __new__(cls, **kwargs):
+                instance = super().__new__(cls)
+                instances.append(instance)
+                return instance
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% inline_no_instance label=name data_id=1 %}"
+        )
+        result = template.render(Context({"name": "Save"}))
+        assert result == '<button class="btn btn-primary" data-id="1">Save</button>'
+        assert instances == []
+
+    def test_inline_brick_validates_kwargs(self, reload_templatetags, settings):
+        """Inlined bricks still validate their kwargs."""
+        from brickastley import BrickValidationError
+
+        settings.DEBUG = True
+
+        @register(name="inline_validated")
+        class TestButton(Brick):
+            label: str
+            inline = True
+
+        reload_templatetags()
+
+        template = Template("{% load brickastley %}{% inline_validated label=num %}")
+        with pytest.raises(BrickValidationError):
+            template.render(Context({"num": 42}))
+
+    def test_inline_brick_sees_parent_context(self, reload_templatetags):
+        """Inlined bricks see the parent context unless isolated."""
+
+        @register(name="inline_context")
+        class TestContext(Brick):
+            label: str
+            inline = True
+
+        @register(name="inline_isolated")
+        class TestIsolated(Brick):
+            label: str
+            inline = True
+            isolated = True
+            template_name = "bricks/test_context.html"
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% inline_context label="A" %} '
+            '{% inline_isolated label="B" %} [{{ label }}]'
+        )
+        assert template.render(Context({"parent_var": "x"})) == "A|x B| []"
+
+    def test_inline_block_brick(self, reload_templatetags):
+        """Inlined block bricks render their children."""
+        from brickastley.templatetags.brickastley import InlineBlockBrickNode
+
+        @register(name="inline_card")
+        class TestCard(BlockBrick):
+            title: str
+            inline = True
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% inline_card title=title %}<p>{{ body }}</p>"
+            "{% endinline_card %}"
+        )
+        assert template.nodelist.get_nodes_by_type(InlineBlockBrickNode)
+        result = template.render(Context({"title": "Hi", "body": "Text"}))
+        assert result == '<div class="card"><h2>Hi</h2><p>Text</p></div>'
+
+    def test_inline_setting(self, reload_templatetags, settings):
+        """BRICKASTLEY_INLINE inlines bricks that don't opt out."""
+        from brickastley.templatetags.brickastley import BrickNode, InlineBrickNode
+
+        settings.BRICKASTLEY_INLINE = True
+
+        @register(name="inline_by_setting")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        @register(name="inline_opt_out")
+        class TestOptOut(Brick):
+            label: str
+            variant: str = "primary"
+            inline = False
+            template_name = "bricks/test_button.html"
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% inline_by_setting label="A" %}'
+            '{% inline_opt_out label="B" %}'
+        )
+        assert len(template.nodelist.get_nodes_by_type(InlineBrickNode)) == 1
+        assert len(template.nodelist.get_nodes_by_type(BrickNode)) == 1
+
+    def test_custom_context_data_not_inlined(self, reload_templatetags):
+        """Bricks with custom get_context_data fall back to BrickNode."""
+        from brickastley.templatetags.brickastley import BrickNode, get_inline_report
+
+        @register(name="inline_custom_context")
+        class TestButton(Brick):
+            label: str
+            inline = True
+
+            def get_context_data(self, **kwargs):
+                context = super().get_context_data(**kwargs)
+                context["variant"] = "danger"
+                return context
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% inline_custom_context label="A" %}'
+        )
+        assert template.nodelist.get_nodes_by_type(BrickNode)
+        assert get_inline_report()["inline_custom_context"] == {
+            "inlined": 0,
+            "fallbacks": {"custom get_context_data()": 1},
+        }
+
+    def test_custom_render_not_inlined(self, reload_templatetags):
+        """Bricks with a custom render() fall back to BrickNode."""
+        from brickastley.templatetags.brickastley import BrickNode, get_inline_report
+
+        @register(name="inline_custom_render")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+            def render(self, context=None):
+                return "prefix:" + super().render(context)
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% inline_custom_render label="A" %}'
+        )
+        assert template.nodelist.get_nodes_by_type(BrickNode)
+        assert template.render(Context({})) == (
+            'prefix:<button class="btn btn-primary">A</button>'
+        )
+        assert get_inline_report()["inline_custom_render"]["fallbacks"] == {
+            "custom render()": 1
+        }
+
+    def test_instance_template_name_not_inlined(self, reload_templatetags):
+        """Bricks choosing their template per instance fall back to BrickNode."""
+        from brickastley.templatetags.brickastley import get_inline_report
+
+        @register(name="inline_instance_template")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+            def get_template_name(self):
+                if self.label == "A":
+                    return "bricks/test_context.html"
+                return "bricks/test_button.html"
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% inline_instance_template label=label %}"
+        )
+        assert template.render(Context({"label": "A", "parent_var": "P"})) == "A|P"
+        assert template.render(Context({"label": "B"})) == (
+            '<button class="btn btn-primary">B</button>'
+        )
+        assert get_inline_report()["inline_instance_template"]["fallbacks"] == {
+            "template chosen per instance": 1
+        }
+
+    def test_custom_init_not_inlined(self, reload_templatetags):
+        """Bricks with a custom __init__() fall back to BrickNode."""
+        from brickastley.templatetags.brickastley import get_inline_report
+
+        @register(name="inline_custom_init")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+                self.label = self.label.upper()
+
+        reload_templatetags()
+
+        template = Template('{% load brickastley %}{% inline_custom_init label="a" %}')
+        assert template.render(Context({})) == (
+            '<button class="btn btn-primary">A</button>'
+        )
+        assert get_inline_report()["inline_custom_init"]["fallbacks"] == {
+            "custom __init__()": 1
+        }
+
+    def test_template_with_render_state_not_inlined(self, reload_templatetags):
+        """Brick templates using cycle and similar tags fall back to BrickNode."""
+        from brickastley.templatetags.brickastley import BrickNode, get_inline_report
+
+        @register(name="inline_cycle")
+        class TestCycle(Brick):
+            label: str
+            inline = True
+
+        reload_templatetags()
+
+        template = Template('{% load brickastley %}{% inline_cycle label="A" %}')
+        assert template.nodelist.get_nodes_by_type(BrickNode)
+        assert get_inline_report()["inline_cycle"]["fallbacks"] == {
+            "template uses extends, block, cycle or ifchanged": 1
+        }
+
+    def test_recursive_template_not_inlined(self, reload_templatetags):
+        """Bricks used in their own template fall back to BrickNode there."""
+        from brickastley.brick import clear_template_cache
+        from brickastley.templatetags.brickastley import (
+            InlineBrickNode,
+            get_inline_report,
+        )
+
+        @register(name="test_tree")
+        class TestTree(Brick):
+            label: str
+            children: list = []
+            inline = True
+
+        reload_templatetags()
+        clear_template_cache()
+
+        template = Template(
+            "{% load brickastley %}"
+            "{% test_tree label=tree.label children=tree.children %}"
+        )
+        assert template.nodelist.get_nodes_by_type(InlineBrickNode)
+        leaves = [{"label": "a", "children": []}, {"label": "b", "children": []}]
+        tree = {"label": "root", "children": leaves}
+        assert template.render(Context({"tree": tree})) == "root[a\nb\n]\n"
+        assert get_inline_report()["test_tree"] == {
+            "inlined": 1,
+            "fallbacks": {"recursive template": 1},
+        }
+
+    def test_inline_report_counts_tags(self, reload_templatetags):
+        """The report counts every inlined tag."""
+        from brickastley.templatetags.brickastley import get_inline_report
+
+        @register(name="inline_counted")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            inline = True
+
+        reload_templatetags()
+
+        Template(
+            '{% load brickastley %}{% inline_counted label="A" %}'
+            '{% inline_counted label="B" %}'
+        )
+        assert get_inline_report()["inline_counted"] == {
+            "inlined": 2,
+            "fallbacks": {},
+        }
+
+
+class TestContextInheritance:
+    """Tests for how bricks see the parent template context."""
+
+    def test_brick_sees_parent_context(self, reload_templatetags):
+        """Bricks can read variables from the parent context."""
+
+        @register(name="inherit_context")
+        class TestContext(Brick):
+            label: str
+
+        reload_templatetags()
+
+        template = Template('{% load brickastley %}{% inherit_context label="A" %}')
+        result = template.render(Context({"parent_var": "from parent"}))
+        assert result == "A|from parent"
+
+    @pytest.mark.parametrize("inline", [False, True])
+    def test_brick_escapes_inside_autoescape_off(self, reload_templatetags, inline):
+        """Brick templates escape by their engine, not the caller's block."""
+
+        @register(name=f"escaped_context_{int(inline)}")
+        class TestContext(Brick):
+            label: str
+
+        TestContext.inline = inline
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% autoescape off %}"
+            f"{{% escaped_context_{int(inline)} label=raw %}}{{{{ raw }}}}"
+            "{% endautoescape %}"
+        )
+        result = template.render(Context({"parent_var": "", "raw": "<b>"}))
+        assert result == "&lt;b&gt;|<b>"
+
+    def test_bricks_for_escapes_inside_autoescape_off(self, reload_templatetags):
+        """Batched bricks escape by their engine too."""
+
+        @register(name="escaped_batch")
+        class TestContext(Brick):
+            label: str
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% autoescape off %}"
+            "{% bricks_for x in items escaped_batch label=x %}"
+            "{% endautoescape %}"
+        )
+        result = template.render(Context({"items": ["<b>"], "parent_var": ""}))
+        assert result == "&lt;b&gt;|"
+
+    def test_brick_context_does_not_leak(self, reload_templatetags):
+        """Brick variables are popped from the parent context after rendering."""
+
+        @register(name="no_leak_context")
+        class TestContext(Brick):
+            label: str
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% no_leak_context label="A" %}[{{ label }}]'
+        )
+        result = template.render(Context({"parent_var": "x"}))
+        assert result == "A|x[]"
+
+    def test_brick_kwargs_shadow_parent_context(self, reload_templatetags):
+        """Brick kwargs take precedence over parent variables with the same name."""
+
+        @register(name="shadow_context")
+        class TestContext(Brick):
+            label: str
+            parent_var: str = "own"
+
+        reload_templatetags()
+
+        template = Template('{% load brickastley %}{% shadow_context label="A" %}')
+        result = template.render(Context({"parent_var": "from parent"}))
+        assert result == "A|own"
+
+    def test_isolated_brick_ignores_parent_context(self, reload_templatetags):
+        """Isolated bricks don't see the parent context."""
+
+        @register(name="isolated_context")
+        class TestContext(Brick):
+            label: str
+            isolated = True
+
+        reload_templatetags()
+
+        template = Template('{% load brickastley %}{% isolated_context label="A" %}')
+        result = template.render(Context({"parent_var": "from parent"}))
+        assert result == "A|"
+
+    def test_isolated_is_not_a_kwarg(self):
+        """The isolated class attribute is not treated as a brick kwarg."""
+
+        class TestContext(Brick):
+            label: str
+            isolated = True
+
+        assert "isolated" not in TestContext.__brick_kwargs__
+
+    def test_render_with_plain_dict_context(self):
+        """Brick.render still accepts a plain dict as parent context."""
+
+        class TestContext(Brick):
+            label: str
+
+        assert TestContext(label="A").render({"parent_var": "x"}) == "A|x"
+
+
+class TestBricksFor:
+    """Tests for the bricks_for tag."""
+
+    def test_bricks_for_matches_for_loop(self, reload_templatetags):
+        """bricks_for renders the same output as a for loop around the tag."""
+
+        @register(name="for_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+
+        reload_templatetags()
+
+        items = [{"name": "One", "kind": "primary"}, {"name": "<Two>", "kind": "x"}]
+        loop = Template(
+            "{% load brickastley %}{% for item in items %}"
+            "{% for_button label=item.name variant=item.kind %}{% endfor %}"
+        )
+        batch = Template(
+            "{% load brickastley %}"
+            "{% bricks_for item in items for_button label=item.name variant=item.kind %}"
+        )
+        context = {"items": items}
+        assert batch.render(Context(context)) == loop.render(Context(context))
+
+    def test_bricks_for_sees_loop_and_parent_context(self, reload_templatetags):
+        """The loop variable and parent context are visible in the brick."""
+
+        @register(name="for_context")
+        class TestContext(Brick):
+            label: str
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}"
+            "{% bricks_for parent_var in items for_context label='L' %}"
+            "[{{ parent_var }}|{{ label }}]"
+        )
+        result = template.render(Context({"items": ["a", "b"], "parent_var": "p"}))
+        assert result == "L|aL|b[p|]"
+
+    def test_bricks_for_empty_sequence(self, reload_templatetags):
+        """An empty or missing sequence renders nothing."""
+
+        @register(name="for_empty")
+        class TestButton(Brick):
+            label: str
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% bricks_for item in items for_empty label=item %}"
+        )
+        assert template.render(Context({"items": []})) == ""
+        assert template.render(Context({})) == ""
+
+    def test_bricks_for_unknown_brick(self):
+        """Using an unregistered brick name raises TemplateSyntaxError."""
+        with pytest.raises(TemplateSyntaxError, match="unknown brick"):
+            Template("{% load brickastley %}{% bricks_for item in items nope %}")
+
+    def test_bricks_for_bad_syntax(self):
+        """Malformed bricks_for tags raise TemplateSyntaxError."""
+        with pytest.raises(TemplateSyntaxError):
+            Template("{% load brickastley %}{% bricks_for item of items nope %}")
+
+
+class TestMemoize:
+    """Tests for memoized bricks."""
+
+    def test_identical_tags_render_once(self, reload_templatetags):
+        """Tags with the same kwargs reuse the first render."""
+        calls = []
+
+        @register(name="memo_button")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            memoize = True
+
+            def get_context_data(self, **kwargs):
+                calls.append(self.label)
+                return super().get_context_data(**kwargs)
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}"
+            "{% for i in items %}{% memo_button label=label %}{% endfor %}"
+            '{% memo_button label="Other" %}{% memo_button label="Other" %}'
+        )
+        result = template.render(Context({"items": [1, 2, 3], "label": "Go"}))
+
+        assert result.count('<button class="btn btn-primary">Go</button>') == 3
+        assert result.count(">Other<") == 2
+        assert calls == ["Go", "Other"]
+
+        template.render(Context({"items": [1], "label": "Go"}))
+        assert calls == ["Go", "Other", "Go", "Other"]
+
+    def test_block_bricks_keyed_by_children(self, reload_templatetags):
+        """Block tags reuse the output of tags with the same kwargs and children."""
+        calls = []
+
+        @register(name="memo_card")
+        class TestCard(BlockBrick):
+            title: str
+            template_name = "bricks/test_card.html"
+            memoize = True
+
+            def get_context_data(self, **kwargs):
+                calls.append(kwargs["children"])
+                return super().get_context_data(**kwargs)
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}"
+            "{% for body in bodies %}"
+            '{% memo_card title="Hi" %}{{ body }}{% endmemo_card %}'
+            "{% endfor %}"
+        )
+        result = template.render(Context({"bodies": ["A", "A", "B"]}))
+
+        assert result == (
+            '<div class="card"><h2>Hi</h2>A</div>' * 2
+            + '<div class="card"><h2>Hi</h2>B</div>'
+        )
+        assert calls == ["A", "B"]
+
+    def test_literal_tags_keyed_by_kwargs(self, reload_templatetags, settings):
+        """Memoized tags with different literal kwargs get their own output."""
+        settings.BRICKASTLEY_VALIDATION = "off"
+
+        @register(name="memo_literal")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            memoize = True
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% memo_literal label="A" %}|'
+            '{% memo_literal label="B" %}'
+        )
+        assert template.render(Context({})) == (
+            '<button class="btn btn-primary">A</button>|'
+            '<button class="btn btn-primary">B</button>'
+        )
+
+    def test_equal_values_of_other_types_not_shared(self, reload_templatetags):
+        """1, 1.0 and True are memoized separately since they render differently."""
+
+        @register(name="memo_typed")
+        class TestButton(Brick):
+            label: str
+            variant: str = "primary"
+            memoize = True
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% memo_typed label="A" data_x=1 %}|'
+            '{% memo_typed label="A" data_x=1.0 %}|'
+            '{% memo_typed label="A" data_x=True %}'
+        )
+        assert template.render(Context({})).split("|") == [
+            '<button class="btn btn-primary" data-x="1">A</button>',
+            '<button class="btn btn-primary" data-x="1.0">A</button>',
+            '<button class="btn btn-primary" data-x="data-x">A</button>',
+        ]
+
+    def test_memoized_brick_is_isolated(self, reload_templatetags):
+        """Memoized bricks don't see the parent context."""
+
+        @register(name="memo_context")
+        class TestContext(Brick):
+            label: str
+            memoize = True
+
+        reload_templatetags()
+
+        template = Template('{% load brickastley %}{% memo_context label="A" %}')
+        assert template.render(Context({"parent_var": "x"})) == "A|"
+
+    def test_unkeyable_kwargs_are_not_memoized(self, reload_templatetags):
+        """Kwargs that can't be part of a key render every time."""
+        calls = []
+
+        @register(name="memo_object")
+        class TestContext(Brick):
+            label: object
+            memoize = True
+
+            def get_context_data(self, **kwargs):
+                calls.append(self.label)
+                return super().get_context_data(**kwargs)
+
+        reload_templatetags()
+
+        template = Template(
+            "{% load brickastley %}{% memo_object label=obj %}{% memo_object label=obj %}"
+        )
+        template.render(Context({"obj": object()}))
+        assert len(calls) == 2
+
+    def test_memoize_is_not_a_kwarg(self):
+        """The memoize class attribute is not treated as a brick kwarg."""
+
+        class TestButton(Brick):
+            label: str
+            memoize = True
+
+        assert "memoize" not in TestButton.__brick_kwargs__
+
+
 class TestMultipleKwargs:
     """Tests for parsing multiple kwargs."""
 
@@ -234,6 +1176,99 @@ class TestMultipleKwargs:
         assert result["price"] == 9.99
 
 
+class TestTypedKwargs:
+    """Tests for coercing literal kwargs to the declared kwarg types."""
+
+    def test_literals_coerced(self, parser):
+        """String and number literals are converted to the kwarg types."""
+        import datetime
+        import enum
+        from decimal import Decimal
+
+        from brickastley.templatetags.brickastley import parse_tag_kwargs
+
+        class Size(enum.Enum):
+            SMALL = "sm"
+            LARGE = "lg"
+
+        class Priority(enum.IntEnum):
+            LOW = 1
+            HIGH = 2
+
+        class TestBrick(Brick):
+            count: int = 0
+            ratio: float = 0.0
+            price: Decimal = Decimal(0)
+            size: Size = Size.SMALL
+            priority: Priority = Priority.LOW
+            day: datetime.date | None = None
+            at: datetime.datetime | None = None
+
+        result = parse_tag_kwargs(
+            parser,
+            [
+                'count="3"',
+                "ratio=2",
+                "price=9.99",
+                'size="LARGE"',
+                "priority=2",
+                'day="2024-01-31"',
+                'at="2024-01-31T12:30"',
+            ],
+            TestBrick,
+        )
+        assert result == {
+            "count": 3,
+            "ratio": 2.0,
+            "price": Decimal("9.99"),
+            "size": Size.LARGE,
+            "priority": Priority.HIGH,
+            "day": datetime.date(2024, 1, 31),
+            "at": datetime.datetime(2024, 1, 31, 12, 30),
+        }
+        assert type(result["ratio"]) is float
+
+        # Enum members are found by value too
+        assert parse_tag_kwargs(parser, ['size="sm"'], TestBrick) == {
+            "size": Size.SMALL
+        }
+
+    def test_matching_and_dynamic_values_kept(self, parser):
+        """Matching literals, unconvertible literals and variables are kept."""
+        from django.template.base import FilterExpression
+
+        from brickastley.templatetags.brickastley import parse_tag_kwargs
+
+        class TestBrick(Brick):
+            value: str | int = ""
+            count: int = 0
+            total: int = 0
+
+        result = parse_tag_kwargs(
+            parser, ['value="3"', 'count="three"', "total=items|length"], TestBrick
+        )
+        assert result["value"].var == "3"
+        assert result["count"].var == "three"
+        assert isinstance(result["total"], FilterExpression)
+        assert result["total"].filters
+
+    def test_coerced_literals_render(self, reload_templatetags, settings):
+        """Coerced literals pass strict validation and render."""
+        settings.DEBUG = True
+
+        @register(name="typed_label")
+        class TestLabel(Brick):
+            name: str
+            value: int
+
+        reload_templatetags()
+
+        template = Template(
+            '{% load brickastley %}{% typed_label name="n" value="7" %}'
+        )
+        assert template.render(Context({})) == "n:7;\n"
+
+
 class TestAttrsFilter:
     """Tests for the attrs filter."""
 
@@ -297,3 +1332,37 @@ class TestAttrsFilter:
         result = template.render(context)
         assert 'id="test"' in result
         assert 'data-value="123"' in result
+
+    def test_attrs_sorted_like_flatatt(self):
+        """Output matches flatatt() on the converted attributes."""
+        from django.forms.utils import flatatt
+        from django.utils.safestring import mark_safe
+
+        from brickastley.templatetags.brickastley import attrs
+
+        value = {
+            "title": '<Tom & "Jerry\'s">',
+            "data_count": 3,
+            "data_ratio": 0.5,
+            "aria_label": mark_safe("<b>"),
+            "disabled": True,
+            "hidden": False,
+            "id": None,
+        }
+        expected = flatatt(
+            {
+                "title": '<Tom & "Jerry\'s">',
+                "data-count": 3,
+                "data-ratio": 0.5,
+                "aria-label": mark_safe("<b>"),
+                "disabled": "disabled",
+            }
+        )
+        assert attrs(value) == expected
+
+    def test_attrs_class_list(self):
+        """Lists of classes are joined, skipping empty and repeated entries."""
+        from brickastley.templatetags.brickastley import attrs
+
+        result = attrs({"class": ["btn", "", "btn-primary", "btn", None]})
+        assert result == ' class="btn btn-primary"'